@@ -1,7 +1,9 @@
 import fnmatch
 import sys
 import time
-from threading import Lock
+from contextlib import contextmanager
+from io import StringIO
+from threading import Lock, local
 
 from colorama import Fore, Style
 
@@ -56,6 +58,7 @@ class ConanOutput:
     _silent_warn_tags = []
     _warnings_as_errors = []
     lock = Lock()
+    _thread_buffer = local()  # The messages of the threads running buffered() tasks
 
     def __init__(self, scope=""):
         self.stream = sys.stderr
@@ -64,6 +67,35 @@ class ConanOutput:
         #         stream to capture it, so colorama is not there to strip the color bytes
         self._color = color_enabled(self.stream)
 
+    @property
+    def stream(self):
+        buffer = getattr(self._thread_buffer, "buffer", None)
+        return self._stream if buffer is None else buffer
+
+    @stream.setter
+    def stream(self, value):
+        self._stream = value
+
+    @classmethod
+    @contextmanager
+    def buffered(cls):
+        """ The messages written by the current thread inside this context are kept in the
+        returned StringIO, so the outputs of concurrent tasks can be written in a deterministic
+        order with write_buffered()
+        """
+        buffer = StringIO()
+        cls._thread_buffer.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            cls._thread_buffer.buffer = None
+
+    def write_buffered(self, data):
+        if data:
+            with self.lock:
+                self._stream.write(data)
+                self._stream.flush()
+
     @classmethod
     def define_silence_warnings(cls, warnings):
         cls._silent_warn_tags = warnings
@@ -11,6 +11,7 @@ from conan.internal.conan_app import ConanApp
 from conan.internal.integrity_check import IntegrityChecker
 from conans.client.cache.cache import ClientCache
 from conans.client.downloaders.download_cache import DownloadCache
+from conans.client.rest.response_cache import ResponseCache
 from conans.errors import ConanException
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
@@ -88,6 +89,9 @@ class CacheAPI:
         app = ConanApp(self.conan_api)
         if temp:
             rmdir(app.cache.temp_folder)
+            rmdir(app.cache.bytecode_folder)  # The compiled recipes, they are compiled again
+            # The stored responses of the remotes, they are requested again
+            ResponseCache(HomePaths(self.conan_api.cache_folder).remote_responses_path).clear()
             # Clean those build folders that didn't succeed to create a package and wont be in DB
             builds_folder = app.cache.builds_folder
             if os.path.isdir(builds_folder):
@@ -116,6 +120,8 @@ class CacheAPI:
                     app.cache.remove_build_id(pref)
                 if download:
                     rmdir(pref_layout.download_package())
+        # Packages could have been removed without collecting their unused files
+        self.conan_api.remove.remove_unused_files()
 
     def save(self, package_list, tgz_path):
         cache_folder = self.conan_api.cache_folder
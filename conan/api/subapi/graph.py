@@ -4,6 +4,7 @@ from conans.client.graph.graph import Node, RECIPE_CONSUMER, CONTEXT_HOST, RECIP
     CONTEXT_BUILD
 from conans.client.graph.graph_binaries import GraphBinariesAnalyzer
 from conans.client.graph.graph_builder import DepsGraphBuilder
+from conans.client.graph.graph_cache import GraphCache
 from conans.client.graph.profile_node_definer import initialize_conanfile_profile, consumer_definer
 from conans.errors import ConanException
 from conans.model.recipe_ref import RecipeReference
@@ -175,9 +176,25 @@ class GraphAPI:
         assert profile_build is not None
 
         remotes = remotes or []
+        global_conf = self.conan_api.config.global_conf
+        graph_cache = graph_key = resolved_ranges = None
+        graph_lock = lockfile
+        if global_conf.get("core.graph:cache", check_type=bool) and not update \
+                and not check_update:
+            graph_cache = GraphCache(app.cache, self.conan_api.local.editable_packages)
+            graph_key, cached_lock, resolved_ranges = graph_cache.load(root_node, profile_host,
+                                                                       profile_build, lockfile,
+                                                                       remotes, global_conf)
+            if cached_lock is not None:
+                ConanOutput().info("Using the cached resolution of the dependency graph")
+                graph_lock = cached_lock
         builder = DepsGraphBuilder(app.proxy, app.loader, app.range_resolver, app.cache, remotes,
-                                   update, check_update, self.conan_api.config.global_conf)
-        deps_graph = builder.load_graph(root_node, profile_host, profile_build, lockfile)
+                                   update, check_update, global_conf)
+        deps_graph = builder.load_graph(root_node, profile_host, profile_build, graph_lock)
+        if resolved_ranges is not None:
+            deps_graph.resolved_ranges = resolved_ranges
+        elif graph_cache is not None:
+            graph_cache.store(graph_key, deps_graph)
         return deps_graph
 
     def analyze_binaries(self, graph, build_mode=None, remotes=None, update=None, lockfile=None,
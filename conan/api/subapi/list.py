@@ -175,9 +175,17 @@ class ListAPI:
                     prefs.append(PkgReference(rrev, package_id=pattern.package_id))
                     packages = {}
                 else:
-                    packages = self.packages_configurations(rrev, remote)
-                    if package_query is not None:
-                        packages = self.filter_packages_configurations(packages, package_query)
+                    if package_query is not None and not remote:
+                        # The cache database evaluates the query, without loading all the
+                        # packages configurations
+                        cache_prefs = app.cache.get_package_references(rrev)
+                        packages = get_cache_packages_binary_info(app.cache, cache_prefs,
+                                                                  package_query)
+                    else:
+                        packages = self.packages_configurations(rrev, remote)
+                        if package_query is not None:
+                            packages = self.filter_packages_configurations(packages,
+                                                                           package_query)
                     if profile is not None:
                         packages = self.filter_packages_profile(packages, profile, rrev)
                     prefs = packages.keys()
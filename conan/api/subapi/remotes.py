@@ -7,6 +7,7 @@ from conan.api.model import Remote, LOCAL_RECIPES_INDEX
 from conan.api.output import ConanOutput
 from conan.internal.cache.home_paths import HomePaths
 from conan.internal.conan_app import ConanApp
+from conans.client.rest.response_cache import ResponseCache
 from conans.client.rest_client_local_recipe_index import add_local_recipes_index_remote, \
     remove_local_recipes_index_remote
 from conans.errors import ConanException
@@ -145,6 +146,8 @@ class RemotesAPI:
         for remote in removed:
             remove_local_recipes_index_remote(self.conan_api, remote)
             app.cache.localdb.clean(remote_url=remote.url)
+            ResponseCache(HomePaths(self.conan_api.cache_folder).remote_responses_path).clear(
+                remote.url)
         return removed
 
     def update(self, remote_name: str, url=None, secure=None, disabled=None, index=None,
@@ -49,3 +49,9 @@ class RemoveAPI:
         else:
             package_layout = app.cache.pkg_layout(pref)
             app.cache.remove_package_layout(package_layout)
+
+    def remove_unused_files(self):
+        """Removes the files of the cache store (core.cache:deduplicate) that are no longer used by
+        any package, it should be called after removing packages from the cache"""
+        app = ConanApp(self.conan_api)
+        app.cache.file_store.collect_garbage()
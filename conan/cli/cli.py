@@ -1,4 +1,5 @@
 import importlib
+import json
 import os
 import pkgutil
 import re
@@ -15,14 +16,34 @@ from conan.api.output import ConanOutput, Color, cli_out_write, LEVEL_TRACE
 from conan.cli.command import ConanSubCommand
 from conan.cli.exit_codes import SUCCESS, ERROR_MIGRATION, ERROR_GENERAL, USER_CTRL_C, \
     ERROR_SIGTERM, USER_CTRL_BREAK, ERROR_INVALID_CONFIGURATION, ERROR_UNEXPECTED
+from conan.internal.cache.db.table import close_db_connections
 from conan.internal.cache.home_paths import HomePaths
 from conans import __version__ as client_version
 from conan.errors import ConanException, ConanInvalidConfiguration, ConanMigrationError
-from conans.util.files import exception_message_safe
+from conans.util.files import exception_message_safe, load, save
 
 _CONAN_INTERNAL_CUSTOM_COMMANDS_PATH = "_CONAN_INTERNAL_CUSTOM_COMMANDS_PATH"
 
 
+class _LazyCommand:
+    """ A builtin command whose module is imported the first time it is used, not to display the
+    commands help
+    """
+
+    def __init__(self, import_path, method_name, name, group, doc):
+        self._import_path = import_path
+        self._method_name = method_name
+        self._command = None
+        self.name = name
+        self.group = group
+        self.doc = doc
+
+    def __getattr__(self, item):  # run(), run_cli() and the rest, from the real command
+        if self._command is None:
+            self._command = Cli._load_command(self._import_path, self._method_name)
+        return getattr(self._command, item)
+
+
 class Cli:
     """A single command of the conan application, with all the first level commands. Manages the
     parsing of parameters and delegates functionality to the conan python api. It can also show the
@@ -40,10 +61,11 @@ class Cli:
 
     def _add_commands(self):
         if Cli._builtin_commands is None:
-            conan_cmd_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "commands")
-            for module in pkgutil.iter_modules([conan_cmd_path]):
-                module_name = module[1]
-                self._add_command("conan.cli.commands.{}".format(module_name), module_name)
+            for module_name, name, group, doc in self._builtin_commands_registry():
+                import_path = "conan.cli.commands.{}".format(module_name)
+                self._commands[name] = _LazyCommand(import_path, module_name, name, group, doc)
+                if name not in self._groups[group]:
+                    self._groups[group].append(name)
             Cli._builtin_commands = self._commands.copy()
         else:
             self._commands = Cli._builtin_commands.copy()
@@ -88,16 +110,56 @@ class Cli:
                             ConanOutput().error(f"Error loading custom command {module_path}: {e}",
                                                 error_type="exception")
 
+    def _builtin_commands_registry(self):
+        """ The name, group and documentation of the builtin commands, without importing their
+        modules (and all their dependencies) for every run. It is computed importing them the
+        first time, and stored in the home until the Conan version or the command files change
+        """
+        conan_cmd_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "commands")
+        modules = [module[1] for module in pkgutil.iter_modules([conan_cmd_path])]
+        signature = [client_version]
+        for module_name in modules:
+            module_path = os.path.join(conan_cmd_path, module_name + ".py")
+            if not os.path.isfile(module_path):
+                module_path = os.path.join(conan_cmd_path, module_name)
+            st = os.stat(module_path)
+            signature.append([module_name, st.st_mtime_ns, st.st_size])
+
+        registry_path = HomePaths(self._conan_api.cache_folder).commands_registry_path
+        try:
+            registry = json.loads(load(registry_path))
+            if registry["signature"] == signature:
+                return registry["commands"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        commands = []
+        for module_name in modules:
+            command_wrapper = self._load_command("conan.cli.commands.{}".format(module_name),
+                                                 module_name)
+            if command_wrapper.doc:
+                commands.append([module_name, command_wrapper.name, command_wrapper.group,
+                                 command_wrapper.doc])
+        try:
+            save(registry_path, json.dumps({"signature": signature, "commands": commands}))
+        except OSError:  # The home could be read-only, it will be computed again
+            pass
+        return commands
+
     def _add_command(self, import_path, method_name, package=None):
+        command_wrapper = self._load_command(import_path, method_name)
+        if command_wrapper.doc:
+            name = f"{package}:{command_wrapper.name}" if package else command_wrapper.name
+            self._commands[name] = command_wrapper
+            # Avoiding duplicated command help messages
+            if name not in self._groups[command_wrapper.group]:
+                self._groups[command_wrapper.group].append(name)
+
+    @staticmethod
+    def _load_command(import_path, method_name):
         try:
             imported_module = importlib.import_module(import_path)
             command_wrapper = getattr(imported_module, method_name)
-            if command_wrapper.doc:
-                name = f"{package}:{command_wrapper.name}" if package else command_wrapper.name
-                self._commands[name] = command_wrapper
-                # Avoiding duplicated command help messages
-                if name not in self._groups[command_wrapper.group]:
-                    self._groups[command_wrapper.group].append(name)
             for name, value in getmembers(imported_module):
                 if isinstance(value, ConanSubCommand):
                     if name.startswith("{}_".format(method_name)):
@@ -106,6 +168,7 @@ class Cli:
                         raise ConanException("The name for the subcommand method should "
                                              "begin with the main command name + '_'. "
                                              "i.e. {}_<subcommand_name>".format(method_name))
+            return command_wrapper
         except AttributeError:
             raise ConanException("There is no {} method defined in {}".format(method_name,
                                                                               import_path))
@@ -197,6 +260,9 @@ class Cli:
                 print(traceback.format_exc(), file=sys.stderr)
             self._conan2_migrate_recipe_msg(e)
             raise
+        finally:
+            # Write the deferred cache database updates, like the LRUs, at the end of the command
+            close_db_connections()
 
     @staticmethod
     def _conan2_migrate_recipe_msg(exception):
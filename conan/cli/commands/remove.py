@@ -123,6 +123,9 @@ def remove(conan_api: ConanAPI, parser, *args):
                 if not pref_dict:
                     packages.pop(pref.package_id)
 
+    if not remote and not args.dry_run:
+        conan_api.remove.remove_unused_files()
+
     return {
         "results": multi_package_list.serialize(),
         "conan_api": conan_api
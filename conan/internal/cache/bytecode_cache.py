@@ -0,0 +1,47 @@
+import hashlib
+import marshal
+import os
+import uuid
+from importlib.util import MAGIC_NUMBER
+
+
+class BytecodeCache:
+    """ Compiled code of the conanfile.py files of the recipes in the cache, so other Conan
+    processes don't need to compile them again. The exported recipes never change, their folders
+    depend on the recipe revision, but the entries are also keyed by the hash of the file
+    contents and the Python bytecode version, so a stale entry is never used.
+    """
+
+    def __init__(self, folder, store_folder):
+        self._folder = folder
+        self._store_folder = os.path.join(store_folder, "")  # Only files in the cache are stored
+
+    def _path(self, file_path, source_hash):
+        if not file_path.startswith(self._store_folder):
+            return None
+        h = hashlib.sha256(MAGIC_NUMBER + f"{file_path}:{source_hash}".encode()).hexdigest()
+        return os.path.join(self._folder, h[:2], h[2:])
+
+    def get(self, file_path, source_hash):
+        path = self._path(file_path, source_hash)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def store(self, file_path, source_hash, code):
+        path = self._path(file_path, source_hash)
+        if path is None:
+            return
+        tmp = f"{path}.{uuid.uuid4().hex}"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(tmp, path)  # Other processes never read a partial file
+        except OSError:  # Nothing is lost, it will be compiled again
+            if os.path.exists(tmp):
+                os.remove(tmp)
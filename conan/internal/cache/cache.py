@@ -146,8 +146,11 @@ class DataCache:
         assert ref.timestamp
         self._db.update_recipe_timestamp(ref)
 
-    def list_references(self):
-        return self._db.list_references()
+    def get_recipes_state(self):
+        return self._db.get_recipes_state()
+
+    def list_references(self, prefix=None, ignorecase=True):
+        return self._db.list_references(prefix, ignorecase)
 
     def exists_prev(self, pref):
         return self._db.exists_prev(pref)
@@ -176,6 +179,15 @@ class DataCache:
     def remove_build_id(self, pref):
         self._db.remove_build_id(pref)
 
+    def set_package_info(self, pref: PkgReference, info):
+        self._db.set_package_info(pref, info)
+
+    def get_packages_info(self, ref: RecipeReference, query=None):
+        return self._db.get_packages_info(ref, query)
+
+    def get_packages_info_stored(self, ref: RecipeReference):
+        return self._db.get_packages_info_stored(ref)
+
     def assign_prev(self, layout: PackageLayout):
         pref = layout.reference
 
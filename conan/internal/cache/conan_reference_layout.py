@@ -14,6 +14,7 @@ EXPORT_FOLDER = "e"
 EXPORT_SRC_FOLDER = "es"
 DOWNLOAD_EXPORT_FOLDER = "d"
 METADATA = "metadata"
+MANIFEST_STAT_CACHE = "manifest_stat_cache.json"
 
 
 class LayoutBase:
@@ -74,7 +75,9 @@ class RecipeLayout(LayoutBase):
         export_folder = self.export()
         readed_manifest = FileTreeManifest.load(export_folder)
         exports_source_folder = self.export_sources()
-        expected_manifest = FileTreeManifest.create(export_folder, exports_source_folder)
+        stat_cache = os.path.join(self._base_folder, MANIFEST_STAT_CACHE)
+        expected_manifest = FileTreeManifest.create(export_folder, exports_source_folder,
+                                                    stat_cache=stat_cache)
         return readed_manifest, expected_manifest
 
     def sources_remove(self):
@@ -116,7 +119,8 @@ class PackageLayout(LayoutBase):
     def package_manifests(self):
         package_folder = self.package()
         readed_manifest = FileTreeManifest.load(package_folder)
-        expected_manifest = FileTreeManifest.create(package_folder)
+        stat_cache = os.path.join(self._base_folder, MANIFEST_STAT_CACHE)
+        expected_manifest = FileTreeManifest.create(package_folder, stat_cache=stat_cache)
         return readed_manifest, expected_manifest
 
     @contextmanager
@@ -2,6 +2,7 @@ import os
 import sqlite3
 
 from conan.api.output import ConanOutput
+from conan.internal.cache.db.packages_info_table import PackagesInfoDBTable
 from conan.internal.cache.db.packages_table import PackagesDBTable
 from conan.internal.cache.db.recipes_table import RecipesDBTable
 from conans.model.package_ref import PkgReference
@@ -17,9 +18,11 @@ class CacheDatabase:
             ConanOutput().error(f"Your sqlite3 '{version} < 3.7.11' version is not supported")
         self._recipes = RecipesDBTable(filename)
         self._packages = PackagesDBTable(filename)
+        self._packages_info = PackagesInfoDBTable(filename)
         if not os.path.isfile(filename):
             self._recipes.create_table()
             self._packages.create_table()
+            self._packages_info.create_table()
 
     def exists_prev(self, ref):
         # TODO: This logic could be done directly against DB
@@ -37,9 +40,11 @@ class CacheDatabase:
         self._packages.update_timestamp(pref, path=path, build_id=build_id)
 
     def get_recipe_lru(self, ref):
+        self._recipes.flush()  # The LRU updates are deferred
         return self._recipes.get_recipe(ref)["lru"]
 
     def get_package_lru(self, pref: PkgReference):
+        self._packages.flush()
         return self._packages.get(pref)["lru"]
 
     def update_recipe_lru(self, ref):
@@ -52,10 +57,12 @@ class CacheDatabase:
         # Removing the recipe must remove all the package binaries too from DB
         self._recipes.remove(ref)
         self._packages.remove_recipe(ref)
+        self._packages_info.remove_recipe(ref)
 
     def remove_package(self, ref: PkgReference):
         # Removing the recipe must remove all the package binaries too from DB
         self._packages.remove(ref)
+        self._packages_info.remove(ref)
 
     def remove_build_id(self, pref):
         self._packages.remove_build_id(pref)
@@ -90,9 +97,21 @@ class CacheDatabase:
     def create_package(self, path, ref: PkgReference, build_id):
         self._packages.create(path, ref, build_id=build_id)
 
-    def list_references(self):
+    def set_package_info(self, pref: PkgReference, info):
+        self._packages_info.save(pref, info)
+
+    def get_packages_info(self, ref: RecipeReference, query=None):
+        return self._packages_info.get_infos(ref, query)
+
+    def get_packages_info_stored(self, ref: RecipeReference):
+        return self._packages_info.get_stored(ref)
+
+    def get_recipes_state(self):
+        return self._recipes.state()
+
+    def list_references(self, prefix=None, ignorecase=True):
         return [d["ref"]
-                for d in self._recipes.all_references()]
+                for d in self._recipes.all_references(prefix, ignorecase)]
 
     def get_package_revisions_references(self, pref: PkgReference, only_latest_prev=False):
         return [d["pref"]
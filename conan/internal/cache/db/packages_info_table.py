@@ -0,0 +1,141 @@
+import json
+
+from conan.internal.cache.db.table import BaseDbTable
+from conans.model.package_ref import PkgReference
+from conans.model.recipe_ref import RecipeReference
+
+
+class PackagesFieldsDBTable(BaseDbTable):
+    """ The settings and options of every package binary, one row per setting or option, so
+    package queries like "os=Linux AND options.shared=True" can be evaluated in SQL. The settings
+    are stored with their name, "compiler.version", and the options with the "options." prefix
+    """
+    table_name = 'packages_fields'
+    columns_description = [('reference', str),
+                           ('rrev', str),
+                           ('pkgid', str),
+                           ('prev', str),
+                           ('name', str),
+                           ('value', str)]
+    indexes = (('packages_fields_name', 'reference, rrev, name, value'),)
+
+
+class PackagesInfoDBTable(BaseDbTable):
+    """ The binary information (the loaded conaninfo.txt) of every package binary, so listing the
+    packages of a recipe doesn't need to read the conaninfo.txt files. It is not a column of the
+    packages table because previous Conan versions insert all the columns of that table.
+    Packages created or removed by those versions will not be in this table, or will be
+    orphan rows, it is always accessed for the package references of the packages table and
+    missing rows are added lazily
+    """
+    table_name = 'packages_info'
+    columns_description = [('reference', str),
+                           ('rrev', str),
+                           ('pkgid', str),
+                           ('prev', str),
+                           ('info', str)]
+    unique_together = ('reference', 'rrev', 'pkgid', 'prev')
+
+    def __init__(self, filename):
+        super().__init__(filename)
+        self._fields = PackagesFieldsDBTable(filename)
+
+    def create_table(self):
+        super().create_table()
+        self._fields.create_table()
+
+    @staticmethod
+    def _fields_rows(pref: PkgReference, info):
+        key = [str(pref.ref), pref.ref.revision, pref.package_id, pref.revision]
+        rows = []
+        for section, prefix in (("settings", ""), ("options", "options.")):
+            values = info.get(section)
+            if isinstance(values, dict):
+                rows.extend(key + [prefix + k, v] for k, v in values.items())
+        return rows
+
+    def save(self, pref: PkgReference, info):
+        assert pref.revision
+        key_clause = f'{self.columns.reference} = ? AND {self.columns.rrev} = ? ' \
+                     f'AND {self.columns.pkgid} = ? AND {self.columns.prev} = ?'
+        key = [str(pref.ref), pref.ref.revision, pref.package_id, pref.revision]
+        fields = self._fields.table_name
+        with self.db_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                conn.execute(f"DELETE FROM {self.table_name} WHERE {key_clause};", key)
+                conn.execute(f"DELETE FROM {fields} WHERE {key_clause};", key)
+                conn.execute(f"INSERT INTO {self.table_name} VALUES (?, ?, ?, ?, ?)",
+                             key + [json.dumps(info)])
+                conn.executemany(f"INSERT INTO {fields} VALUES (?, ?, ?, ?, ?, ?)",
+                                 self._fields_rows(pref, info))
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _query_clause(self, query):
+        """ translates the postfix query, with the (name, value) expressions, to a SQL condition
+        over the packages_info rows
+        """
+        fields = self._fields.table_name
+        exists = f'EXISTS (SELECT 1 FROM {fields} f ' \
+                 f'WHERE f.reference = i.reference AND f.rrev = i.rrev ' \
+                 f'AND f.pkgid = i.pkgid AND f.prev = i.prev AND f.name = ?{{}})'
+        stack = []
+        for el in query:
+            if el in ("&", "|"):
+                right, right_params = stack.pop()
+                left, left_params = stack.pop()
+                operator = "AND" if el == "&" else "OR"
+                stack.append((f"({left} {operator} {right})", left_params + right_params))
+                continue
+            name, value = el
+            expr = exists.format(" AND f.value = ?")
+            if value == "None":  # Also matches the packages without that setting or option
+                stack.append((f"({expr} OR NOT {exists.format('')})", [name, value, name]))
+            else:
+                stack.append((expr, [name, value]))
+        if len(stack) != 1:
+            raise Exception("Bad stack: %s" % str(stack))
+        return stack[0]
+
+    def get_infos(self, ref: RecipeReference, query=None):
+        """ Returns the binary info of the stored packages of the recipe revision as
+        {(package_id, prev): info}, only the ones matching the postfix query if defined
+        """
+        assert ref.revision
+        query_clause, params = self._query_clause(query) if query else ("1", [])
+        sql = f'SELECT i.{self.columns.pkgid}, i.{self.columns.prev}, i.{self.columns.info} ' \
+              f'FROM {self.table_name} i ' \
+              f'WHERE i.{self.columns.reference} = ? AND i.{self.columns.rrev} = ? ' \
+              f'AND {query_clause}'
+        with self.db_connection() as conn:
+            r = conn.execute(sql, [str(ref), ref.revision] + params)
+            return {(pkgid, prev): json.loads(info) for pkgid, prev, info in r.fetchall()}
+
+    def get_stored(self, ref: RecipeReference):
+        """ The (package_id, prev) of the packages of the recipe revision stored in this table """
+        sql = f'SELECT {self.columns.pkgid}, {self.columns.prev} FROM {self.table_name} ' \
+              f'WHERE {self.columns.reference} = ? AND {self.columns.rrev} = ?'
+        with self.db_connection() as conn:
+            r = conn.execute(sql, [str(ref), ref.revision])
+            return set(r.fetchall())
+
+    def remove(self, pref: PkgReference):
+        key_clause = f'{self.columns.reference} = ? AND {self.columns.rrev} = ? ' \
+                     f'AND {self.columns.pkgid} = ?'
+        params = [str(pref.ref), pref.ref.revision, pref.package_id]
+        if pref.revision:
+            key_clause += f' AND {self.columns.prev} = ?'
+            params.append(pref.revision)
+        with self.db_connection() as conn:
+            conn.execute(f"DELETE FROM {self.table_name} WHERE {key_clause};", params)
+            conn.execute(f"DELETE FROM {self._fields.table_name} WHERE {key_clause};", params)
+
+    def remove_recipe(self, ref: RecipeReference):
+        key_clause = f'{self.columns.reference} = ? AND {self.columns.rrev} = ?'
+        params = [str(ref), ref.revision]
+        with self.db_connection() as conn:
+            conn.execute(f"DELETE FROM {self.table_name} WHERE {key_clause};", params)
+            conn.execute(f"DELETE FROM {self._fields.table_name} WHERE {key_clause};", params)
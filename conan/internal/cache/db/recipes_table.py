@@ -14,6 +14,8 @@ class RecipesDBTable(BaseDbTable):
                            ('timestamp', float),
                            ('lru', int)]
     unique_together = ('reference', 'rrev')
+    # For the case insensitive searches of references by prefix with LIKE
+    indexes = (('recipes_reference_nocase', 'reference COLLATE NOCASE'),)
 
     @staticmethod
     def _as_dict(row):
@@ -33,8 +35,8 @@ class RecipesDBTable(BaseDbTable):
             self.columns.rrev: ref.revision,
         }
         where_expr = ' AND '.join(
-            [f'{k}="{v}" ' if v is not None else f'{k} IS NULL' for k, v in where_dict.items()])
-        return where_expr
+            [f'{k}=?' if v is not None else f'{k} IS NULL' for k, v in where_dict.items()])
+        return where_expr, [v for v in where_dict.values() if v is not None]
 
     def create(self, path, ref: RecipeReference):
         assert ref is not None
@@ -54,51 +56,75 @@ class RecipesDBTable(BaseDbTable):
         assert ref.revision is not None
         assert ref.timestamp is not None
         query = f"UPDATE {self.table_name} " \
-                f'SET {self.columns.timestamp} = "{ref.timestamp}" ' \
-                f'WHERE {self.columns.reference}="{str(ref)}" ' \
-                f'AND {self.columns.rrev} = "{ref.revision}" '
+                f'SET {self.columns.timestamp} = ? ' \
+                f'WHERE {self.columns.reference}=? ' \
+                f'AND {self.columns.rrev} = ? '
         with self.db_connection() as conn:
-            conn.execute(query)
+            conn.execute(query, [ref.timestamp, str(ref), ref.revision])
 
     def update_lru(self, ref):
+        """ The LRU is not needed immediately, it is written later together with the other
+        LRU updates
+        """
         assert ref.revision is not None
         assert ref.timestamp is not None
-        where_clause = self._where_clause(ref)
+        where_clause, params = self._where_clause(ref)
         lru = timestamp_now()
         query = f"UPDATE {self.table_name} " \
-                f'SET {self.columns.lru} = "{lru}" ' \
+                f'SET {self.columns.lru} = ? ' \
                 f"WHERE {where_clause};"
-        with self.db_connection() as conn:
-            conn.execute(query)
+        self.deferred_execute(query, tuple(params), [lru] + params)
 
     def remove(self, ref: RecipeReference):
-        where_clause = self._where_clause(ref)
+        where_clause, params = self._where_clause(ref)
         query = f"DELETE FROM {self.table_name} " \
                 f"WHERE {where_clause};"
         with self.db_connection() as conn:
-            conn.execute(query)
+            conn.execute(query, params)
+
+    def state(self):
+        """ A summary that changes with every added, removed or updated recipe revision """
+        query = f'SELECT COUNT(*), MAX(rowid), TOTAL({self.columns.timestamp}) ' \
+                f'FROM {self.table_name}'
+        with self.db_connection() as conn:
+            r = conn.execute(query)
+            return list(r.fetchone())
 
     # returns all different conan references (name/version@user/channel)
-    def all_references(self):
+    def all_references(self, prefix=None, ignorecase=True):
+        """ if prefix is defined, only the references (name/version@user/channel) starting with
+        it, but as LIKE is used for ignorecase, "_" and "%" in the prefix are wildcards
+        """
+        where_clause = ''
+        params = []
+        if prefix:
+            # Both LIKE and GLOB with a constant prefix are resolved with the indexes
+            if ignorecase:
+                where_clause = f'WHERE {self.columns.reference} LIKE ? '
+                params.append(prefix + "%")
+            else:
+                where_clause = f'WHERE {self.columns.reference} GLOB ? '
+                params.append(prefix + "*")
         query = f'SELECT DISTINCT {self.columns.reference}, ' \
                     f'{self.columns.rrev}, ' \
                     f'{self.columns.path} ,' \
                     f'{self.columns.timestamp}, ' \
                     f'{self.columns.lru} ' \
                     f'FROM {self.table_name} ' \
+                    f'{where_clause}' \
                     f'ORDER BY {self.columns.timestamp} DESC'
 
         with self.db_connection() as conn:
-            r = conn.execute(query)
+            r = conn.execute(query, params)
             result = [self._as_dict(self.row_type(*row)) for row in r.fetchall()]
         return result
 
     def get_recipe(self, ref: RecipeReference):
         query = f'SELECT * FROM {self.table_name} ' \
-                f'WHERE {self.columns.reference}="{str(ref)}" ' \
-                f'AND {self.columns.rrev} = "{ref.revision}" '
+                f'WHERE {self.columns.reference}=? ' \
+                f'AND {self.columns.rrev} = ? '
         with self.db_connection() as conn:
-            r = conn.execute(query)
+            r = conn.execute(query, [str(ref), ref.revision])
             row = r.fetchone()
             if not row:
                 raise ConanReferenceDoesNotExistInDB(f"Recipe '{ref.repr_notime()}' not found")
@@ -112,11 +138,11 @@ class RecipesDBTable(BaseDbTable):
                 f'MAX({self.columns.timestamp}), ' \
                 f'{self.columns.lru} ' \
                 f'FROM {self.table_name} ' \
-                f'WHERE {self.columns.reference} = "{str(ref)}" ' \
+                f'WHERE {self.columns.reference} = ? ' \
                 f'GROUP BY {self.columns.reference} '  # OTHERWISE IT FAILS THE MAX()
 
         with self.db_connection() as conn:
-            r = conn.execute(query)
+            r = conn.execute(query, [str(ref)])
             row = r.fetchone()
             if row is None:
                 raise ConanReferenceDoesNotExistInDB(f"Recipe '{ref}' not found")
@@ -126,10 +152,10 @@ class RecipesDBTable(BaseDbTable):
     def get_recipe_revisions_references(self, ref: RecipeReference):
         assert ref.revision is None
         query = f'SELECT * FROM {self.table_name} ' \
-                f'WHERE {self.columns.reference} = "{str(ref)}" ' \
+                f'WHERE {self.columns.reference} = ? ' \
                 f'ORDER BY {self.columns.timestamp} DESC'
 
         with self.db_connection() as conn:
-            r = conn.execute(query)
+            r = conn.execute(query, [str(ref)])
             ret = [self._as_dict(self.row_type(*row))["ref"] for row in r.fetchall()]
         return ret
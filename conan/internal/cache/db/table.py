@@ -1,35 +1,137 @@
+import atexit
+import os
 import sqlite3
 import threading
-from collections import defaultdict, namedtuple
+from collections import namedtuple
 from contextlib import contextmanager
 from typing import Tuple, List, Optional
 
 
+class _ConnectionPool:
+    """ Persistent connections to the cache databases, one per thread and database file, so every
+    query doesn't pay the connection setup and sqlite3 can reuse its cached prepared statements.
+    Some writes that are not needed immediately, like the LRU updates, are deferred and executed
+    together in a single transaction by flush()
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []  # All of them, of all threads, to be able to close them
+        self._generation = 0  # Incremented by close(), the threads discard their old connections
+        self._deferred = {}  # {filename: {(query, key): params}}
+
+    @staticmethod
+    def _file_id(filename):
+        try:
+            st = os.stat(filename)
+            return st.st_dev, st.st_ino
+        except OSError:
+            return None
+
+    def get(self, filename):
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.generation = self._generation
+            local.connections = {}
+        file_id = self._file_id(filename)
+        connection, connection_file_id = local.connections.get(filename, (None, None))
+        # If the database file was removed or replaced, the connection is no longer valid
+        if connection is None or file_id is None or file_id != connection_file_id:
+            if connection is not None:
+                self._close(connection)
+            connection = sqlite3.connect(filename, isolation_level=None, timeout=10,
+                                         check_same_thread=False)
+            # WAL allows concurrent readers to a writer, also from other processes. Filesystems
+            # without shared memory support (network ones) keep the previous journal mode
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with self._lock:
+                self._connections.append(connection)
+            local.connections[filename] = connection, self._file_id(filename)
+        return connection
+
+    def _close(self, connection):
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        connection.close()
+
+    def defer(self, filename, query, key, params):
+        """ The last params for the same query and key are the ones executed """
+        with self._lock:
+            self._deferred.setdefault(filename, {})[(query, key)] = params
+
+    def flush(self, filename=None):
+        with self._lock:
+            if filename is None:
+                deferred, self._deferred = self._deferred, {}
+            else:
+                deferred = {filename: self._deferred.pop(filename, {})}
+        for db_filename, writes in deferred.items():
+            if not writes or not os.path.isfile(db_filename):
+                continue  # The cache could have been removed meanwhile
+            queries = {}
+            for (query, _), params in writes.items():
+                queries.setdefault(query, []).append(params)
+            connection = self.get(db_filename)
+            connection.execute("BEGIN")
+            try:
+                for query, params in queries.items():
+                    connection.executemany(query, params)
+            except sqlite3.Error:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def close(self):
+        """ Executes the deferred writes and closes all the connections, it has to be called when
+        the connections are not being used by other threads, like at the end of every command
+        """
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                connections, self._connections = self._connections, []
+                self._generation += 1
+            for connection in connections:
+                connection.close()
+
+
+_connection_pool = _ConnectionPool()
+atexit.register(_connection_pool.close)
+
+
+def close_db_connections():
+    _connection_pool.close()
+
+
 class BaseDbTable:
     table_name: str = None
     columns_description: List[Tuple[str, type]] = None
     row_type: namedtuple = None
     columns: namedtuple = None
     unique_together: tuple = None
-    _lock: threading.Lock = None
-    _lock_storage = defaultdict(threading.Lock)
+    indexes: tuple = None  # ((index name, indexed expression), ...)
 
     def __init__(self, filename):
         self.filename = filename
         column_names: List[str] = [it[0] for it in self.columns_description]
         self.row_type = namedtuple('_', column_names)
         self.columns = self.row_type(*column_names)
-        self._lock = self._lock_storage[self.filename]
 
     @contextmanager
     def db_connection(self):
-        assert self._lock.acquire(timeout=10), "Conan failed to acquire database lock"
-        connection = sqlite3.connect(self.filename, isolation_level=None, timeout=10)
-        try:
-            yield connection
-        finally:
-            connection.close()
-            self._lock.release()
+        yield _connection_pool.get(self.filename)
+
+    def deferred_execute(self, query, key, params):
+        """ Execute the query later, in the same transaction as other deferred writes. A later
+        deferred_execute() of the same query and key replaces this one
+        """
+        _connection_pool.defer(self.filename, query, key, params)
+
+    def flush(self):
+        _connection_pool.flush(self.filename)
 
     def create_table(self):
         def field(name, typename, nullable=False, check_constraints: Optional[List] = None,
@@ -61,6 +163,13 @@ class BaseDbTable:
         table_checks = f", UNIQUE({', '.join(self.unique_together)})" if self.unique_together else ''
         with self.db_connection() as conn:
             conn.execute(f"CREATE TABLE {guard} {self.table_name} ({fields} {table_checks});")
+        self.create_indexes()
+
+    def create_indexes(self):
+        with self.db_connection() as conn:
+            for name, expression in self.indexes or ():
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} "
+                             f"ON {self.table_name} ({expression});")
 
     def dump(self):
         print(f"********* BEGINTABLE {self.table_name}*************")
@@ -0,0 +1,67 @@
+import hashlib
+import os
+import stat
+import uuid
+
+from conan.api.output import ConanOutput
+
+
+class FileStore:
+    """ Content-addressable store of the files of the packages in the cache. Every file is stored
+    once, keyed by its sha256 and permissions, and the package folders contain hardlinks to it.
+    The number of hardlinks of each stored file is its reference count: when it is only linked
+    by the store, no package uses it anymore and it can be removed.
+    """
+
+    def __init__(self, folder):
+        self._folder = folder
+
+    def _path(self, file_path, mode):
+        md = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                md.update(chunk)
+        # Hardlinks share permissions (and mtime), so they are part of the key
+        h = f"{md.hexdigest()}-{stat.S_IMODE(mode):o}"
+        return os.path.join(self._folder, h[:2], h[2:])
+
+    def deduplicate(self, folder):
+        """ Replaces the regular files in folder with hardlinks to the store, adding the
+        ones that are not there yet. If the filesystem does not support hardlinks (or the store
+        is in a different one), the files are left untouched
+        """
+        for root, _, files in os.walk(folder):
+            for f in files:
+                file_path = os.path.join(root, f)
+                st = os.lstat(file_path)
+                if not stat.S_ISREG(st.st_mode) or st.st_nlink > 1:
+                    continue  # Symlinks and files already linked, maybe to the store
+                stored = self._path(file_path, st.st_mode)
+                try:
+                    if os.path.exists(stored):
+                        tmp = f"{file_path}.{uuid.uuid4().hex[:8]}"
+                        os.link(stored, tmp)
+                        os.replace(tmp, file_path)
+                    else:
+                        os.makedirs(os.path.dirname(stored), exist_ok=True)
+                        os.link(file_path, stored)
+                except (FileExistsError, FileNotFoundError):  # Concurrent store or removal
+                    continue
+                except OSError as e:
+                    ConanOutput().debug(f"Files of {folder} not deduplicated: {e}")
+                    return
+
+    def collect_garbage(self):
+        """ Removes the stored files not used by any package, returns the number of removed ones
+        """
+        removed = 0
+        if not os.path.isdir(self._folder):
+            return removed
+        for entry in os.scandir(self._folder):
+            if not entry.is_dir():
+                continue
+            for stored in os.scandir(entry.path):
+                if stored.stat(follow_symlinks=False).st_nlink == 1:
+                    os.remove(stored.path)
+                    removed += 1
+        return removed
@@ -16,6 +16,14 @@ class HomePaths:
     def local_recipes_index_path(self):
         return os.path.join(self._home, ".local_recipes_index")
 
+    @property
+    def remote_responses_path(self):
+        return os.path.join(self._home, ".remote_responses")
+
+    @property
+    def commands_registry_path(self):
+        return os.path.join(self._home, ".commands_registry.json")
+
     @property
     def global_conf_path(self):
         return os.path.join(self._home, "global.conf")
@@ -50,11 +50,12 @@ class ConanApp:
         # Wraps an http_requester to inject proxies, certs, etc
         self.requester = ConanRequester(global_conf, cache_folder)
         # To handle remote connections
-        rest_client_factory = RestApiClientFactory(self.requester, global_conf)
+        rest_client_factory = RestApiClientFactory(self.requester, global_conf,
+                                                   home_paths.remote_responses_path)
         # Wraps RestApiClient to add authentication support (same interface)
         auth_manager = ConanApiAuthManager(rest_client_factory, self.cache, global_conf)
         # Handle remote connections
-        self.remote_manager = RemoteManager(self.cache, auth_manager)
+        self.remote_manager = RemoteManager(self.cache, auth_manager, global_conf)
 
         self.proxy = ConanProxy(self, conan_api.local.editable_packages)
         self.range_resolver = RangeResolver(self, global_conf, conan_api.local.editable_packages)
@@ -62,7 +63,8 @@ class ConanApp:
         self.pyreq_loader = PyRequireLoader(self, global_conf)
         cmd_wrap = CmdWrapper(home_paths.wrapper_path)
         conanfile_helpers = ConanFileHelpers(self.requester, cmd_wrap, global_conf, self.cache)
-        self.loader = ConanFileLoader(self.pyreq_loader, conanfile_helpers)
+        self.loader = ConanFileLoader(self.pyreq_loader, conanfile_helpers,
+                                      self.cache.bytecode_cache)
 
     @staticmethod
     def _configure(global_conf):
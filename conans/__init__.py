@@ -1,5 +1,7 @@
 CHECKSUM_DEPLOY = "checksum_deploy"  # Only when v2
 REVISIONS = "revisions"  # Only when enabled in config, not by default look at server_launcher.py
 OAUTH_TOKEN = "oauth_token"
+BULK_LATEST = "bulk_latest"  # Latest revisions of many references in a single request
+RESUMABLE_UPLOADS = "resumable_uploads"  # Uploads in chunks with Content-Range, can be resumed
 
 __version__ = '2.3.0-dev'
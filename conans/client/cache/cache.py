@@ -2,13 +2,21 @@ import os
 from typing import List
 
 from conan.internal.cache.cache import DataCache, RecipeLayout, PackageLayout
+from conan.internal.cache.bytecode_cache import BytecodeCache
+from conan.internal.cache.file_store import FileStore
 from conans.client.store.localdb import LocalDB
+from conans.client.store.graphs_cache import GraphsCacheDB
+from conans.client.store.remotes_cache import RemotesCacheDB
 from conans.errors import ConanException
+from conans.model.info import load_binary_info
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
-from conans.util.files import mkdir
+from conans.paths import CONANINFO
+from conans.util.files import mkdir, load
 
 LOCALDB = ".conan.db"
+REMOTES_CACHE_DB = "remotes_cache.sqlite3"
+GRAPHS_CACHE_DB = "graphs_cache.sqlite3"
 
 
 # TODO: Rename this to ClientHome
@@ -51,7 +59,20 @@ class ClientCache(object):
         return self._data_cache.create_build_pkg_layout(ref)
 
     def assign_prev(self, layout: PackageLayout):
-        return self._data_cache.assign_prev(layout)
+        self._data_cache.assign_prev(layout)
+        self.store_package_info(layout)
+
+    def store_package_info(self, layout: PackageLayout):
+        """ Keeps the binary info of the package conaninfo.txt in the DB, so listing and querying
+        packages doesn't need to read it again. Returns the loaded info, or None if the package
+        doesn't have a conaninfo.txt
+        """
+        info_path = os.path.join(layout.package(), CONANINFO)
+        if not os.path.isfile(info_path):
+            return None
+        info = load_binary_info(load(info_path))
+        self._data_cache.set_package_info(layout.reference, info)
+        return info
 
     # Recipe methods
     def recipe_layout(self, ref: RecipeReference):
@@ -90,8 +111,12 @@ class ClientCache(object):
         that would affect its order in our cache """
         return self._data_cache.update_recipe_timestamp(ref)
 
-    def all_refs(self):
-        return self._data_cache.list_references()
+    def get_recipes_state(self):
+        """ Changes if any recipe revision is added, removed or updated in the cache """
+        return self._data_cache.get_recipes_state()
+
+    def all_refs(self, prefix=None, ignorecase=True):
+        return self._data_cache.list_references(prefix, ignorecase)
 
     def exists_prev(self, pref):
         # Used just by download to skip downloads if prev already exists in cache
@@ -108,6 +133,15 @@ class ClientCache(object):
     def get_matching_build_id(self, ref, build_id):
         return self._data_cache.get_matching_build_id(ref, build_id)
 
+    def get_packages_info(self, ref: RecipeReference, query=None):
+        """ The stored binary info of the packages of the recipe revision,
+        as {(package_id, prev): info}, optionally filtered by a postfix package query """
+        return self._data_cache.get_packages_info(ref, query)
+
+    def get_packages_info_stored(self, ref: RecipeReference):
+        """ The (package_id, prev) of the packages with their binary info stored """
+        return self._data_cache.get_packages_info_stored(ref)
+
     def get_latest_package_reference(self, pref):
         return self._data_cache.get_latest_package_reference(pref)
 
@@ -131,3 +165,23 @@ class ClientCache(object):
     def localdb(self):
         localdb_filename = os.path.join(self.cache_folder, LOCALDB)
         return LocalDB(localdb_filename)
+
+    @property
+    def bytecode_folder(self):
+        return os.path.join(self._store_folder, "c")
+
+    @property
+    def bytecode_cache(self):
+        return BytecodeCache(self.bytecode_folder, self._store_folder)
+
+    @property
+    def file_store(self):
+        return FileStore(os.path.join(self._store_folder, "f"))
+
+    @property
+    def remotes_cache(self):
+        return RemotesCacheDB(os.path.join(self._store_folder, REMOTES_CACHE_DB))
+
+    @property
+    def graphs_cache(self):
+        return GraphsCacheDB(os.path.join(self._store_folder, GRAPHS_CACHE_DB))
@@ -1,16 +1,17 @@
 import os
 import shutil
 import time
+from multiprocessing.pool import ThreadPool
 
 from conan.internal.conan_app import ConanApp
 from conan.api.output import ConanOutput
 from conans.client.source import retrieve_exports_sources
 from conans.errors import ConanException, NotFoundException
 from conans.paths import (CONAN_MANIFEST, CONANFILE, EXPORT_SOURCES_TGZ_NAME,
-                          EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, CONANINFO)
+                          EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME, CONANINFO)
 from conans.util.files import (clean_dirty, is_dirty, gather_files,
-                               gzopen_without_timestamps, set_dirty_context_manager, mkdir,
-                               human_size)
+                               gzopen_without_timestamps, zstdopen_without_timestamps,
+                               set_dirty_context_manager, mkdir, human_size)
 
 UPLOAD_POLICY_FORCE = "force-upload"
 UPLOAD_POLICY_SKIP = "skip-upload"
@@ -165,9 +166,12 @@ class PackagePreparator:
     def _compress_package_files(self, layout, pref):
         output = ConanOutput(scope=str(pref))
         download_pkg_folder = layout.download_package()
-        package_tgz = os.path.join(download_pkg_folder, PACKAGE_TGZ_NAME)
+        compression = self._global_conf.get("core.upload:compression_format", default="gzip",
+                                            choices=["gzip", "zstd"])
+        package_tgz_name = PACKAGE_TZST_NAME if compression == "zstd" else PACKAGE_TGZ_NAME
+        package_tgz = os.path.join(download_pkg_folder, package_tgz_name)
         if is_dirty(package_tgz):
-            output.warning("Removing %s, marked as dirty" % PACKAGE_TGZ_NAME)
+            output.warning("Removing %s, marked as dirty" % package_tgz_name)
             os.remove(package_tgz)
             clean_dirty(package_tgz)
 
@@ -192,13 +196,16 @@ class PackagePreparator:
 
         if not os.path.isfile(package_tgz):
             tgz_files = {f: path for f, path in files.items()}
-            compresslevel = self._global_conf.get("core.gzip:compresslevel", check_type=int)
-            tgz_path = compress_files(tgz_files, PACKAGE_TGZ_NAME, download_pkg_folder,
+            if compression == "zstd":
+                compresslevel = None
+            else:
+                compresslevel = self._global_conf.get("core.gzip:compresslevel", check_type=int)
+            tgz_path = compress_files(tgz_files, package_tgz_name, download_pkg_folder,
                                       compresslevel=compresslevel, ref=pref)
             assert tgz_path == package_tgz
             assert os.path.exists(package_tgz)
 
-        return {PACKAGE_TGZ_NAME: package_tgz,
+        return {package_tgz_name: package_tgz,
                 CONANINFO: os.path.join(download_pkg_folder, CONANINFO),
                 CONAN_MANIFEST: os.path.join(download_pkg_folder, CONAN_MANIFEST)}
 
@@ -208,16 +215,31 @@ class UploadExecutor:
     been computed and are passed in the ``upload_data`` parameter, so this executor is also
     agnostic about which files are transferred
     """
-    def __init__(self, app: ConanApp):
+    def __init__(self, app: ConanApp, global_conf):
         self._app = app
+        self._global_conf = global_conf
 
     def upload(self, upload_data, remote):
-        for ref, bundle in upload_data.refs().items():
-            if bundle.get("upload"):
-                self.upload_recipe(ref, bundle, remote)
-            for pref, prev_bundle in upload_data.prefs(ref, bundle).items():
-                if prev_bundle.get("upload"):
-                    self.upload_package(pref, prev_bundle, remote)
+        parallel = self._global_conf.get("core.upload:parallel", default=1, check_type=int)
+        thread_pool = ThreadPool(parallel) if parallel > 1 else None
+        try:
+            for ref, bundle in upload_data.refs().items():
+                if bundle.get("upload"):
+                    self.upload_recipe(ref, bundle, remote)
+                # The packages of the same recipe revision are uploaded concurrently
+                prefs = [(pref, prev_bundle)
+                         for pref, prev_bundle in upload_data.prefs(ref, bundle).items()
+                         if prev_bundle.get("upload")]
+                if thread_pool is not None and len(prefs) > 1:
+                    thread_pool.starmap(self.upload_package, [(p, b, remote) for p, b in prefs],
+                                        chunksize=1)
+                else:
+                    for pref, prev_bundle in prefs:
+                        self.upload_package(pref, prev_bundle, remote)
+        finally:
+            if thread_pool is not None:
+                thread_pool.close()
+                thread_pool.join()
 
     def upload_recipe(self, ref, bundle, remote):
         output = ConanOutput(scope=str(ref))
@@ -252,18 +274,27 @@ def compress_files(files, name, dest_dir, compresslevel=None, ref=None):
     tgz_path = os.path.join(dest_dir, name)
     ConanOutput(scope=str(ref)).info(f"Compressing {name}")
     with set_dirty_context_manager(tgz_path), open(tgz_path, "wb") as tgz_handle:
-        tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle,
-                                        compresslevel=compresslevel)
-        for filename, abs_path in sorted(files.items()):
-            # recursive is False in case it is a symlink to a folder
-            tgz.add(abs_path, filename, recursive=False)
-        tgz.close()
+        if name == PACKAGE_TZST_NAME:
+            with zstdopen_without_timestamps(name, fileobj=tgz_handle,
+                                             compresslevel=compresslevel) as tgz:
+                _add_files(tgz, files)
+        else:
+            tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle,
+                                            compresslevel=compresslevel)
+            _add_files(tgz, files)
+            tgz.close()
 
     duration = time.time() - t1
     ConanOutput().debug(f"{name} compressed in {duration} time")
     return tgz_path
 
 
+def _add_files(tgz, files):
+    for filename, abs_path in sorted(files.items()):
+        # recursive is False in case it is a symlink to a folder
+        tgz.add(abs_path, filename, recursive=False)
+
+
 def _total_size(cache_files):
     total_size = 0
     for file in cache_files.values():
@@ -1,3 +1,5 @@
+import hashlib
+import io
 import os
 import re
 import time
@@ -7,7 +9,7 @@ from conan.api.output import ConanOutput, TimedOutput
 from conans.client.rest import response_to_str
 from conans.errors import ConanException, NotFoundException, AuthenticationException, \
     ForbiddenException, ConanConnectionError, RequestErrorException
-from conans.util.files import human_size
+from conans.util.files import human_size, rmdir, tar_extract
 from conans.util.sha import check_with_algorithm_sum
 
 
@@ -54,6 +56,40 @@ class FileDownloader:
                 os.remove(file_path)
             raise
 
+    def download_extract(self, url, dest_folder, retry=2, retry_wait=0, verify_ssl=True, auth=None,
+                         parallel=1):
+        """ Extracts the compressed tar archive in ``url`` into ``dest_folder`` while it is being
+        downloaded, without storing the archive on disk. The sha1 of the received bytes is
+        computed on the fly and checked against the server "X-Checksum-Sha1" header, if defined,
+        a mismatch is not retried. ``dest_folder`` is removed if something fails, also before
+        every retry
+        """
+        try:
+            for counter in range(retry + 1):
+                try:
+                    expected_sha1, computed_sha1 = self._download_extract(url, auth, dest_folder,
+                                                                          verify_ssl, parallel)
+                    break
+                except (NotFoundException, ForbiddenException, AuthenticationException,
+                        RequestErrorException):
+                    raise
+                except ConanException as exc:
+                    if counter == retry:
+                        raise
+                    else:
+                        rmdir(dest_folder)
+                        self._output.warning(exc, warn_tag="network")
+                        self._output.info(f"Waiting {retry_wait} seconds to retry...")
+                        time.sleep(retry_wait)
+            if expected_sha1 and expected_sha1.lower() != computed_sha1:
+                raise ConanException("sha1 signature failed for '%s' file. \n"
+                                     " Provided signature: %s  \n"
+                                     " Computed signature: %s" % (url, expected_sha1,
+                                                                  computed_sha1))
+        except Exception:
+            rmdir(dest_folder)
+            raise
+
     @staticmethod
     def check_checksum(file_path, md5, sha1, sha256):
         if md5 is not None:
@@ -63,6 +99,19 @@ class FileDownloader:
         if sha256 is not None:
             check_with_algorithm_sum("sha256", file_path, sha256)
 
+    @staticmethod
+    def _raise_response_error(response, url, auth):
+        if response.status_code == 404:
+            raise NotFoundException("Not found: %s" % url)
+        elif response.status_code == 403:
+            if auth is None or (hasattr(auth, "token") and auth.token is None):
+                # TODO: This is a bit weird, why this conversion? Need to investigate
+                raise AuthenticationException(response_to_str(response))
+            raise ForbiddenException(response_to_str(response))
+        elif response.status_code == 401:
+            raise AuthenticationException(response_to_str(response))
+        raise ConanException("Error %d downloading file %s" % (response.status_code, url))
+
     def _download_file(self, url, auth, headers, file_path, verify_ssl, try_resume=False):
         if try_resume and os.path.exists(file_path):
             range_start = os.path.getsize(file_path)
@@ -78,16 +127,7 @@ class FileDownloader:
             raise ConanException("Error downloading file %s: '%s'" % (url, exc))
 
         if not response.ok:
-            if response.status_code == 404:
-                raise NotFoundException("Not found: %s" % url)
-            elif response.status_code == 403:
-                if auth is None or (hasattr(auth, "token") and auth.token is None):
-                    # TODO: This is a bit weird, why this conversion? Need to investigate
-                    raise AuthenticationException(response_to_str(response))
-                raise ForbiddenException(response_to_str(response))
-            elif response.status_code == 401:
-                raise AuthenticationException(response_to_str(response))
-            raise ConanException("Error %d downloading file %s" % (response.status_code, url))
+            self._raise_response_error(response, url, auth)
 
         def get_total_length():
             if range_start:
@@ -140,3 +180,64 @@ class FileDownloader:
             # If this part failed, it means problems with the connection to server
             raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
                                        % str(e))
+
+    def _download_extract(self, url, auth, dest_folder, verify_ssl, parallel):
+        try:
+            response = self._requester.get(url, stream=True, verify=verify_ssl, auth=auth)
+        except Exception as exc:
+            raise ConanException("Error downloading file %s: '%s'" % (url, exc))
+
+        if not response.ok:
+            self._raise_response_error(response, url, auth)
+
+        try:
+            total_length = int(response.headers.get("Content-Length") or 0)
+            if total_length > 10000000:  # 10 MB
+                hs = human_size(total_length)
+                self._output.info(f"Downloading and extracting {hs} {url.rsplit('/', 1)[-1]}")
+            chunk_size = 1024 * 100
+            stream = _ChecksumStream(iter(response.iter_content(chunk_size)))
+            tar_extract(io.BufferedReader(stream, chunk_size), dest_folder, parallel)
+            stream.consume()  # The end of the tar could have some padding not read by tarfile
+            response.close()
+        except Exception as e:
+            # Both connection and corrupted archive errors, they can be retried
+            raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
+                                       % str(e))
+
+        gzip = (response.headers.get("content-encoding") == "gzip")
+        if total_length and stream.size != total_length and not gzip:
+            raise ConanConnectionError("Transfer interrupted before complete: %s < %s"
+                                       % (stream.size, total_length))
+        return response.headers.get("X-Checksum-Sha1"), stream.sha1.hexdigest()
+
+
+class _ChecksumStream(io.RawIOBase):
+    """ Read-only file object over the chunks of a download, computing its sha1 while read
+    """
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._chunk = memoryview(b"")
+        self.sha1 = hashlib.sha1()
+        self.size = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._chunk:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self.sha1.update(chunk)
+            self.size += len(chunk)
+            self._chunk = memoryview(chunk)
+        n = min(len(buffer), len(self._chunk))
+        buffer[:n] = self._chunk[:n]
+        self._chunk = self._chunk[n:]
+        return n
+
+    def consume(self):
+        for chunk in self._chunks:
+            self.sha1.update(chunk)
+            self.size += len(chunk)
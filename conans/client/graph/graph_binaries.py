@@ -1,6 +1,9 @@
 import json
 import os
 from collections import OrderedDict
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+from threading import BoundedSemaphore, Lock
 
 from conan.api.output import ConanOutput
 from conan.internal.cache.home_paths import HomePaths
@@ -29,6 +32,15 @@ class GraphBinariesAnalyzer(object):
         self._remote_manager = conan_app.remote_manager
         # These are the nodes with pref (not including PREV) that have been evaluated
         self._evaluated = {}  # {pref: [nodes]}
+        # Binaries of the current level that can be requested at once to the remotes
+        self._prefetch_prefs = []
+        self._prefetched_remotes = set()
+        self._prefetch_lock = Lock()
+        self._bulk_latest = global_conf.get("core.graph:bulk_latest", check_type=bool)
+        # Bound the concurrent requests to each remote of the parallel evaluation
+        self._remote_parallel = global_conf.get("core.graph:parallel_remote", check_type=int)
+        self._remote_semaphores = {}  # {remote name: BoundedSemaphore}
+        self._remote_semaphores_lock = Lock()
         compat_folder = HomePaths(self._cache.cache_folder).compatibility_plugin_path
         self._compatibility = BinaryCompatibility(compat_folder)
 
@@ -58,6 +70,20 @@ class GraphBinariesAnalyzer(object):
                 package_layout.package_remove()
                 return True
 
+    @contextmanager
+    def _remote_slot(self, remote):
+        """ waits for a free slot of the remote, to request it inside this context """
+        if not self._remote_parallel:
+            yield
+            return
+        with self._remote_semaphores_lock:
+            semaphore = self._remote_semaphores.get(remote.name)
+            if semaphore is None:
+                semaphore = BoundedSemaphore(self._remote_parallel)
+                self._remote_semaphores[remote.name] = semaphore
+        with semaphore:
+            yield
+
     # check through all the selected remotes:
     # - if not --update: get the first package found
     # - if --update: get the latest remote searching in all of them
@@ -65,9 +91,14 @@ class GraphBinariesAnalyzer(object):
         results = []
         pref = node.pref
         for r in remotes:
+            if self._bulk_latest:
+                self._prefetch_latest_prefs(r, update)
             try:
                 info = node.conanfile.info
-                latest_pref = self._remote_manager.get_latest_package_reference(pref, r, info)
+                cached = not should_update_reference(node.ref, update)
+                with self._remote_slot(r):
+                    latest_pref = self._remote_manager.get_latest_package_reference(pref, r, info,
+                                                                                    cached=cached)
                 results.append({'pref': latest_pref, 'remote': r})
                 if len(results) > 0 and not should_update_reference(node.ref, update):
                     break
@@ -364,6 +395,86 @@ class GraphBinariesAnalyzer(object):
             with conanfile_exception_formatter(conanfile, "layout"):
                 conanfile.layout()
 
+    def _prefetch_latest_prefs(self, remote, update):
+        """ The first time the binaries of a level are looked for in a remote, the latest package
+        revisions of all the binaries of that level that could be looked for there are requested
+        at once, instead of one by one
+        """
+        with self._prefetch_lock:
+            if remote.name in self._prefetched_remotes:
+                return
+            self._prefetched_remotes.add(remote.name)
+            prefs = self._prefetch_prefs
+            with self._remote_slot(remote):
+                latest = self._remote_manager.prefetch_latest_references([], prefs, remote)
+            # Without updates, the first remote that has the binary is the one used
+            self._prefetch_prefs = [pref for pref in prefs if latest.get(pref) is None
+                                    or should_update_reference(pref.ref, update)]
+
+    def _prefetch_candidates(self, nodes, update):
+        # The binaries that are not in the cache or need to be updated, they might be looked for in
+        # the remotes, unless they are built
+        self._prefetched_remotes = set()
+        self._prefetch_prefs = []
+        if not self._bulk_latest:
+            return
+        for node in nodes:
+            if node.recipe in (RECIPE_EDITABLE, RECIPE_PLATFORM) or node.conanfile.info.invalid \
+                    or node.conanfile.upload_policy == "skip" or node.pref in self._evaluated:
+                continue
+            if should_update_reference(node.ref, update) or \
+                    self._cache.get_latest_package_reference(node.pref) is None:
+                self._prefetch_prefs.append(node.pref)
+
+    def _evaluate_levels(self, levels, config_version, thread_pool, evaluate_single, update):
+        for level in levels:
+            for node in level:
+                self._evaluate_package_id(node, config_version)
+            # group by pref to paralelize, so evaluation is done only 1 per pref
+            nodes = {}
+            for node in level:
+                nodes.setdefault(node.pref, []).append(node)
+            self._prefetch_candidates([pref_nodes[0] for pref_nodes in nodes.values()], update)
+            # PARALLEL, this is the slow part that can query servers for packages, and compatibility
+            if thread_pool is not None and len(nodes) > 1:
+                self._evaluate_parallel(thread_pool, nodes, evaluate_single)
+            else:
+                for pref, pref_nodes in nodes.items():
+                    evaluate_single(pref_nodes[0])
+            # END OF PARALLEL
+            # Evaluate the possible nodes with repeated "prefs" that haven't been evaluated
+            for pref, pref_nodes in nodes.items():
+                for n in pref_nodes[1:]:
+                    evaluate_single(n)
+
+    @staticmethod
+    def _evaluate_parallel(thread_pool, nodes, evaluate_single):
+        """ evaluates the first node of every different pref of a level concurrently. Prefs of the
+        same recipe reference are chained inside the same task, in the same order as the serial
+        evaluation, because compatible package_ids of one node can be the package_id of another
+        node of the same reference and they share the self._evaluated state
+        """
+        by_ref = {}
+        for pref, pref_nodes in nodes.items():
+            by_ref.setdefault(pref.ref, []).append(pref_nodes[0])
+
+        def _evaluate_ref(ref_nodes):
+            # The output of every task is written when it is its turn in the serial order
+            with ConanOutput.buffered() as buffer:
+                try:
+                    for n in ref_nodes:
+                        evaluate_single(n)
+                except Exception as e:
+                    return buffer.getvalue(), e
+            return buffer.getvalue(), None
+
+        # imap() preserves the order, so the first failure in the serial order is the one raised
+        output = ConanOutput()
+        for messages, error in thread_pool.imap(_evaluate_ref, by_ref.values()):
+            output.write_buffered(messages)
+            if error is not None:
+                raise error
+
     def evaluate_graph(self, deps_graph, build_mode, lockfile, remotes, update, build_mode_test=None,
                        tested_graph=None):
         if tested_graph is None:
@@ -392,21 +503,16 @@ class GraphBinariesAnalyzer(object):
 
         levels = deps_graph.by_levels()
         config_version = self._config_version()
-        for level in levels[:-1]:  # all levels but the last one, which is the single consumer
-            for node in level:
-                self._evaluate_package_id(node, config_version)
-            # group by pref to paralelize, so evaluation is done only 1 per pref
-            nodes = {}
-            for node in level:
-                nodes.setdefault(node.pref, []).append(node)
-            # PARALLEL, this is the slow part that can query servers for packages, and compatibility
-            for pref, pref_nodes in nodes.items():
-                _evaluate_single(pref_nodes[0])
-            # END OF PARALLEL
-            # Evaluate the possible nodes with repeated "prefs" that haven't been evaluated
-            for pref, pref_nodes in nodes.items():
-                for n in pref_nodes[1:]:
-                    _evaluate_single(n)
+        parallel = self._global_conf.get("core.graph:parallel", default=1, check_type=int)
+        thread_pool = ThreadPool(parallel) if parallel > 1 else None
+        try:
+            # all levels but the last one, which is the single consumer
+            self._evaluate_levels(levels[:-1], config_version, thread_pool, _evaluate_single,
+                                  update)
+        finally:
+            if thread_pool is not None:
+                thread_pool.close()
+                thread_pool.join()
 
         # Last level is always necessarily a consumer or a virtual
         assert len(levels[-1]) == 1
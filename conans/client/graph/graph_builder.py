@@ -1,6 +1,7 @@
 import copy
 
 from collections import deque
+from multiprocessing.pool import ThreadPool
 
 from conan.internal.cache.conan_reference_layout import BasicLayout
 from conans.client.conanfile.configure import run_configure_method
@@ -30,6 +31,9 @@ class DepsGraphBuilder(object):
         self._update = update
         self._check_update = check_update
         self._resolve_prereleases = global_conf.get('core.version_ranges:resolve_prereleases')
+        self._parallel = global_conf.get("core.graph:parallel", default=1, check_type=int)
+        self._bulk_latest = global_conf.get("core.graph:bulk_latest", check_type=bool)
+        self._prefetch_pool = None
 
     def load_graph(self, root_node, profile_host, profile_build, graph_lock=None):
         assert profile_host is not None
@@ -44,7 +48,11 @@ class DepsGraphBuilder(object):
         dep_graph.add_node(root_node)
 
         open_requires = deque((r, root_node) for r in root_node.conanfile.requires.values())
+        if self._parallel > 1 and self._remotes:
+            self._prefetch_pool = ThreadPool(self._parallel)
         try:
+            self._prefetch_recipes(root_node, root_node.conanfile.requires.values(), profile_host,
+                                   profile_build, graph_lock)
             while open_requires:
                 # Fetch the first waiting to be expanded (depth-first)
                 (require, node) = open_requires.popleft()
@@ -57,13 +65,57 @@ class DepsGraphBuilder(object):
                                               profile_host)
                     open_requires.extendleft((r, new_node)
                                              for r in reversed(new_node.conanfile.requires.values()))
+                    self._prefetch_recipes(new_node, new_node.conanfile.requires.values(),
+                                           profile_host, profile_build, graph_lock)
             self._remove_overrides(dep_graph)
             check_graph_provides(dep_graph)
         except GraphError as e:
             dep_graph.error = e
+        finally:
+            if self._prefetch_pool is not None:
+                self._prefetch_pool.close()
+                self._prefetch_pool.join()
+                self._prefetch_pool = None
         dep_graph.resolved_ranges = self._resolver.resolved_ranges
         return dep_graph
 
+    def _prefetch_recipes(self, node, requires, profile_host, profile_build, graph_lock):
+        """ Request at once the latest revisions of the recipes of the new pending requires that
+        can be known in advance (core.graph:bulk_latest), and start retrieving them in the
+        background if there is a prefetch pool (core.graph:parallel), so the depth-first expansion
+        (that keeps being sequential and deterministic) finds them already downloaded. Only exact
+        references (or locked ones) are prefetched, version ranges depend on the ranges
+        resolution, that happens in order
+        """
+        if not self._remotes or not (self._bulk_latest or self._prefetch_pool is not None):
+            return
+        refs = []
+        profile = profile_build if node.context == CONTEXT_BUILD else profile_host
+        platform = profile.platform_requires + profile.platform_tool_requires
+        for require in requires:
+            if require.override or any(p.name == require.ref.name for p in platform):
+                continue
+            if str(require.ref.version).startswith("<host_version"):
+                continue
+            if node.check_downstream_exists(require) is not None:
+                continue  # Already existing or overriden downstream
+            if graph_lock is not None:
+                require = copy.copy(require)
+                try:
+                    graph_lock.resolve_locked(node, require, self._resolve_prereleases)
+                except ConanException:
+                    continue
+            if require.version_range is not None:
+                continue
+            refs.append(require.ref)
+        if self._bulk_latest:
+            self._proxy.prefetch_latest_revisions(refs, self._remotes, self._update,
+                                                  self._check_update)
+        if self._prefetch_pool is not None:
+            for ref in refs:
+                self._proxy.prefetch_recipe(ref, self._remotes, self._update, self._check_update,
+                                            self._prefetch_pool)
+
     def _expand_require(self, require, node, graph, profile_host, profile_build, graph_lock):
         # Handle a requirement of a node. There are 2 possibilities
         #    node -(require)-> new_node (creates a new node in the graph)
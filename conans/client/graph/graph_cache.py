@@ -0,0 +1,84 @@
+import hashlib
+import json
+import os
+
+from conans import __version__
+from conans.client.graph.graph import RECIPE_VIRTUAL
+from conans.model.graph_lock import Lockfile
+from conans.model.recipe_ref import RecipeReference
+from conans.util.files import load
+
+
+class GraphCache:
+    """ When "core.graph:cache" is enabled, the resolution of a dependency graph (the versions and
+    revisions of all the recipes, as a lockfile, and the resolved version ranges) is stored,
+    indexed by a hash of the consumer conanfile, the profiles, the input lockfile, the global
+    conf, the remotes and the editable packages. A later computation of the same graph reuses it
+    as long as no recipe revision has been added, removed or updated in the cache since then, so
+    the version ranges and latest revisions don't need to be resolved again. The recipes are
+    still loaded and their configure() and requirements() evaluated, as the graph needs the
+    conanfiles
+    """
+
+    def __init__(self, cache, editable_packages):
+        self._cache = cache
+        self._editable_packages = editable_packages
+
+    @staticmethod
+    def _root_inputs(root_node):
+        conanfile = root_node.conanfile
+        inputs = [root_node.recipe, root_node.context, repr(root_node.ref),
+                  getattr(conanfile, "tested_reference_str", None)]
+        if root_node.recipe == RECIPE_VIRTUAL:
+            inputs.append([(repr(r.ref), r.build) for r in conanfile.requires.values()])
+        if root_node.path:
+            inputs.append(load(root_node.path))
+            conandata = os.path.join(os.path.dirname(root_node.path), "conandata.yml")
+            if os.path.isfile(conandata):
+                inputs.append(load(conandata))
+        python_requires = getattr(conanfile, "python_requires", None)
+        if hasattr(python_requires, "all_refs"):
+            inputs.append(sorted(r.repr_notime() for r in python_requires.all_refs()))
+        return inputs
+
+    def _editables_inputs(self):
+        inputs = []
+        for ref, info in sorted(self._editable_packages.edited_refs.items(),
+                                key=lambda e: str(e[0])):
+            path = info["path"]
+            conanfile = load(path) if os.path.isfile(path) else None
+            inputs.append([ref.repr_notime(), path, info.get("output_folder"), conanfile])
+        return inputs
+
+    def _key(self, root_node, profile_host, profile_build, lockfile, remotes, global_conf):
+        inputs = [__version__,
+                  self._root_inputs(root_node),
+                  profile_host.dumps(),
+                  profile_build.dumps(),
+                  lockfile.dumps() if lockfile is not None else None,
+                  global_conf.dumps(),
+                  [(r.name, r.url) for r in remotes],
+                  self._editables_inputs()]
+        return hashlib.sha256(json.dumps(inputs).encode()).hexdigest()
+
+    def load(self, root_node, profile_host, profile_build, lockfile, remotes, global_conf):
+        """ Returns the key of this graph and, if it is stored and still valid, the lockfile
+        and the resolved version ranges of its previous computation
+        """
+        key = self._key(root_node, profile_host, profile_build, lockfile, remotes, global_conf)
+        stored = self._cache.graphs_cache.get(key)
+        if stored is None or stored["recipes_state"] != self._cache.get_recipes_state():
+            return key, None, None
+        graph_lock = Lockfile.deserialize(stored["lockfile"])
+        resolved_ranges = {RecipeReference.loads(r): RecipeReference.loads(s)
+                           for r, s in stored["resolved_ranges"].items()}
+        return key, graph_lock, resolved_ranges
+
+    def store(self, key, deps_graph):
+        if deps_graph.error:
+            return
+        result = {"recipes_state": self._cache.get_recipes_state(),
+                  "lockfile": Lockfile(deps_graph).serialize(),
+                  "resolved_ranges": {repr(r): s.repr_notime()
+                                      for r, s in deps_graph.resolved_ranges.items()}}
+        self._cache.graphs_cache.store(key, result)
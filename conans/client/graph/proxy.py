@@ -13,6 +13,8 @@ class ConanProxy:
         self._cache = conan_app.cache
         self._remote_manager = conan_app.remote_manager
         self._resolved = {}  # Cache of the requested recipes to optimize calls
+        # {(name, version, user, channel): (ref, AsyncResult)} recipes retrieved in the background
+        self._prefetched = {}
 
     def get_recipe(self, ref, remotes, update, check_update):
         """
@@ -22,10 +24,61 @@ class ConanProxy:
         # with layout.conanfile_write_lock(self._out):
         resolved = self._resolved.get(ref)
         if resolved is None:
-            resolved = self._get_recipe(ref, remotes, update, check_update)
+            resolved = self._get_prefetched(ref)
+            if resolved is None:
+                resolved = self._get_recipe(ref, remotes, update, check_update)
             self._resolved[ref] = resolved
         return resolved
 
+    def prefetch_recipe(self, ref, remotes, update, check_update, thread_pool):
+        """ Starts retrieving a recipe in the background thread_pool, a later get_recipe() of
+        exactly the same reference will use it
+        """
+        key = ref.name, ref.version, ref.user, ref.channel
+        if self._resolved.get(ref) is not None or key in self._prefetched:
+            return
+        result = thread_pool.apply_async(self._get_recipe, (ref, remotes, update, check_update))
+        self._prefetched[key] = ref, result
+
+    def prefetch_latest_revisions(self, refs, remotes, update, check_update):
+        """ Requests at once to each remote the latest revisions of the recipes that get_recipe()
+        will look for in the remotes, because they are not in the cache or need to be updated
+        """
+        pending = []
+        for ref in refs:
+            if ref.revision or self._resolved.get(ref) is not None \
+                    or self._editable_packages.get_path(ref) is not None:
+                continue
+            if not (check_update or should_update_reference(ref, update)):
+                try:
+                    self._cache.recipe_layout(ref)
+                    continue
+                except ConanException:
+                    pass
+            pending.append(ref)
+        for remote in remotes:
+            if not pending:
+                break
+            allowed = [ref for ref in pending
+                       if not remote.allowed_packages or any(ref.matches(f, is_consumer=False)
+                                                             for f in remote.allowed_packages)]
+            latest = self._remote_manager.prefetch_latest_references(allowed, [], remote)
+            # Without updates, the first remote that has the recipe is the one used
+            pending = [ref for ref in pending if latest.get(ref) is None
+                       or check_update or should_update_reference(ref, update)]
+
+    def _get_prefetched(self, ref):
+        # Wait for the one of the same recipe, so they never write the same cache layout
+        # concurrently. Only the one requested with exactly the same revision can be used, failures
+        # are discarded, the sequential get_recipe() will raise them normally
+        prefetched = self._prefetched.pop((ref.name, ref.version, ref.user, ref.channel), None)
+        if prefetched is None:
+            return None
+        r, result = prefetched
+        result.wait()
+        if r.revision == ref.revision and result.successful():
+            return result.get()
+
     # return the remote where the recipe was found or None if the recipe was not found
     def _get_recipe(self, reference, remotes, update, check_update):
         output = ConanOutput(scope=str(reference))
@@ -104,7 +157,9 @@ class ConanProxy:
             output.info(f"Checking remote: {remote.name}")
             try:
                 if not reference.revision:
-                    ref = self._remote_manager.get_latest_recipe_reference(reference, remote)
+                    cached = not (check_update or should_update_reference(reference, update))
+                    ref = self._remote_manager.get_latest_recipe_reference(reference, remote,
+                                                                           cached=cached)
                 else:
                     ref = self._remote_manager.get_recipe_revision_reference(reference, remote)
                 if not should_update_reference(reference, update) and not check_update:
@@ -1,3 +1,5 @@
+from bisect import bisect_left, bisect_right
+
 from conans.client.graph.proxy import should_update_reference
 from conans.errors import ConanException
 from conans.model.recipe_ref import RecipeReference
@@ -11,8 +13,8 @@ class RangeResolver:
         self._cache = conan_app.cache
         self._editable_packages = editable_packages
         self._remote_manager = conan_app.remote_manager
-        self._cached_cache = {}  # Cache caching of search result, so invariant wrt installations
-        self._cached_remote_found = {}  # dict {ref (pkg/*): {remote_name: results (pkg/1, pkg/2)}}
+        self._cached_cache = {}  # {ref (pkg/*): _VersionIndex}, so invariant wrt installations
+        self._cached_remote_found = {}  # dict {ref (pkg/*): {remote_name: _VersionIndex}}
         self.resolved_ranges = {}
         self._resolve_prereleases = global_conf.get('core.version_ranges:resolve_prereleases')
 
@@ -59,43 +61,79 @@ class RangeResolver:
             local_found.extend(r for r in self._editable_packages.edited_refs
                                if r.name == search_ref.name and r.user == search_ref.user
                                and r.channel == search_ref.channel)
+            local_found = _VersionIndex(local_found)
             self._cached_cache[pattern] = local_found
-        if local_found:
-            return self._resolve_version(version_range, local_found, self._resolve_prereleases)
+        return local_found.resolve(version_range, self._resolve_prereleases)
 
-    def _search_remote_recipes(self, remote, search_ref):
+    def _search_remote_recipes(self, remote, search_ref, update):
         if remote.allowed_packages and not any(search_ref.matches(f, is_consumer=False)
                                                for f in remote.allowed_packages):
-            return []
+            return _VersionIndex([])
         pattern = str(search_ref)
         pattern_cached = self._cached_remote_found.setdefault(pattern, {})
         results = pattern_cached.get(remote.name)
         if results is None:
-            results = self._remote_manager.search_recipes(remote, pattern)
+            cached = not should_update_reference(search_ref, update)
+            results = self._remote_manager.search_recipes(remote, pattern, cached=cached)
             # TODO: This is still necessary to filter user/channel, until search_recipes is fixed
-            results = [ref for ref in results if ref.user == search_ref.user
-                       and ref.channel == search_ref.channel]
+            results = _VersionIndex([ref for ref in results if ref.user == search_ref.user
+                                     and ref.channel == search_ref.channel])
             pattern_cached.update({remote.name: results})
         return results
 
     def _resolve_remote(self, search_ref, version_range, remotes, update):
         update_candidates = []
         for remote in remotes:
-            remote_results = self._search_remote_recipes(remote, search_ref)
-            resolved_version = self._resolve_version(version_range, remote_results,
-                                                     self._resolve_prereleases)
+            remote_results = self._search_remote_recipes(remote, search_ref, update)
+            resolved_version = remote_results.resolve(version_range, self._resolve_prereleases)
             if resolved_version:
                 if not should_update_reference(search_ref, update):
                     return resolved_version  # Return first valid occurrence in first remote
                 else:
                     update_candidates.append(resolved_version)
         if len(update_candidates) > 0:  # pick latest from already resolved candidates
-            resolved_version = self._resolve_version(version_range, update_candidates,
-                                                     self._resolve_prereleases)
+            resolved_version = _VersionIndex(update_candidates).resolve(version_range,
+                                                                        self._resolve_prereleases)
             return resolved_version
 
-    @staticmethod
-    def _resolve_version(version_range, refs_found, resolve_prereleases):
-        for ref in reversed(sorted(refs_found)):
-            if version_range.contains(ref.version, resolve_prereleases):
-                return ref
+
+class _VersionIndex:
+    """ The references found for one recipe name (and user/channel), sorted only once, so every
+    version range can be resolved with a binary search of the range limits, instead of sorting and
+    checking all the candidates
+    """
+    def __init__(self, refs):
+        self._refs = sorted(refs)
+        self._versions = [r.version for r in self._refs]
+
+    def resolve(self, version_range, resolve_prereleases):
+        """ returns the latest reference whose version is contained in the range
+        """
+        best = None
+        for condition_set in version_range.condition_sets:
+            lower, upper = self._limits(condition_set.conditions)
+            # Only the candidates inside the limits are checked, starting from the latest, the
+            # first one that is valid is the best one for this condition set
+            stop = lower - 1 if best is None else max(lower - 1, best)
+            for index in range(upper - 1, stop, -1):
+                if condition_set.valid(self._versions[index], resolve_prereleases):
+                    best = index
+                    break
+        return self._refs[best] if best is not None else None
+
+    def _limits(self, conditions):
+        lower, upper = 0, len(self._versions)
+        for condition in conditions:
+            version = condition.version
+            if condition.operator == ">":
+                lower = max(lower, bisect_right(self._versions, version))
+            elif condition.operator == ">=":
+                lower = max(lower, bisect_left(self._versions, version))
+            elif condition.operator == "<":
+                upper = min(upper, bisect_left(self._versions, version))
+            elif condition.operator == "<=":
+                upper = min(upper, bisect_right(self._versions, version))
+            elif condition.operator == "=":
+                lower = max(lower, bisect_left(self._versions, version))
+                upper = min(upper, bisect_right(self._versions, version))
+        return lower, upper
@@ -1,8 +1,10 @@
 import os
 import shutil
+import threading
 from multiprocessing.pool import ThreadPool
 
 from conan.api.output import ConanOutput
+from conan.tools.build import build_jobs
 from conans.client.conanfile.build import run_build_method
 from conans.client.conanfile.package import run_package_method
 from conans.client.generators import write_generators
@@ -15,6 +17,7 @@ from conans.model.build_info import CppInfo, MockInfoProperty
 from conans.model.package_ref import PkgReference
 from conans.paths import CONANINFO
 from conans.util.files import clean_dirty, is_dirty, mkdir, rmdir, save, set_dirty, chdir
+from conans.util.runners import ParallelBuildLock
 
 
 def build_id(conan_file):
@@ -175,6 +178,7 @@ class BinaryInstaller:
         self._remote_manager = app.remote_manager
         self._hook_manager = app.hook_manager
         self._global_conf = global_conf
+        self._pending_downloads = {}  # {pref: AsyncResult} of the background downloads
 
     def _install_source(self, node, remotes):
         conanfile = node.conanfile
@@ -251,26 +255,188 @@ class BinaryInstaller:
                                  for install_reference in level)])
         handled_count = 1
 
-        self._download_bulk(install_order)
-        for level in install_order:
-            for install_reference in level:
-                for package in install_reference.packages.values():
-                    self._install_source(package.nodes[0], remotes)
-                    self._handle_package(package, install_reference, handled_count, package_count)
-                    handled_count += 1
+        pipeline = self._global_conf.get("core.download:pipeline", check_type=bool)
+        download_pool = self._download_background(install_order) if pipeline else None
+        if download_pool is None:
+            self._download_bulk(install_order)
+        parallel = self._global_conf.get("core.build:parallel_packages", default=1, check_type=int)
+        deferred = []  # The packages downloading in background that no build needed yet
+        try:
+            for level in install_order:
+                if parallel > 1 and sum(r.need_build for r in level) > 1:
+                    self._install_level_parallel(level, remotes, handled_count, package_count,
+                                                 parallel, deferred)
+                    handled_count += sum(len(r.packages) for r in level)
+                    continue
+                for install_reference in level:
+                    for package in install_reference.packages.values():
+                        if not self._defer_download(package, install_reference, handled_count,
+                                                    deferred):
+                            self._handle_deferred(package, deferred, remotes, package_count)
+                            self._install_source(package.nodes[0], remotes)
+                            self._wait_downloads(package)
+                            self._handle_package(package, install_reference, handled_count,
+                                                 package_count)
+                        handled_count += 1
+            self._handle_deferred(None, deferred, remotes, package_count)
+        except BaseException:
+            if download_pool is not None:
+                download_pool.terminate()
+            raise
+        finally:
+            if download_pool is not None:
+                download_pool.close()
+                download_pool.join()
+                self._pending_downloads = {}
 
         MockInfoProperty.message()
 
-    def _download_bulk(self, install_order):
-        """ executes the download of packages (both download and update), only once for a given
-        PREF
+    def _install_level_parallel(self, level, remotes, handled_count, package_count, parallel,
+                                deferred):
+        """ The references of the same level don't depend on each other, so the ones that need
+        to be built from source are built concurrently, one thread per recipe reference, as the
+        binaries of the same recipe share the source folder and maybe the build one (build_id())
         """
+        builds = []
+        for install_reference in level:
+            packages = []
+            for package in install_reference.packages.values():
+                packages.append((package, handled_count))
+                handled_count += 1
+            if install_reference.need_build:
+                builds.append((install_reference, packages))
+            else:
+                for package, count in packages:
+                    if not self._defer_download(package, install_reference, count, deferred):
+                        self._install_source(package.nodes[0], remotes)
+                        self._wait_downloads(package)
+                        self._handle_package(package, install_reference, count, package_count)
+
+        parallel = min(parallel, len(builds))
+        for install_reference, packages in builds:
+            for package, _ in packages:
+                self._handle_deferred(package, deferred, remotes, package_count)
+                # The sources are retrieved before, they are not built in parallel
+                self._install_source(package.nodes[0], remotes)
+                conanfile = package.nodes[0].conanfile
+                # The CPU budget of the compilers is shared among the concurrent builds
+                conanfile.conf.define("tools.build:jobs", max(1, build_jobs(conanfile) // parallel))
+        ConanOutput().info(f"Building {len(builds)} packages in {parallel} parallel threads")
+
+        keep_going = self._global_conf.get("core.build:parallel_keep_going", check_type=bool)
+        build_lock = ParallelBuildLock()
+        failed = threading.Event()
+        errors = []
+
+        def _build(build):
+            install_reference, packages = build
+            if failed.is_set():  # fail-fast, do not start more builds
+                return
+            try:
+                for package, _ in packages:
+                    self._wait_downloads(package)
+                with build_lock.hold():
+                    for package, count in packages:
+                        self._handle_package(package, install_reference, count, package_count)
+            except Exception as e:
+                errors.append((install_reference.ref, e))
+                if not keep_going:
+                    failed.set()
+
+        thread_pool = ThreadPool(parallel)
+        try:
+            thread_pool.map(_build, builds, chunksize=1)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+
+        if len(errors) == 1:
+            raise errors[0][1]
+        if errors:
+            msg = "\n".join(f"{ref}: {e}" for ref, e in errors)
+            raise ConanException(f"There were errors building {len(errors)} packages:\n{msg}")
+
+    @staticmethod
+    def _downloads(install_order):
         downloads = []
         for level in install_order:
             for node in level:
                 for package in node.packages.values():
                     if package.binary in (BINARY_UPDATE, BINARY_DOWNLOAD):
                         downloads.append(package)
+        return downloads
+
+    def _download_background(self, install_order):
+        """ starts the download of the packages in background threads, in the install order, so
+        the downloads of the upper levels overlap with the builds of the lower ones. Returns the
+        thread pool, or None if there is nothing to download or nothing to build
+        """
+        downloads = self._downloads(install_order)
+        if not downloads or not any(r.need_build for level in install_order for r in level):
+            return None
+        download_count = len(downloads)
+        plural = 's' if download_count != 1 else ''
+        ConanOutput().subtitle(f"Downloading {download_count} package{plural} in background")
+        # The number of concurrent downloads is bounded by the size of the pool
+        parallel = self._global_conf.get("core.download:parallel", default=1, check_type=int)
+        thread_pool = ThreadPool(parallel)
+        for package in downloads:
+            pending = thread_pool.apply_async(self._download_pkg, (package,))
+            self._pending_downloads[package.nodes[0].pref] = pending
+        return thread_pool
+
+    @staticmethod
+    def _needed_prefs(package):
+        """ the binary of this package and the binaries of its dependencies, the only ones
+        needed to install or build it
+        """
+        prefs = set()
+        for node in package.nodes:
+            prefs.add(node.pref)
+            prefs.update(t.node.pref for t in node.transitive_deps.values() if t.node is not None)
+        return prefs
+
+    def _defer_download(self, package, install_reference, handled_count, deferred):
+        """ the packages downloading in background are handled when a build needs them, or at
+        the end, so the builds don't wait for the downloads of unrelated packages
+        """
+        if package.nodes[0].pref not in self._pending_downloads:
+            return False
+        deferred.append((package, install_reference, handled_count))
+        return True
+
+    def _handle_deferred(self, package, deferred, remotes, package_count):
+        """ handles, in install order, the deferred packages that this package needs, or all of
+        them if package is None
+        """
+        if not deferred:
+            return
+        prefs = self._needed_prefs(package) if package is not None else None
+        for item in list(deferred):
+            deferred_package, install_reference, handled_count = item
+            if prefs is None or deferred_package.nodes[0].pref in prefs:
+                deferred.remove(item)
+                self._install_source(deferred_package.nodes[0], remotes)
+                self._wait_downloads(deferred_package)
+                self._handle_package(deferred_package, install_reference, handled_count,
+                                     package_count)
+
+    def _wait_downloads(self, package):
+        """ waits for the background downloads of the binaries needed to install or build the
+        package
+        """
+        if not self._pending_downloads:
+            return
+        for pref in self._needed_prefs(package):
+            pending = self._pending_downloads.get(pref)
+            if pending is not None:
+                pending.get()  # Raises the exception of the download, if any
+
+    def _download_bulk(self, install_order):
+        """ executes the download of packages (both download and update), only once for a given
+        PREF
+        """
+        downloads = self._downloads(install_order)
         if not downloads:
             return
 
@@ -287,6 +453,7 @@ class BinaryInstaller:
         else:
             for node in downloads:
                 self._download_pkg(node)
+        ConanOutput().debug(f"HTTP connections: {self._app.requester.connection_stats()}")
 
     def _download_pkg(self, package):
         node = package.nodes[0]
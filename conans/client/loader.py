@@ -1,10 +1,12 @@
 from importlib import invalidate_caches, util as imp_util
+import hashlib
 import inspect
 import os
 import re
 import sys
 import types
 import uuid
+from collections import OrderedDict
 from threading import Lock
 
 import yaml
@@ -26,10 +28,11 @@ from conans.util.files import load, chdir, load_user_encoded
 
 class ConanFileLoader:
 
-    def __init__(self, pyreq_loader=None, conanfile_helpers=None):
+    def __init__(self, pyreq_loader=None, conanfile_helpers=None, bytecode_cache=None):
         self._pyreq_loader = pyreq_loader
         self._cached_conanfile_classes = {}
         self._conanfile_helpers = conanfile_helpers
+        self._bytecode_cache = bytecode_cache
         invalidate_caches()
 
     def load_basic(self, conanfile_path, graph_lock=None, display="", remotes=None,
@@ -53,7 +56,7 @@ class ConanFileLoader:
             return conanfile, cached[1]
 
         try:
-            module, conanfile = _parse_conanfile(conanfile_path)
+            module, conanfile = _parse_conanfile(conanfile_path, self._bytecode_cache)
             if isinstance(tested_python_requires, RecipeReference):
                 if getattr(conanfile, "python_requires", None) == "tested_reference_str":
                     conanfile.python_requires = tested_python_requires.repr_notime()
@@ -297,9 +300,9 @@ def _parse_module(conanfile_module, module_id):
 _load_python_lock = Lock()  # Loading our Python files is not thread-safe (modifies sys)
 
 
-def _parse_conanfile(conanfile_path):
+def _parse_conanfile(conanfile_path, bytecode_cache=None):
     with _load_python_lock:
-        module, module_id = _load_python_file(conanfile_path)
+        module, module_id = _load_python_file(conanfile_path, bytecode_cache)
     try:
         conanfile = _parse_module(module, module_id)
         return module, conanfile
@@ -315,7 +318,36 @@ def load_python_file(conan_file_path):
     return module, module_id
 
 
-def _load_python_file(conan_file_path):
+# LRU {(path, source hash): code object} of the last loaded files, protected by _load_python_lock
+_compiled_code = OrderedDict()
+_COMPILED_CODE_MAXSIZE = 512
+
+
+def _compile_python_file(conan_file_path, bytecode_cache=None):
+    """ The compiled code of the python file, reused if the same file with the same contents was
+    already compiled in this process. If a BytecodeCache is provided, the compiled code is also
+    stored and reused by other processes
+    """
+    with open(conan_file_path, "rb") as f:
+        source = f.read()
+    source_hash = hashlib.sha256(source).hexdigest()
+    key = conan_file_path, source_hash
+    code = _compiled_code.get(key)
+    if code is not None:
+        _compiled_code.move_to_end(key)
+        return code
+    code = bytecode_cache.get(conan_file_path, source_hash) if bytecode_cache else None
+    if code is None:
+        code = compile(source, conan_file_path, "exec", dont_inherit=True)
+        if bytecode_cache:
+            bytecode_cache.store(conan_file_path, source_hash, code)
+    _compiled_code[key] = code
+    if len(_compiled_code) > _COMPILED_CODE_MAXSIZE:
+        _compiled_code.popitem(last=False)
+    return code
+
+
+def _load_python_file(conan_file_path, bytecode_cache=None):
     """ From a given path, obtain the in memory python import module
     """
 
@@ -337,7 +369,8 @@ def _load_python_file(conan_file_path):
                 sys.dont_write_bytecode = True
                 spec = imp_util.spec_from_file_location(module_id, conan_file_path)
                 loaded = imp_util.module_from_spec(spec)
-                spec.loader.exec_module(loaded)
+                code = _compile_python_file(conan_file_path, bytecode_cache)
+                exec(code, loaded.__dict__)
                 sys.dont_write_bytecode = old_dont_write_bytecode
             except ImportError:
                 version_txt = _get_required_conan_version_without_loading(conan_file_path)
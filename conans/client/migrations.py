@@ -55,6 +55,21 @@ class ClientMigrator(Migrator):
 
         if old_version and old_version < "2.0.14-":
             _migrate_pkg_db_lru(self.cache_folder, old_version)
+        if old_version and old_version < "2.3.0-":
+            _migrate_db_tables(self.cache_folder)
+
+
+def _migrate_db_tables(cache_folder):
+    # The new indexes and tables don't need a back-migration, previous versions don't use them
+    from conan.internal.cache.db.packages_info_table import PackagesInfoDBTable
+    from conan.internal.cache.db.recipes_table import RecipesDBTable
+    config = ConfigAPI.load_config(cache_folder)
+    storage = config.get("core.cache:storage_path") or os.path.join(cache_folder, "p")
+    db_filename = os.path.join(storage, 'cache.sqlite3')
+    if not os.path.exists(db_filename):
+        return
+    RecipesDBTable(db_filename).create_indexes()
+    PackagesInfoDBTable(db_filename).create_table()  # Filled lazily with the binaries info
 
 
 def _migrate_pkg_db_lru(cache_folder, old_version):
@@ -36,6 +36,10 @@ class PkgSignaturesPlugin:
                 if pkg_bundle["upload"]:
                     _sign(pref, pkg_bundle["files"], self._cache.pkg_layout(pref).download_package())
 
+    @property
+    def verify_enabled(self):
+        return self._plugin_verify_function is not None
+
     def verify(self, ref, folder, files):
         if self._plugin_verify_function is None:
             return
@@ -11,21 +11,32 @@ from conan.api.output import ConanOutput
 from conan.internal.cache.conan_reference_layout import METADATA
 from conans.client.pkg_sign import PkgSignaturesPlugin
 from conans.errors import ConanConnectionError, ConanException, NotFoundException, \
-    PackageNotFoundException
+    PackageNotFoundException, RecipeNotFoundException
 from conans.model.info import load_binary_info
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
 from conans.util.files import rmdir, human_size
-from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
+from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, \
+    PACKAGE_TZST_NAME
 from conans.util.files import mkdir, tar_extract
 
 
 class RemoteManager:
     """ Will handle the remotes to get recipes, packages etc """
-    def __init__(self, cache, auth_manager):
+    def __init__(self, cache, auth_manager, global_conf):
         self._cache = cache
         self._auth_manager = auth_manager
         self._signer = PkgSignaturesPlugin(cache)
+        self._remotes_ttl = global_conf.get("core.cache:remotes_ttl", check_type=int)
+        self._deduplicate = global_conf.get("core.cache:deduplicate", check_type=bool)
+        self._extract_parallel = global_conf.get("core.download:extract_parallel", default=1,
+                                                 check_type=int)
+        # The download cache and the signatures verification need the compressed files in disk
+        self._stream_extract = (global_conf.get("core.download:stream_extract", check_type=bool)
+                                and not global_conf.get("core.download:download_cache")
+                                and not self._signer.verify_enabled)
+        # {(remote name, ref or pref): latest one or None} from prefetch_latest_references()
+        self._latest_references = {}
 
     def _local_folder_remote(self, remote):
         if remote.remote_type == LOCAL_RECIPES_INDEX:
@@ -81,7 +92,8 @@ class RemoteManager:
         tgz_file = zipped_files.pop(EXPORT_TGZ_NAME, None)
 
         if tgz_file:
-            uncompress_file(tgz_file, export_folder, scope=str(ref))
+            uncompress_file(tgz_file, export_folder, scope=str(ref),
+                            parallel=self._extract_parallel)
         mkdir(export_folder)
         for file_name, file_path in zipped_files.items():  # copy CONANFILE
             shutil.move(file_path, os.path.join(export_folder, file_name))
@@ -123,7 +135,8 @@ class RemoteManager:
 
         self._signer.verify(ref, download_folder, files=zipped_files)
         tgz_file = zipped_files[EXPORT_SOURCES_TGZ_NAME]
-        uncompress_file(tgz_file, export_sources_folder, scope=str(ref))
+        uncompress_file(tgz_file, export_sources_folder, scope=str(ref),
+                        parallel=self._extract_parallel)
 
     def get_package(self, pref, remote, metadata=None):
         output = ConanOutput(scope=str(pref.ref))
@@ -160,22 +173,35 @@ class RemoteManager:
             assert pref.revision is not None
 
             download_pkg_folder = layout.download_package()
-            # Download files to the pkg_tgz folder, not to the final one
+            package_folder = layout.package()
+            # Download files to the pkg_tgz folder, not to the final one, unless they are
+            # extracted directly to the package folder while downloading
+            extract_folder = package_folder if self._stream_extract else None
             zipped_files = self._call_remote(remote, "get_package", pref, download_pkg_folder,
-                                             metadata, only_metadata=False)
+                                             metadata, only_metadata=False,
+                                             extract_folder=extract_folder)
             zipped_files = {k: v for k, v in zipped_files.items() if not k.startswith(METADATA)}
             # quick server package integrity check:
-            for f in ("conaninfo.txt", "conanmanifest.txt", "conan_package.tgz"):
+            for f in ("conaninfo.txt", "conanmanifest.txt"):
                 if f not in zipped_files:
                     raise ConanException(f"Corrupted {pref} in '{remote.name}' remote: no {f}")
+            if PACKAGE_TGZ_NAME not in zipped_files and PACKAGE_TZST_NAME not in zipped_files:
+                raise ConanException(f"Corrupted {pref} in '{remote.name}' remote: "
+                                     f"no {PACKAGE_TGZ_NAME}")
             self._signer.verify(pref, download_pkg_folder, zipped_files)
 
-            tgz_file = zipped_files.pop(PACKAGE_TGZ_NAME, None)
-            package_folder = layout.package()
-            uncompress_file(tgz_file, package_folder, scope=str(pref.ref))
+            # The compression is auto-detected when uncompressing
+            tgz_file = zipped_files.pop(PACKAGE_TGZ_NAME, None) or \
+                zipped_files.pop(PACKAGE_TZST_NAME, None)
+            if extract_folder is None:
+                uncompress_file(tgz_file, package_folder, scope=str(pref.ref),
+                                parallel=self._extract_parallel)
             mkdir(package_folder)  # Just in case it doesn't exist, because uncompress did nothing
             for file_name, file_path in zipped_files.items():  # copy CONANINFO and CONANMANIFEST
                 shutil.move(file_path, os.path.join(package_folder, file_name))
+            if self._deduplicate:
+                self._cache.file_store.deduplicate(package_folder)
+            self._cache.store_package_info(layout)
 
             scoped_output.success('Package installed %s' % pref.package_id)
             scoped_output.info("Downloaded package revision %s" % pref.revision)
@@ -187,8 +213,11 @@ class RemoteManager:
             scoped_output.error(f"Exception: {type(e)} {str(e)}", error_type="exception")
             raise
 
-    def search_recipes(self, remote, pattern):
-        return self._call_remote(remote, "search", pattern)
+    def search_recipes(self, remote, pattern, cached=False):
+        return self._cached_call(remote, f"search:{pattern}", cached,
+                                 lambda: self._call_remote(remote, "search", pattern),
+                                 lambda refs: [repr(r) for r in refs],
+                                 lambda refs: [RecipeReference.loads(r) for r in refs])
 
     def search_packages(self, remote, ref):
         packages = self._call_remote(remote, "search_packages", ref)
@@ -218,11 +247,44 @@ class RemoteManager:
         assert pref.revision is None, "get_package_revisions_references of a reference with revision"
         return self._call_remote(remote, "get_package_revisions_references", pref, headers=headers)
 
-    def get_latest_recipe_reference(self, ref, remote):
+    def prefetch_latest_references(self, refs, prefs, remote):
+        """ Requests at once the latest revisions of the given recipe and package references
+        (without revision), so the following get_latest_recipe_reference() and
+        get_latest_package_reference() of them in this remote don't need to query it. Remotes that
+        don't support it are queried one by one later, as well as the references that fail here.
+        Returns the {ref or pref: latest one, None if not found} that were obtained
+        """
+        if (not refs and not prefs) or remote.remote_type == LOCAL_RECIPES_INDEX:
+            return {}
+        try:
+            latest = self._call_remote(remote, "get_latest_references", refs, prefs) or {}
+        except ConanException as e:
+            ConanOutput().debug(f"Couldn't get latest revisions from remote '{remote.name}': {e}")
+            return {}
+        for ref, latest_ref in latest.items():
+            self._latest_references[(remote.name, ref)] = latest_ref
+        return latest
+
+    def _call_latest(self, remote, method, ref, **kwargs):
+        # Every prefetched result is used only once, so later calls always get fresh results
+        try:
+            latest = self._latest_references.pop((remote.name, ref))
+        except KeyError:
+            return self._call_remote(remote, method, ref, **kwargs)
+        if latest is None:
+            if isinstance(ref, PkgReference):
+                raise PackageNotFoundException(ref, remote=remote)
+            raise RecipeNotFoundException(ref, remote=remote)
+        return latest
+
+    def get_latest_recipe_reference(self, ref, remote, cached=False):
         assert ref.revision is None, "get_latest_recipe_reference of a reference with revision"
-        return self._call_remote(remote, "get_latest_recipe_reference", ref)
+        return self._cached_call(remote, f"latest:{ref}", cached,
+                                 lambda: self._call_latest(remote, "get_latest_recipe_reference",
+                                                           ref),
+                                 repr, RecipeReference.loads)
 
-    def get_latest_package_reference(self, pref, remote, info=None) -> PkgReference:
+    def get_latest_package_reference(self, pref, remote, info=None, cached=False) -> PkgReference:
         assert pref.revision is None, "get_latest_package_reference of a reference with revision"
         # These headers are useful to know what configurations are being requested in the server
         headers = None
@@ -235,7 +297,11 @@ class RemoteManager:
                        if k in ("shared", "fPIC", "header_only")]
             if options:
                 headers['Conan-PkgID-Options'] = ';'.join(options)
-        return self._call_remote(remote, "get_latest_package_reference", pref, headers=headers)
+        return self._cached_call(remote, f"latest:{pref.repr_notime()}", cached,
+                                 lambda: self._call_latest(remote, "get_latest_package_reference",
+                                                           pref, headers=headers),
+                                 lambda p: {"pref": p.repr_notime(), "timestamp": p.timestamp},
+                                 _load_timestamped_pref)
 
     def get_recipe_revision_reference(self, ref, remote) -> bool:
         assert ref.revision is not None, "recipe_exists needs a revision"
@@ -245,6 +311,23 @@ class RemoteManager:
         assert pref.revision is not None, "get_package_revision_reference needs a revision"
         return self._call_remote(remote, "get_package_revision_reference", pref)
 
+    def _cached_call(self, remote, query, cached, call, dumps, loads):
+        """ When "core.cache:remotes_ttl" is defined, the answers of the remotes are stored in
+        the cache and reused by later calls with cached=True within that time. Non cached calls,
+        like the ones with --update, always query the remote and refresh the stored answer.
+        Not found errors are never stored
+        """
+        if self._remotes_ttl is None or remote.remote_type == LOCAL_RECIPES_INDEX:
+            return call()
+        remotes_cache = self._cache.remotes_cache
+        if cached:
+            result = remotes_cache.get(remote.url, query, self._remotes_ttl)
+            if result is not None:
+                return loads(result)
+        result = call()
+        remotes_cache.store(remote.url, query, dumps(result))
+        return result
+
     def _call_remote(self, remote, method, *args, **kwargs):
         assert (isinstance(remote, Remote))
         enforce_disabled = kwargs.pop("enforce_disabled", True)
@@ -269,7 +352,13 @@ class RemoteManager:
             raise ConanException(exc, remote=remote)
 
 
-def uncompress_file(src_path, dest_folder, scope=None):
+def _load_timestamped_pref(data):
+    pref = PkgReference.loads(data["pref"])
+    pref.timestamp = data["timestamp"]
+    return pref
+
+
+def uncompress_file(src_path, dest_folder, scope=None, parallel=1):
     try:
         filesize = os.path.getsize(src_path)
         big_file = filesize > 10000000  # 10 MB
@@ -277,7 +366,7 @@ def uncompress_file(src_path, dest_folder, scope=None):
             hs = human_size(filesize)
             ConanOutput(scope=scope).info(f"Decompressing {hs} {os.path.basename(src_path)}")
         with open(src_path, mode='rb') as file_handler:
-            tar_extract(file_handler, dest_folder)
+            tar_extract(file_handler, dest_folder, parallel)
     except Exception as e:
         error_msg = "Error while extracting downloaded file '%s' to %s\n%s\n"\
                     % (src_path, dest_folder, str(e))
@@ -42,6 +42,10 @@ class ClientV2Router:
             query = "?%s" % urlencode(params)
         return self.base_url + "%s%s" % (self.routes.common_search, query)
 
+    def common_latest(self):
+        """URL latest revisions of many references"""
+        return self.base_url + self.routes.common_latest
+
     def search_packages(self, ref):
         """URL search packages for a recipe"""
         route = self.routes.common_search_packages_revision \
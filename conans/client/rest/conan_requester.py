@@ -7,7 +7,7 @@ import platform
 import requests
 import urllib3
 from jinja2 import Template
-from requests.adapters import HTTPAdapter
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
 
 from conans import __version__ as client_version
 from conans.errors import ConanException
@@ -78,7 +78,9 @@ class ConanRequester(object):
         # FIXME: Trick for testing when requests is mocked
         if hasattr(requests, "Session"):
             self._http_requester = requests.Session()
-            adapter = HTTPAdapter(max_retries=self._get_retries(config))
+            # There is one pool of connections per remote host, kept alive for reuse
+            adapter = HTTPAdapter(max_retries=self._get_retries(config),
+                                  pool_maxsize=self._get_pool_maxsize(config))
             self._http_requester.mount("http://", adapter)
             self._http_requester.mount("https://", adapter)
         else:
@@ -92,6 +94,37 @@ class ConanRequester(object):
         self._client_certificates = config.get("core.net.http:client_cert")
         self._clean_system_proxy = config.get("core.net.http:clean_system_proxy", default=False,
                                               check_type=bool)
+        self._keep_alive = config.get("core.net.http:keep_alive", default=True, check_type=bool)
+
+    @staticmethod
+    def _get_pool_maxsize(config):
+        """ By default, enough connections to each remote for all the concurrent threads, so
+        they are not closed and opened again when they don't fit in the pool
+        """
+        pool_maxsize = config.get("core.net.http:pool_maxsize", check_type=int)
+        if pool_maxsize is not None:
+            return pool_maxsize
+        threads = [config.get(conf, default=1, check_type=int)
+                   for conf in ("core.download:parallel", "core.upload:parallel",
+                                "core.graph:parallel")]
+        return max([DEFAULT_POOLSIZE] + threads)
+
+    def connection_stats(self):
+        """ number of opened connections and of requests done with them, the rest of requests
+        reused already opened connections
+        """
+        connections = requests_done = 0
+        adapters = getattr(self._http_requester, "adapters", {})
+        for adapter in set(adapters.values()):
+            managers = [adapter.poolmanager] + list(adapter.proxy_manager.values())
+            for manager in managers:
+                for key in manager.pools.keys():
+                    pool = manager.pools.get(key)
+                    if pool is not None:
+                        connections += pool.num_connections
+                        requests_done += pool.num_requests
+        return {"connections": connections, "requests": requests_done,
+                "reused": requests_done - connections}
 
     @staticmethod
     def _get_retries(config):
@@ -134,6 +167,8 @@ class ConanRequester(object):
             kwargs["timeout"] = self._timeout
         if not kwargs.get("headers"):
             kwargs["headers"] = {}
+        if not self._keep_alive:
+            kwargs["headers"].setdefault("Connection", "close")
 
         self._url_creds.add_auth(url, kwargs)
 
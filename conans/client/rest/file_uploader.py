@@ -1,5 +1,8 @@
+import os
+import re
 import time
 from copy import copy
+from threading import BoundedSemaphore, Lock
 
 from conan.api.output import ConanOutput
 from conans.client.rest import response_to_str
@@ -8,6 +11,60 @@ from conans.errors import AuthenticationException, ConanException, \
 from conans.util.files import sha1sum
 
 
+class _UploadBudget:
+    """ Limits shared by all the uploads of the process, as recipes, packages and files can be
+    uploaded concurrently: the number of simultaneous file transfers ("core.upload:parallel")
+    and the total bandwidth in bytes per second ("core.upload:max_bandwidth")
+    """
+    _lock = Lock()
+    _current = None
+
+    def __init__(self, connections, bandwidth):
+        self.connections = connections
+        self.bandwidth = bandwidth
+        self.semaphore = BoundedSemaphore(connections)
+        self._rate_lock = Lock()
+        self._next_send = 0
+
+    @staticmethod
+    def get(config):
+        connections = config.get("core.upload:parallel", default=1, check_type=int) or 1
+        bandwidth = config.get("core.upload:max_bandwidth", check_type=int)
+        with _UploadBudget._lock:
+            current = _UploadBudget._current
+            if current is None or (current.connections, current.bandwidth) != (connections,
+                                                                                bandwidth):
+                current = _UploadBudget._current = _UploadBudget(connections, bandwidth)
+            return current
+
+    def throttle(self, size):
+        """ waits for the time slot to send the next size bytes without exceeding the bandwidth
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(self._next_send, now)
+            self._next_send = start + size / self.bandwidth
+        if start > now:
+            time.sleep(start - now)
+
+
+class _ThrottledFile:
+    """ file object sent as the body of the request, reading it at the budget bandwidth
+    """
+    def __init__(self, file_handler, size, budget):
+        self._file_handler = file_handler
+        self._size = size
+        self._budget = budget
+
+    def __len__(self):
+        return self._size
+
+    def read(self, size=-1):
+        data = self._file_handler.read(size)
+        self._budget.throttle(len(data))
+        return data
+
+
 class FileUploader(object):
 
     def __init__(self, requester, verify, config):
@@ -15,6 +72,7 @@ class FileUploader(object):
         self._requester = requester
         self._config = config
         self._verify_ssl = verify
+        self._budget = _UploadBudget.get(config)
 
     @staticmethod
     def _handle_400_response(response, auth):
@@ -51,7 +109,10 @@ class FileUploader(object):
         return bool(response.ok)
 
     def upload(self, url, abs_path, auth=None, dedup=False, retry=None, retry_wait=None,
-               headers=None):
+               headers=None, resumable=False):
+        """ resumable: the server supports the uploads in chunks, used for the files bigger than
+        "core.upload:chunk_size", so the retries only send the chunks not received yet
+        """
         retry = retry if retry is not None else self._config.get("core.upload:retry", default=1,
                                                                  check_type=int)
         retry_wait = retry_wait if retry_wait is not None else \
@@ -65,8 +126,13 @@ class FileUploader(object):
             if response:
                 return response
 
+        chunk_size = self._config.get("core.upload:chunk_size", default=32 * 1024 * 1024,
+                                      check_type=int)
+        size = os.path.getsize(abs_path)
         for counter in range(retry + 1):
             try:
+                if resumable and size > chunk_size:
+                    return self._upload_chunks(url, abs_path, headers, auth, size, chunk_size)
                 return self._upload_file(url, abs_path, headers, auth)
             except (NotFoundException, ForbiddenException, AuthenticationException,
                     RequestErrorException):
@@ -81,9 +147,12 @@ class FileUploader(object):
                     time.sleep(retry_wait)
 
     def _upload_file(self, url, abs_path,  headers, auth):
-        with open(abs_path, mode='rb') as file_handler:
+        with self._budget.semaphore, open(abs_path, mode='rb') as file_handler:
+            data = file_handler
+            if self._budget.bandwidth:
+                data = _ThrottledFile(file_handler, os.path.getsize(abs_path), self._budget)
             try:
-                response = self._requester.put(url, data=file_handler, verify=self._verify_ssl,
+                response = self._requester.put(url, data=data, verify=self._verify_ssl,
                                                headers=headers, auth=auth)
                 self._handle_400_response(response, auth)
                 response.raise_for_status()  # Raise HTTPError for bad http response status
@@ -92,3 +161,41 @@ class FileUploader(object):
                 raise
             except Exception as exc:
                 raise ConanException(exc)
+
+    def _upload_chunks(self, url, abs_path, headers, auth, size, chunk_size):
+        """ every chunk is sent with its "Content-Range: bytes start-end/size". The server answers
+        308 with the "Range: bytes=0-last" received so far until the last one, and the first
+        request, with an empty "bytes */size", asks for it to resume a previous failed upload
+        """
+        with self._budget.semaphore, open(abs_path, mode='rb') as file_handler:
+            try:
+                response = self._put_chunk(url, b"", "bytes */%s" % size, headers, auth)
+                while response.status_code == 308:
+                    offset = self._received(response)
+                    file_handler.seek(offset)
+                    chunk = file_handler.read(chunk_size)
+                    if not chunk:
+                        raise ConanException("The server didn't complete the upload of %s"
+                                             % os.path.basename(abs_path))
+                    if self._budget.bandwidth:
+                        self._budget.throttle(len(chunk))
+                    content_range = "bytes %s-%s/%s" % (offset, offset + len(chunk) - 1, size)
+                    response = self._put_chunk(url, chunk, content_range, headers, auth)
+                self._handle_400_response(response, auth)
+                response.raise_for_status()  # Raise HTTPError for bad http response status
+                return response
+            except ConanException:
+                raise
+            except Exception as exc:
+                raise ConanException(exc)
+
+    def _put_chunk(self, url, chunk, content_range, headers, auth):
+        headers = copy(headers)
+        headers["Content-Range"] = content_range
+        return self._requester.put(url, data=chunk, verify=self._verify_ssl, headers=headers,
+                                   auth=auth)
+
+    @staticmethod
+    def _received(response):
+        match = re.match(r"bytes=0-(\d+)$", response.headers.get("Range", ""))
+        return int(match.group(1)) + 1 if match else 0
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import time
+
+from conans.util.files import rmdir
+from conans.util.sha import sha1
+
+
+class ResponseCache:
+    """ JSON responses of the remotes that have an ETag, stored in a folder of the home. When
+    the same URL is requested again, its ETag is sent in the If-None-Match header, and a 304 Not
+    Modified answer reuses the stored response instead of transferring it again.
+    The responses are stored in a subfolder per remote URL, so they are removed with the remote.
+    The ones not validated by the remote in max_age seconds are removed, and only the last
+    validated maxsize ones are kept
+    """
+
+    def __init__(self, folder, max_age=30 * 24 * 3600, maxsize=10000):
+        self._folder = folder
+        self._max_age = max_age
+        self._maxsize = maxsize
+        self._pruned = False
+
+    def _remote_folder(self, remote_url):
+        return os.path.join(self._folder, sha1(remote_url.encode()))
+
+    def _path(self, remote_url, url):
+        return os.path.join(self._remote_folder(remote_url), sha1(url.encode()))
+
+    def get(self, remote_url, url):
+        """ (etag, response) stored for the url, or None """
+        path = self._path(remote_url, url)
+        try:
+            if os.path.getmtime(path) < time.time() - self._max_age:
+                os.unlink(path)
+                return None
+            with open(path) as f:
+                entry = json.load(f)
+            return entry["etag"], entry["response"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def touch(self, remote_url, url):
+        """ the remote validated the stored response, it is the last used one """
+        try:
+            os.utime(self._path(remote_url, url))
+        except OSError:
+            pass
+
+    def set(self, remote_url, url, etag, result):
+        if not self._pruned:  # Once per process, not to list the folder for every response
+            self._pruned = True
+            self._prune()
+        folder = self._remote_folder(remote_url)
+        os.makedirs(folder, exist_ok=True)
+        # Concurrent downloads can store the same url, the last one wins
+        fd, tmp_path = tempfile.mkstemp(dir=folder)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"etag": etag, "response": result}, f)
+            os.replace(tmp_path, self._path(remote_url, url))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def _prune(self):
+        entries = []
+        for root, _, files in os.walk(self._folder):
+            for f in files:
+                path = os.path.join(root, f)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:  # Removed concurrently
+                    pass
+        entries.sort(reverse=True)
+        limit = time.time() - self._max_age
+        for i, (mtime, path) in enumerate(entries):
+            if i >= self._maxsize or mtime < limit:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    def clear(self, remote_url=None):
+        """ removes the stored responses of the remote, or all of them """
+        rmdir(self._remote_folder(remote_url) if remote_url else self._folder)
@@ -1,19 +1,21 @@
-from conans import CHECKSUM_DEPLOY, REVISIONS, OAUTH_TOKEN
+from conans import CHECKSUM_DEPLOY, REVISIONS, OAUTH_TOKEN, BULK_LATEST, RESUMABLE_UPLOADS
+from conans.client.rest.response_cache import ResponseCache
 from conans.client.rest.rest_client_v2 import RestV2Methods
 from conans.errors import AuthenticationException, ConanException
 
 
 class RestApiClientFactory(object):
 
-    def __init__(self, requester, config):
+    def __init__(self, requester, config, responses_folder=None):
         self._requester = requester
         self._config = config
         self._cached_capabilities = {}
+        self._response_cache = ResponseCache(responses_folder) if responses_folder else None
 
     def new(self, remote, token, refresh_token, custom_headers):
         tmp = RestApiClient(remote, token, refresh_token, custom_headers,
                             self._requester, self._config,
-                            self._cached_capabilities)
+                            self._cached_capabilities, self._response_cache)
         return tmp
 
 
@@ -23,7 +25,7 @@ class RestApiClient(object):
     """
 
     def __init__(self, remote, token, refresh_token, custom_headers, requester,
-                 config, cached_capabilities):
+                 config, cached_capabilities, response_cache=None):
 
         # Set to instance
         self._token = token
@@ -37,6 +39,7 @@ class RestApiClient(object):
 
         # This dict is shared for all the instances of RestApiClient
         self._cached_capabilities = cached_capabilities
+        self._response_cache = response_cache
 
     def _capable(self, capability, user=None, password=None):
         capabilities = self._cached_capabilities.get(self._remote_url)
@@ -55,9 +58,10 @@ class RestApiClient(object):
                                  "Conan 2.0 is no longer compatible with "
                                  "remotes that don't accept revisions.")
         checksum_deploy = self._capable(CHECKSUM_DEPLOY)
+        resumable_uploads = self._capable(RESUMABLE_UPLOADS)
         return RestV2Methods(self._remote_url, self._token, self._custom_headers,
                              self._requester, self._config, self._verify_ssl,
-                             checksum_deploy)
+                             checksum_deploy, resumable_uploads, self._response_cache)
 
     def get_recipe(self, ref, dest_folder, metadata, only_metadata):
         return self._get_api().get_recipe(ref, dest_folder, metadata, only_metadata)
@@ -65,8 +69,9 @@ class RestApiClient(object):
     def get_recipe_sources(self, ref, dest_folder):
         return self._get_api().get_recipe_sources(ref, dest_folder)
 
-    def get_package(self, pref, dest_folder, metadata, only_metadata):
-        return self._get_api().get_package(pref, dest_folder, metadata, only_metadata)
+    def get_package(self, pref, dest_folder, metadata, only_metadata, extract_folder=None):
+        return self._get_api().get_package(pref, dest_folder, metadata, only_metadata,
+                                           extract_folder)
 
     def upload_recipe(self, ref, files_to_upload):
         return self._get_api().upload_recipe(ref, files_to_upload)
@@ -129,6 +134,14 @@ class RestApiClient(object):
     def get_latest_package_reference(self, pref, headers):
         return self._get_api().get_latest_package_reference(pref, headers=headers)
 
+    def get_latest_references(self, refs, prefs):
+        """ None if the server cannot return them in a single request, the latest revisions have
+        to be requested one by one then
+        """
+        if not self._capable(BULK_LATEST):
+            return None
+        return self._get_api().get_latest_references(refs, prefs)
+
     def get_recipe_revision_reference(self, ref):
         return self._get_api().get_recipe_revision_reference(ref)
 
@@ -38,13 +38,15 @@ def get_exception_from_error(error_code):
 
 class RestCommonMethods(object):
 
-    def __init__(self, remote_url, token, custom_headers, requester, config, verify_ssl):
+    def __init__(self, remote_url, token, custom_headers, requester, config, verify_ssl,
+                 response_cache=None):
         self.token = token
         self.remote_url = remote_url
         self.custom_headers = custom_headers
         self.requester = requester
         self._config = config
         self.verify_ssl = verify_ssl
+        self._response_cache = response_cache
 
     @property
     def auth(self):
@@ -153,6 +155,7 @@ class RestCommonMethods(object):
     def get_json(self, url, data=None, headers=None):
         req_headers = self.custom_headers.copy()
         req_headers.update(headers or {})
+        cached = None
         if data:  # POST request
             req_headers.update({'Content-type': 'application/json',
                                 'Accept': 'application/json'})
@@ -163,9 +166,16 @@ class RestCommonMethods(object):
                                            data=json.dumps(data))
         else:
             # logger.debug("REST: get: %s" % url)
+            cache = self._response_cache
+            cached = cache.get(self.remote_url, url) if cache else None
+            if cached:
+                req_headers["If-None-Match"] = cached[0]
             response = self.requester.get(url, auth=self.auth, headers=req_headers,
                                           verify=self.verify_ssl,
                                           stream=True)
+            if response.status_code == 304 and cached:  # Not modified, the cached one is valid
+                self._response_cache.touch(self.remote_url, url)
+                return cached[1]
 
         if response.status_code != 200:  # Error message is text
             response.charset = "utf-8"  # To be able to access ret.text (ret.content are bytes)
@@ -183,6 +193,9 @@ class RestCommonMethods(object):
             raise ConanException("Remote responded with broken json: %s" % content)
         if not isinstance(result, dict):
             raise ConanException("Unexpected server response %s" % result)
+        etag = response.headers.get("ETag")
+        if etag and not data and self._response_cache:
+            self._response_cache.set(self.remote_url, url, etag, result)
         return result
 
     def upload_recipe(self, ref, files_to_upload):
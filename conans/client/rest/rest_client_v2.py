@@ -1,17 +1,20 @@
 import copy
 import fnmatch
 import os
+from multiprocessing.pool import ThreadPool
 
 from conan.api.output import ConanOutput
 
 from conans.client.downloaders.caching_file_downloader import ConanInternalCacheDownloader
+from conans.client.downloaders.file_downloader import FileDownloader
 from conans.client.rest.client_routes import ClientV2Router
 from conans.client.rest.file_uploader import FileUploader
 from conans.client.rest.rest_client_common import RestCommonMethods, get_exception_from_error
 from conans.errors import ConanException, NotFoundException, PackageNotFoundException, \
     RecipeNotFoundException, AuthenticationException, ForbiddenException
 from conans.model.package_ref import PkgReference
-from conans.paths import EXPORT_SOURCES_TGZ_NAME
+from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, PACKAGE_TGZ_NAME, \
+    PACKAGE_TZST_NAME
 from conans.util.dates import from_iso8601_to_timestamp
 from conans.util.thread import ExceptionThread
 
@@ -19,11 +22,12 @@ from conans.util.thread import ExceptionThread
 class RestV2Methods(RestCommonMethods):
 
     def __init__(self, remote_url, token, custom_headers, requester, config, verify_ssl,
-                 checksum_deploy=False):
+                 checksum_deploy=False, resumable_uploads=False, response_cache=None):
 
         super(RestV2Methods, self).__init__(remote_url, token, custom_headers, requester,
-                                            config, verify_ssl)
+                                            config, verify_ssl, response_cache)
         self._checksum_deploy = checksum_deploy
+        self._resumable_uploads = resumable_uploads
 
     @property
     def router(self):
@@ -74,18 +78,27 @@ class RestV2Methods(RestCommonMethods):
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
-    def get_package(self, pref, dest_folder, metadata, only_metadata):
+    def get_package(self, pref, dest_folder, metadata, only_metadata, extract_folder=None):
+        """ If extract_folder is defined, the compressed package files are extracted there while
+        downloading, and the returned dict points to extract_folder for them
+        """
         url = self.router.package_snapshot(pref)
         data = self._get_file_list_json(url)
         server_files = data["files"]
         result = {}
         # Download only known files, but not metadata (except sign)
         if not only_metadata:  # Retrieve package first, then metadata
-            accepted_files = ["conaninfo.txt", "conan_package.tgz", "conanmanifest.txt",
-                              "metadata/sign"]
+            accepted_files = ["conaninfo.txt", PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME,
+                              "conanmanifest.txt", "metadata/sign"]
             files = [f for f in server_files if any(f.startswith(m) for m in accepted_files)]
             # If we didn't indicated reference, server got the latest, use absolute now, it's safer
             urls = {fn: self.router.package_file(pref, fn) for fn in files}
+            if extract_folder is not None:
+                for fn in (PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME):
+                    if fn in files:
+                        files.remove(fn)
+                        self._download_and_extract(urls[fn], extract_folder, scope=str(pref.ref))
+                        result[fn] = extract_folder
             self._download_and_save_files(urls, dest_folder, files, scope=str(pref.ref))
             result.update({fn: os.path.join(dest_folder, fn) for fn in files})
 
@@ -136,23 +149,40 @@ class RestV2Methods(RestCommonMethods):
         # conan_package.tgz and conan_export.tgz are uploaded first to avoid uploading conaninfo.txt
         # or conanamanifest.txt with missing files due to a network failure
         output = ConanOutput()
-        for filename in sorted(files):
-            # As the filenames are sorted, the last one is always "conanmanifest.txt"
+
+        def _upload(filename):
             resource_url = urls[filename]
             try:
                 headers = {}
                 uploader.upload(resource_url, files[filename], auth=self.auth,
                                 dedup=self._checksum_deploy,
-                                headers=headers)
+                                headers=headers, resumable=self._resumable_uploads)
             except (AuthenticationException, ForbiddenException):
                 raise
             except Exception as exc:
                 output.error(f"\nError uploading file: {filename}, '{exc}'", error_type="exception")
                 failed.append(filename)
 
+        # The files are uploaded concurrently (each one retried independently by the uploader),
+        # and "conanmanifest.txt" always the last, once the others are in the server
+        filenames = sorted(f for f in files if f != CONAN_MANIFEST)
+        parallel = self._config.get("core.upload:parallel", default=1, check_type=int)
+        if parallel > 1 and len(filenames) > 1:
+            thread_pool = ThreadPool(min(parallel, len(filenames)))
+            try:
+                thread_pool.map(_upload, filenames, chunksize=1)
+            finally:
+                thread_pool.close()
+                thread_pool.join()
+        else:
+            for filename in filenames:
+                _upload(filename)
+        if CONAN_MANIFEST in files:
+            _upload(CONAN_MANIFEST)
+
         if failed:
             raise ConanException("Execute upload again to retry upload the failed files: %s"
-                                 % ", ".join(failed))
+                                 % ", ".join(sorted(failed)))
 
     def _download_and_save_files(self, urls, dest_folder, files, parallel=False, scope=None,
                                  metadata=False):
@@ -183,6 +213,14 @@ class RestV2Methods(RestCommonMethods):
         for t in threads:  # Need to join all before raising errors
             t.raise_errors()
 
+    def _download_and_extract(self, url, dest_folder, scope=None):
+        retry = self._config.get("core.download:retry", check_type=int, default=2)
+        retry_wait = self._config.get("core.download:retry_wait", check_type=int, default=0)
+        parallel = self._config.get("core.download:extract_parallel", check_type=int, default=1)
+        downloader = FileDownloader(self.requester, scope=scope)
+        downloader.download_extract(url, dest_folder, retry=retry, retry_wait=retry_wait,
+                                    verify_ssl=self.verify_ssl, auth=self.auth, parallel=parallel)
+
     def remove_all_packages(self, ref):
         """ Remove all packages from the specified reference"""
         self.check_credentials()
@@ -312,3 +350,27 @@ class RestV2Methods(RestCommonMethods):
         remote_pref.revision = data.get("revision")
         remote_pref.timestamp = from_iso8601_to_timestamp(data.get("time"))
         return remote_pref
+
+    def get_latest_references(self, refs, prefs):
+        """ latest revisions of many recipe and package references in a single request, returns
+        a {ref or pref: latest ref or pref (None if not found)} dict, that doesn't contain the
+        ones that the server couldn't resolve
+        """
+        url = self.router.common_latest()
+        refs = {repr(ref): ref for ref in refs}
+        prefs = {pref.repr_notime(): pref for pref in prefs}
+        data = self.get_json(url, data={"references": list(refs), "packages": list(prefs)})
+        result = {}
+        for requested, items in ((refs, data.get("references", {})),
+                                 (prefs, data.get("packages", {}))):
+            for key, item in items.items():
+                ref = requested.get(key)
+                if ref is None:
+                    continue
+                latest = None
+                if item is not None:
+                    latest = copy.copy(ref)
+                    latest.revision = item.get("revision")
+                    latest.timestamp = from_iso8601_to_timestamp(item.get("time"))
+                result[ref] = latest
+        return result
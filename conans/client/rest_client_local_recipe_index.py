@@ -78,7 +78,7 @@ class RestApiClientLocalRecipesIndex:
         export_sources = self._app.cache.recipe_layout(ref).export_sources()
         return self._copy_files(export_sources, dest_folder)
 
-    def get_package(self, pref, dest_folder, metadata, only_metadata):
+    def get_package(self, pref, dest_folder, metadata, only_metadata, extract_folder=None):
         raise ConanException(f"Remote local-recipes-index '{self._remote.name}' doesn't support "
                              "binary packages")
 
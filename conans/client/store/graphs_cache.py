@@ -0,0 +1,58 @@
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from conans.errors import ConanException
+from conans.util.dates import timestamp_now
+
+GRAPHS_TABLE = "graphs"
+
+
+class GraphsCacheDB:
+    """ Persistent storage of the resolution of dependency graphs (the locked references and the
+    resolved version ranges), indexed by a hash of all the inputs of the graph computation
+    """
+
+    def __init__(self, dbfile):
+        self.dbfile = dbfile
+
+        # Create the database file if it doesn't exist
+        if not os.path.exists(dbfile):
+            par = os.path.dirname(dbfile)
+            os.makedirs(par, exist_ok=True)
+            with self._connect() as connection:
+                try:
+                    connection.execute("create table if not exists %s "
+                                       "(key TEXT NOT NULL, result TEXT NOT NULL, "
+                                       "timestamp REAL NOT NULL, UNIQUE(key))" % GRAPHS_TABLE)
+                except Exception as e:
+                    message = f"Could not initialize graphs cache sqlite database {dbfile}"
+                    raise ConanException(message, e)
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.dbfile, isolation_level=None, timeout=10)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def get(self, key):
+        """ Returns the deserialized result stored for the key, or None """
+        with self._connect() as connection:
+            try:
+                r = connection.execute("SELECT result FROM %s WHERE key=?" % GRAPHS_TABLE, (key,))
+                row = r.fetchone()
+            except Exception as e:
+                raise ConanException(f"Couldn't read graphs cache {self.dbfile}: {e}")
+        return json.loads(row[0]) if row is not None else None
+
+    def store(self, key, result):
+        with self._connect() as connection:
+            try:
+                connection.execute("INSERT OR REPLACE INTO %s (key, result, timestamp) "
+                                   "VALUES (?, ?, ?)" % GRAPHS_TABLE,
+                                   (key, json.dumps(result), timestamp_now()))
+            except Exception as e:
+                raise ConanException(f"Couldn't store in graphs cache {self.dbfile}: {e}")
@@ -0,0 +1,64 @@
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from conans.errors import ConanException
+from conans.util.dates import timestamp_now
+
+REMOTES_QUERIES_TABLE = "remotes_queries"
+
+
+class RemotesCacheDB:
+    """ Persistent storage of the answers of the remotes to queries (version ranges searches,
+    latest revisions), so they can be reused by later Conan processes within a time to live
+    """
+
+    def __init__(self, dbfile):
+        self.dbfile = dbfile
+
+        # Create the database file if it doesn't exist
+        if not os.path.exists(dbfile):
+            par = os.path.dirname(dbfile)
+            os.makedirs(par, exist_ok=True)
+            with self._connect() as connection:
+                try:
+                    connection.execute("create table if not exists %s "
+                                       "(remote_url TEXT NOT NULL, query TEXT NOT NULL, "
+                                       "result TEXT NOT NULL, timestamp REAL NOT NULL, "
+                                       "UNIQUE(remote_url, query))" % REMOTES_QUERIES_TABLE)
+                except Exception as e:
+                    message = f"Could not initialize remotes cache sqlite database {dbfile}"
+                    raise ConanException(message, e)
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.dbfile, isolation_level=None, timeout=10)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def get(self, remote_url, query, ttl):
+        """ Returns the deserialized result of the query, or None if it doesn't exist or it is
+        older than ttl seconds
+        """
+        with self._connect() as connection:
+            try:
+                r = connection.execute("SELECT result, timestamp FROM %s WHERE remote_url=? "
+                                       "AND query=?" % REMOTES_QUERIES_TABLE, (remote_url, query))
+                row = r.fetchone()
+            except Exception as e:
+                raise ConanException(f"Couldn't read remotes cache {self.dbfile}: {e}")
+        if row is None or timestamp_now() - row[1] > ttl:
+            return None
+        return json.loads(row[0])
+
+    def store(self, remote_url, query, result):
+        with self._connect() as connection:
+            try:
+                connection.execute("INSERT OR REPLACE INTO %s (remote_url, query, result, "
+                                   "timestamp) VALUES (?, ?, ?, ?)" % REMOTES_QUERIES_TABLE,
+                                   (remote_url, query, json.dumps(result), timestamp_now()))
+            except Exception as e:
+                raise ConanException(f"Couldn't store in remotes cache {self.dbfile}: {e}")
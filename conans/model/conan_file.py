@@ -1,4 +1,5 @@
 import os
+from io import StringIO
 from pathlib import Path
 
 from conan.api.output import ConanOutput, Color
@@ -331,10 +332,17 @@ class ConanFile:
         assert isinstance(env, list), "env argument to ConanFile.run() should be a list"
         envfiles_folder = self.generators_folder or os.getcwd()
         wrapped_cmd = command_env_wrapper(self, command, env, envfiles_folder=envfiles_folder)
-        from conans.util.runners import conan_run
+        from conans.util.runners import conan_run, ParallelBuildLock
         if not quiet:
             ConanOutput().writeln(f"{self.display_name}: RUN: {command}", fg=Color.BRIGHT_BLUE)
-        retcode = conan_run(wrapped_cmd, cwd=cwd, stdout=stdout, stderr=stderr, shell=shell)
+        # Packages built in parallel capture the output, not to interleave it with other packages
+        captured = StringIO() if stdout is None and stderr is None and ParallelBuildLock.active() \
+            else None
+        retcode = conan_run(wrapped_cmd, cwd=cwd, stdout=stdout or captured,
+                            stderr=stderr or captured, shell=shell)
+        if captured is not None:
+            for line in captured.getvalue().splitlines():
+                self.output.info(line)
         if not quiet:
             ConanOutput().writeln("")
 
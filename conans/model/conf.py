@@ -22,12 +22,26 @@ BUILT_IN_CONFS = {
     "core.version_ranges:resolve_prereleases": "Whether version ranges can resolve to pre-releases or not",
     "core.upload:retry": "Number of retries in case of failure when uploading to Conan server",
     "core.upload:retry_wait": "Seconds to wait between upload attempts to Conan server",
-    "core.upload:parallel": "Number of concurrent threads to upload packages",
+    "core.upload:parallel": "Number of concurrent threads to upload recipes, packages and files, and maximum number of simultaneous file uploads",
+    "core.upload:max_bandwidth": "Maximum total upload bandwidth in bytes per second, shared by all the concurrent uploads",
+    "core.upload:chunk_size": "Size in bytes of the chunks of the resumable uploads of big files to the servers supporting them, retries only send the missing chunks (32MB by default)",
+    "core.upload:compression_format": "The compression format of the uploaded package binaries, 'gzip' (default) or 'zstd' (requires the 'zstandard' Python package)",
     "core.download:parallel": "Number of concurrent threads to download packages",
+    "core.download:pipeline": "Download the binary packages in background while other packages are built, each build only waits for the binaries of its dependencies",
+    "core.build:parallel_packages": "Number of packages of the same level of the graph built concurrently from source, sharing the tools.build:jobs CPU budget (default 1)",
+    "core.build:parallel_keep_going": "Keep building the other packages of the same level when a parallel build fails (default fail-fast)",
+    "core.graph:parallel": "Number of concurrent threads to retrieve recipes and evaluate binaries while computing the graph",
+    "core.graph:bulk_latest": "Request at once to the remotes that support it the latest revisions of the recipes and binaries of the graph (disabled by default)",
+    "core.graph:parallel_remote": "Maximum number of concurrent requests to each remote while evaluating the binaries with core.graph:parallel (no limit by default)",
+    "core.graph:cache": "Reuse the resolved versions and revisions of a previous computation of the same dependency graph, if no recipe changed in the cache (disabled by default)",
     "core.download:retry": "Number of retries in case of failure when downloading from Conan server",
     "core.download:retry_wait": "Seconds to wait between download attempts from Conan server",
     "core.download:download_cache": "Define path to a file download cache",
+    "core.download:extract_parallel": "Number of concurrent threads to write the files of each extracted package",
+    "core.download:stream_extract": "Extract the package binaries while they are downloaded, without storing the compressed files (not used with download_cache or package signing)",
     "core.cache:storage_path": "Absolute path where the packages and database are stored",
+    "core.cache:deduplicate": "Store the files of the downloaded packages only once in the cache, hardlinked from the package folders",
+    "core.cache:remotes_ttl": "Seconds to store and reuse the remotes answers to version ranges searches and latest revisions (disabled by default)",
     # Sources backup
     "core.sources:download_cache": "Folder to store the sources backup",
     "core.sources:download_urls": "List of URLs to download backup sources from",
@@ -48,6 +62,8 @@ BUILT_IN_CONFS = {
     "core.net.http:cacert_path": "Path containing a custom Cacert file",
     "core.net.http:client_cert": "Path or tuple of files containing a client cert (and key)",
     "core.net.http:clean_system_proxy": "If defined, the proxies system env-vars will be discarded",
+    "core.net.http:pool_maxsize": "Maximum number of connections kept alive to each remote (by default the max of 10 and the core.download/core.upload/core.graph 'parallel' confs)",
+    "core.net.http:keep_alive": "Keep the connections to the servers alive to reuse them (default True)",
     # Gzip compression
     "core.gzip:compresslevel": "The Gzip compression level for Conan artifacts (default=9)",
     # Excluded from revision_mode = "scm" dirty and Git().is_dirty() checks
@@ -1,7 +1,11 @@
+import json
 import os
+import time
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 
-from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
+from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, \
+    PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME
 from conans.util.dates import timestamp_now, timestamp_to_str
 from conans.util.files import load, md5, md5sum, save, gather_files
 
@@ -85,29 +89,25 @@ class FileTreeManifest(object):
                 output.info("%s %d '%s' %s%s" % (suffix, len(files), ext, file_or_files, files_str))
 
     @classmethod
-    def create(cls, folder, exports_sources_folder=None):
+    def create(cls, folder, exports_sources_folder=None, stat_cache=None):
         """ Walks a folder and create a FileTreeManifest for it, reading file contents
         from disk, and capturing current time
+        :param stat_cache: optional json file path to store the md5 of the files, so the
+            unchanged files (same size, mtime, ctime and inode) are not hashed again later
         """
         files, _ = gather_files(folder)
         # The folders symlinks are discarded for the manifest
-        for f in (PACKAGE_TGZ_NAME, EXPORT_TGZ_NAME, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME):
+        for f in (PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME, EXPORT_TGZ_NAME, CONAN_MANIFEST,
+                  EXPORT_SOURCES_TGZ_NAME):
             files.pop(f, None)
 
-        file_dict = {}
-        for name, filepath in files.items():
-            # For a symlink: md5 of the pointing path, no matter if broken, relative or absolute.
-            value = md5(os.readlink(filepath)) if os.path.islink(filepath) else md5sum(filepath)
-            file_dict[name] = value
-
         if exports_sources_folder:
             export_files, _ = gather_files(exports_sources_folder)
             # The folders symlinks are discarded for the manifest
-            for name, filepath in export_files.items():
-                # For a symlink: md5 of the pointing path, no matter if broken, relative or absolute.
-                value = md5(os.readlink(filepath)) if os.path.islink(filepath) else md5sum(filepath)
-                file_dict["export_source/%s" % name] = value
+            files.update({"export_source/%s" % name: filepath
+                          for name, filepath in export_files.items()})
 
+        file_dict = _FileHashes(stat_cache).compute(files)
         date = timestamp_now()
 
         return cls(date, file_dict)
@@ -128,3 +128,66 @@ class FileTreeManifest(object):
             if h != h2:
                 result[f] = h2, h
         return result
+
+
+class _FileHashes:
+    """ Computes the md5 of files, reusing the ones stored in a stat_cache json file when the
+    file stat didn't change, and hashing the rest concurrently
+    """
+    _RACY_SECONDS = 2  # Files modified so recently could change without a visible stat change
+
+    def __init__(self, stat_cache):
+        self._stat_cache = stat_cache
+
+    def _load(self):
+        try:
+            return json.loads(load(self._stat_cache))
+        except Exception:  # Missing or corrupted, it will be fully recomputed
+            return {}
+
+    @staticmethod
+    def _md5(filepath):
+        # For a symlink: md5 of the pointing path, no matter if broken, relative or absolute.
+        return md5(os.readlink(filepath)) if os.path.islink(filepath) else md5sum(filepath)
+
+    def compute(self, files):
+        if self._stat_cache is None:
+            return {name: self._md5(filepath) for name, filepath in files.items()}
+
+        cached = self._load()
+        result = {}
+        new_cache = {}
+        to_hash = []
+        for name, filepath in files.items():
+            st = os.lstat(filepath)
+            key = [st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino]
+            entry = cached.get(name)
+            if entry is not None and entry[:4] == key:
+                result[name] = entry[4]
+                new_cache[name] = entry
+            else:
+                to_hash.append((name, filepath, key))
+
+        parallel = min(len(to_hash), os.cpu_count() or 1, 8)
+        if parallel > 1:
+            thread_pool = ThreadPool(parallel)
+            try:
+                hashes = thread_pool.map(self._md5, [filepath for _, filepath, _ in to_hash])
+            finally:
+                thread_pool.close()
+                thread_pool.join()
+        else:
+            hashes = [self._md5(filepath) for _, filepath, _ in to_hash]
+
+        racy_ns = (time.time() - self._RACY_SECONDS) * 1e9
+        for (name, _, key), h in zip(to_hash, hashes):
+            result[name] = h
+            if max(key[1], key[2]) < racy_ns:
+                new_cache[name] = key + [h]
+
+        if new_cache != cached:
+            try:
+                save(self._stat_cache, json.dumps(new_cache))
+            except OSError:  # A read-only cache can still be checked
+                pass
+        return result
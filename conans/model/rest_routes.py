@@ -1,6 +1,7 @@
 class RestRoutes(object):
     ping = "ping"
     common_search = "conans/search"
+    common_latest = "conans/latest"
     common_authenticate = "users/authenticate"
     oauth_authenticate = "users/token"
     common_check_credentials = "users/check_credentials"
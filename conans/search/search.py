@@ -5,25 +5,27 @@ from fnmatch import translate
 from typing import Dict
 
 from conans.errors import ConanException
-from conans.model.info import load_binary_info
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
 from conans.paths import CONANINFO
-from conans.search.query_parse import evaluate_postfix, infix_to_postfix
-from conans.util.files import load
+from conans.search.query_parse import evaluate_postfix, infix_to_postfix, is_operator
+
+
+def _parse_query(query):
+    if "!" in query:
+        raise ConanException("'!' character is not allowed")
+    if "~" in query:
+        raise ConanException("'~' character is not allowed")
+    if " not " in query or query.startswith("not "):
+        raise ConanException("'not' operator is not allowed")
+    return infix_to_postfix(query) if query else []
 
 
 def filter_packages(query, results: Dict[PkgReference, dict]):
     if query is None:
         return results
     try:
-        if "!" in query:
-            raise ConanException("'!' character is not allowed")
-        if "~" in query:
-            raise ConanException("'~' character is not allowed")
-        if " not " in query or query.startswith("not "):
-            raise ConanException("'not' operator is not allowed")
-        postfix = infix_to_postfix(query) if query else []
+        postfix = _parse_query(query)
         result = OrderedDict()
         for pref, data in results.items():
             if _evaluate_postfix_with_info(postfix, data):
@@ -40,13 +42,17 @@ def _evaluate_postfix_with_info(postfix, binary_info):
     def evaluate_info(expression):
         """Receives an expression like compiler.version="12"
         Uses conan_vars_info in the closure to evaluate it"""
-        name, value = expression.split("=", 1)
-        value = value.replace("\"", "")
+        name, value = _split_expression(expression)
         return _evaluate(name, value, binary_info)
 
     return evaluate_postfix(postfix, evaluate_info)
 
 
+def _split_expression(expression):
+    name, value = expression.split("=", 1)
+    return name, value.replace("\"", "")
+
+
 def _evaluate(prop_name, prop_value, binary_info):
     """
     Evaluates a single prop_name, prop_value like "os", "Windows" against
@@ -69,21 +75,24 @@ def _evaluate(prop_name, prop_value, binary_info):
 
 def search_recipes(cache, pattern=None, ignorecase=True):
     # Conan references in main storage
-    if pattern:
-        if isinstance(pattern, RecipeReference):
-            pattern = repr(pattern)
-        pattern = translate(pattern)
-        pattern = re.compile(pattern, re.IGNORECASE) if ignorecase else re.compile(pattern)
-
-    refs = cache.all_refs()
-    if pattern:
-        _refs = []
-        for r in refs:
-            match_ref = str(r) if not r.revision else repr(r)
-            if _partial_match(pattern, match_ref):
-                _refs.append(r)
-        refs = _refs
-    return refs
+    if not pattern:
+        return cache.all_refs()
+    if isinstance(pattern, RecipeReference):
+        pattern = repr(pattern)
+    # The cache database only returns the references starting with the literal prefix of the
+    # pattern, if that is all the pattern checks, the partial match is not needed
+    prefix = re.split(r"[*?\[#]", pattern, 1)[0]
+    refs = cache.all_refs(prefix, ignorecase)
+    if pattern == prefix + "*" and not (ignorecase and re.search(r"[%_]", prefix)):
+        return refs
+    pattern = translate(pattern)
+    pattern = re.compile(pattern, re.IGNORECASE) if ignorecase else re.compile(pattern)
+    _refs = []
+    for r in refs:
+        match_ref = str(r) if not r.revision else repr(r)
+        if _partial_match(pattern, match_ref):
+            _refs.append(r)
+    return _refs
 
 
 def _partial_match(pattern, reference):
@@ -98,33 +107,47 @@ def _partial_match(pattern, reference):
             partial += i
             yield partial
 
-    return any(map(pattern.match, list(partial_sums(tokens))))
+    return any(map(pattern.match, partial_sums(tokens)))
 
 
-def get_cache_packages_binary_info(cache, prefs) -> Dict[PkgReference, dict]:
+def get_cache_packages_binary_info(cache, prefs, query=None) -> Dict[PkgReference, dict]:
     """
-    param package_layout: Layout for the given reference
+    The binary info of the latest revisions of the given packages, from the cache database.
+    The packages that are not there yet, like the ones created by previous Conan versions, are
+    loaded from their conaninfo.txt and stored. With a package query, the packages are filtered
+    in the database and only the matching ones are returned
     """
+    postfix = None
+    if query is not None:
+        try:
+            postfix = _parse_query(query)
+            evaluate_postfix(postfix, lambda _: True)  # Only to validate it
+            # The expressions like compiler.version="12" as (name, value) tuples for the database
+            postfix = [el if is_operator(el) else _split_expression(el) for el in postfix]
+        except Exception as exc:
+            raise ConanException("Invalid package query: %s. %s" % (query, exc))
+
+    latest_prefs = OrderedDict()  # {ref: [latest prefs]}, grouped to query the DB once per ref
+    for pref in prefs:
+        # The package references already with a revision come from the latest ones in the cache
+        latest_prev = pref if pref.revision else cache.get_latest_package_reference(pref)
+        latest_prefs.setdefault(latest_prev.ref, []).append(latest_prev)
 
     result = OrderedDict()
-
-    package_layouts = []
-    for pref in prefs:
-        latest_prev = cache.get_latest_package_reference(pref)
-        package_layouts.append(cache.pkg_layout(latest_prev))
-
-    for pkg_layout in package_layouts:
-        # Read conaninfo
-        info_path = os.path.join(pkg_layout.package(), CONANINFO)
-        if not os.path.exists(info_path):
-            raise ConanException(f"Corrupted package '{pkg_layout.reference}' "
-                                 f"without conaninfo.txt in: {info_path}")
-        conan_info_content = load(info_path)
-
-        info = load_binary_info(conan_info_content)
-        pref = pkg_layout.reference
-        # The key shoudln't have the latest package revision, we are asking for package configs
-        pref.revision = None
-        result[pkg_layout.reference] = info
+    for ref, ref_prefs in latest_prefs.items():
+        stored = cache.get_packages_info_stored(ref)
+        for pref in ref_prefs:
+            if (pref.package_id, pref.revision) not in stored:
+                pkg_layout = cache.pkg_layout(pref)
+                if cache.store_package_info(pkg_layout) is None:
+                    info_path = os.path.join(pkg_layout.package(), CONANINFO)
+                    raise ConanException(f"Corrupted package '{pkg_layout.reference}' "
+                                         f"without conaninfo.txt in: {info_path}")
+        infos = cache.get_packages_info(ref, postfix or None)
+        for pref in ref_prefs:
+            info = infos.get((pref.package_id, pref.revision))
+            if info is not None:
+                # The key shouldn't have the latest package revision, we are asking for configs
+                result[PkgReference(pref.ref, pref.package_id, timestamp=pref.timestamp)] = info
 
     return result
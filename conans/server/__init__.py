@@ -1,5 +1,8 @@
-from conans import REVISIONS
+from conans import REVISIONS, BULK_LATEST, RESUMABLE_UPLOADS
 
 COMPLEX_SEARCH_CAPABILITY = "complex_search"
 
-SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]  # Server is always with revisions
+SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY,
+                       REVISIONS,  # Server is always with revisions
+                       BULK_LATEST,
+                       RESUMABLE_UPLOADS]
@@ -47,6 +47,8 @@ class ConanServerConfigParser(ConfigParser):
                            "ssl_enabled": get_env("CONAN_SSL_ENABLED", None, environment),
                            "port": get_env("CONAN_SERVER_PORT", None, environment),
                            "public_port": get_env("CONAN_SERVER_PUBLIC_PORT", None, environment),
+                           "workers": get_env("CONAN_SERVER_WORKERS", None, environment),
+                           "threads": get_env("CONAN_SERVER_THREADS", None, environment),
                            "host_name": get_env("CONAN_HOST_NAME", None, environment),
                            "custom_authenticator": get_env("CONAN_CUSTOM_AUTHENTICATOR", None, environment),
                            "custom_authorizer": get_env("CONAN_CUSTOM_AUTHORIZER", None, environment),
@@ -100,6 +102,28 @@ class ConanServerConfigParser(ConfigParser):
         except ConanException:
             return self.port
 
+    def _get_conf_server_count(self, keyname):
+        try:
+            value = self._get_conf_server_string(keyname)
+        except ConanException:  # Not defined in old server.conf files
+            return 1
+        try:
+            count = int(value)
+        except ValueError:
+            count = 0
+        if count < 1:
+            raise ConanException("'server.%s' must be a positive integer, got '%s'"
+                                 % (keyname, value))
+        return count
+
+    @property
+    def workers(self):
+        return self._get_conf_server_count("workers")
+
+    @property
+    def threads(self):
+        return self._get_conf_server_count("threads")
+
     @property
     def host_name(self):
         try:
@@ -11,11 +11,18 @@ port: 9300
 public_port:
 host_name: localhost
 
+# Number of worker processes and of threads per process serving the requests. More than one
+# worker process requires 'pip install gunicorn' (not available in Windows)
+workers: 1
+threads: 8
+
 # Authorize timeout are seconds the client has to upload/download files until authorization expires
 authorize_timeout: 1800
 
 # Just for disk storage adapter
 # updown_secret is the key used to generate the upload/download authorization token
+# The incomplete uploads are stored in the '.uploads' folder of the disk_storage_path, and the
+# ones that don't receive data for a day are removed when a new upload starts
 disk_storage_path: ./data
 disk_authorize_timeout: 1800
 updown_secret: {updown_secret}
@@ -16,10 +16,11 @@ from conans.server.service.authorize import BasicAuthorizer, BasicAuthenticator
 
 
 class ServerLauncher(object):
-    def __init__(self, force_migration=False, server_dir=None):
+    def __init__(self, force_migration=False, server_dir=None, rebuild_index=False):
         if sys.version_info.major == 2:
             raise Exception("The conan_server needs Python>=3 for running")
         self.force_migration = force_migration
+        self.rebuild_index = rebuild_index
         if server_dir:
             user_folder = server_folder = server_dir
         else:
@@ -46,21 +47,28 @@ class ServerLauncher(object):
                                                     server_config.jwt_expire_time)
 
         server_store = get_server_store(server_config.disk_storage_path, server_config.public_url)
+        if rebuild_index:
+            recipes, packages = server_store.rebuild_index()
+            print("Indexed %s recipe revisions and %s package revisions of %s"
+                  % (recipes, packages, server_config.disk_storage_path))
 
         server_capabilities = SERVER_CAPABILITIES
         server_capabilities.append(REVISIONS)
 
+        self.workers = server_config.workers
+        self.threads = server_config.threads
         self.server = ConanServer(server_config.port, credentials_manager,
                                   authorizer, authenticator, server_store,
                                   server_capabilities)
-        if not self.force_migration:
+        if not self.force_migration and not self.rebuild_index:
             print("***********************")
             print("Using config: %s" % server_config.config_filename)
             print("Storage: %s" % server_config.disk_storage_path)
             print("Public URL: %s" % server_config.public_url)
             print("PORT: %s" % server_config.port)
+            print("Workers: %s, threads: %s" % (self.workers, self.threads))
             print("***********************")
 
     def launch(self):
-        if not self.force_migration:
-            self.server.run(host="0.0.0.0")
+        if not self.force_migration and not self.rebuild_index:
+            self.server.run(host="0.0.0.0", workers=self.workers, threads=self.threads)
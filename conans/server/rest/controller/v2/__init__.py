@@ -1,3 +1,8 @@
+import hashlib
+import json
+
+from bottle import HTTPResponse, request, response
+
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
 
@@ -5,3 +10,16 @@ from conans.model.recipe_ref import RecipeReference
 def get_package_ref(name, version, username, channel, package_id, revision, p_revision):
     ref = RecipeReference(name, version, username, channel, revision)
     return PkgReference(ref, package_id, p_revision)
+
+
+def etag_response(data):
+    """ returns the JSON data with a weak ETag computed from its contents, or raises a 304 Not
+    Modified if the request If-None-Match has it, so the clients don't receive it again
+    """
+    content = json.dumps(data, sort_keys=True).encode()
+    etag = 'W/"%s"' % hashlib.sha1(content).hexdigest()
+    if_none_match = request.headers.get("If-None-Match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        raise HTTPResponse(status=304, headers={"ETag": etag})
+    response.set_header("ETag", etag)
+    return data
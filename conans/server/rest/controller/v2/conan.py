@@ -3,7 +3,7 @@ from bottle import request
 from conans.errors import NotFoundException
 from conans.model.recipe_ref import RecipeReference
 from conans.server.rest.bottle_routes import BottleRoutes
-from conans.server.rest.controller.v2 import get_package_ref
+from conans.server.rest.controller.v2 import etag_response, get_package_ref
 from conans.server.service.v2.service_v2 import ConanServiceV2
 
 
@@ -21,7 +21,7 @@ class ConanControllerV2(object):
             pref = get_package_ref(name, version, username, channel, package_id,
                                    revision, p_revision)
             ret = conan_service.get_package_file_list(pref, auth_user)
-            return ret
+            return etag_response(ret)
 
         @app.route(r.package_revision_file, method=["GET"])
         def get_package_file(name, version, username, channel, package_id, the_path, auth_user,
@@ -46,7 +46,7 @@ class ConanControllerV2(object):
         def get_recipe_file_list(name, version, username, channel, auth_user, revision):
             ref = RecipeReference(name, version, username, channel, revision)
             ret = conan_service.get_recipe_file_list(ref, auth_user)
-            return ret
+            return etag_response(ret)
 
         @app.route(r.recipe_revision_file, method=["GET"])
         def get_recipe_file(name, version, username, channel, the_path, auth_user, revision):
@@ -1,6 +1,10 @@
+from bottle import request
+
+from conans.errors import ConanException, NotFoundException
+from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
 from conans.server.rest.bottle_routes import BottleRoutes
-from conans.server.rest.controller.v2 import get_package_ref
+from conans.server.rest.controller.v2 import etag_response, get_package_ref
 from conans.server.service.v2.service_v2 import ConanServiceV2
 from conans.util.dates import from_timestamp_to_iso8601
 
@@ -30,7 +34,7 @@ class RevisionsController(object):
             conan_reference = RecipeReference(name, version, username, channel)
             conan_service = ConanServiceV2(app.authorizer, app.server_store)
             rev = conan_service.get_latest_revision(conan_reference, auth_user)
-            return _format_rev_return(rev)
+            return etag_response(_format_rev_return(rev))
 
         @app.route(r.package_revisions, method="GET")
         def get_package_revisions_references(name, version, username, channel, package_id, auth_user,
@@ -51,7 +55,44 @@ class RevisionsController(object):
                                                 revision, p_revision=None)
             conan_service = ConanServiceV2(app.authorizer, app.server_store)
             pref = conan_service.get_latest_package_reference(package_reference, auth_user)
-            return _format_pref_return(pref)
+            return etag_response(_format_pref_return(pref))
+
+        @app.route(r.common_latest, method="POST")
+        def get_latest_references(auth_user):
+            """ Gets a JSON with the latest revisions of the "references" (without revision) and
+            "packages" (with recipe revision, without package revision) of the request. The not
+            found ones are null, the ones that fail otherwise (permissions) are not returned, so
+            the client can request them individually and get the error
+            """
+            conan_service = ConanServiceV2(app.authorizer, app.server_store)
+            data = request.json or {}
+            references = {}
+            for r in data.get("references", []):
+                ref = RecipeReference.loads(r)
+                ref = RecipeReference(ref.name, ref.version, ref.user or "_", ref.channel or "_")
+                try:
+                    rev = conan_service.get_latest_revision(ref, auth_user)
+                except NotFoundException:
+                    references[r] = None
+                except ConanException:
+                    pass
+                else:
+                    references[r] = _format_rev_return(rev)
+            packages = {}
+            for p in data.get("packages", []):
+                pref = PkgReference.loads(p)
+                ref = pref.ref
+                pref = get_package_ref(ref.name, ref.version, ref.user or "_", ref.channel or "_",
+                                       pref.package_id, ref.revision, p_revision=None)
+                try:
+                    pref = conan_service.get_latest_package_reference(pref, auth_user)
+                except NotFoundException:
+                    packages[p] = None
+                except ConanException:
+                    pass
+                else:
+                    packages[p] = _format_pref_return(pref)
+            return {"references": references, "packages": packages}
 
 
 def _format_rev_return(rev):
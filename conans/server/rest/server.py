@@ -3,6 +3,7 @@ from bottle import Bottle
 
 from conans.server.rest.api_v2 import ApiV2
 from conans.server.rest.controller.v2.ping import PingController
+from conans.server.rest.wsgi import GunicornServerAdapter, ThreadedServerAdapter
 
 
 class ConanServer(object):
@@ -45,8 +46,15 @@ class ConanServer(object):
         self.root_app.mount("/v1/", ping_v1)
 
     def run(self, **kwargs):
+        """ Serves the application, with 'workers' processes (it requires gunicorn if more than
+        one) with 'threads' threads each
+        """
         port = kwargs.pop("port", self.run_port)
         debug_set = kwargs.pop("debug", False)
         host = kwargs.pop("host", "localhost")
-        bottle.Bottle.run(self.root_app, host=host,
-                          port=port, debug=debug_set, reloader=False)
+        workers = kwargs.pop("workers", 1)
+        threads = kwargs.pop("threads", 1)
+        adapter = GunicornServerAdapter if workers > 1 else ThreadedServerAdapter
+        server = adapter(host=host, port=port, workers=workers, threads=threads)
+        bottle.Bottle.run(self.root_app, server=server, debug=debug_set, reloader=False,
+                          **kwargs)
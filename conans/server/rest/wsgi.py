@@ -0,0 +1,134 @@
+import os
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import ServerHandler, WSGIRequestHandler, WSGIServer, make_server
+
+import bottle
+
+from conans.errors import ConanException
+
+
+class _SendfileHandler(ServerHandler):
+    """ Sends the files returned by the application, as the package and recipe files downloaded
+    by bottle.static_file(), from the file to the socket with os.sendfile(), without copying
+    them to user space in chunks
+    """
+
+    def sendfile(self):
+        sock = self.request_handler.connection
+        if not hasattr(os, "sendfile") or isinstance(sock, ssl.SSLSocket):
+            return False
+        try:
+            fileno = self.result.filelike.fileno()
+            offset = self.result.filelike.tell()
+        except (AttributeError, OSError, ValueError):
+            return False
+        if not self.headers_sent:
+            self.send_headers()
+        self._flush()
+        remaining = os.fstat(fileno).st_size - offset
+        while remaining > 0:
+            sent = os.sendfile(sock.fileno(), fileno, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+            self.bytes_sent += sent
+        return True
+
+
+class _RequestHandler(WSGIRequestHandler):
+    def handle(self):
+        self.raw_requestline = self.rfile.readline(65537)
+        if len(self.raw_requestline) > 65536:
+            self.requestline = ''
+            self.request_version = ''
+            self.command = ''
+            self.send_error(414)
+            return
+
+        if not self.parse_request():  # An error code has been sent, just exit
+            return
+
+        handler = _SendfileHandler(self.rfile, self.wfile, self.get_stderr(), self.get_environ(),
+                                   multithread=self.server.threads > 1)
+        handler.request_handler = self  # backpointer for logging
+        handler.run(self.server.get_app())
+
+    def log_request(self, *args, **kwargs):
+        if not self.server.quiet:
+            super().log_request(*args, **kwargs)
+
+    def address_string(self):  # Avoid the DNS lookups of every logged request
+        return self.client_address[0]
+
+
+class _ThreadPoolWSGIServer(ThreadingMixIn, WSGIServer):
+    """ Serves every connection in one of the threads of a fixed size pool, so a slow client
+    downloading a big package doesn't block the other ones, but the number of threads is bounded
+    """
+    daemon_threads = True
+    threads = 1
+    quiet = False
+    _executor = None
+
+    def process_request(self, request, client_address):
+        if self.threads <= 1:
+            return WSGIServer.process_request(self, request, client_address)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.threads, thread_name_prefix="conan_server")
+        self._executor.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+class ThreadedServerAdapter(bottle.ServerAdapter):
+    """ bottle adapter of the builtin server, a wsgiref one with a pool of 'threads' """
+
+    def run(self, app):
+        class Server(_ThreadPoolWSGIServer):
+            threads = self.options.get("threads", 1)
+            quiet = self.quiet
+            request_queue_size = max(5, 2 * threads)
+
+        server = make_server(self.host, self.port, app, Server, _RequestHandler)
+        self.port = server.server_port  # Resolve the port 0 to the one actually bound
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+
+class GunicornServerAdapter(bottle.ServerAdapter):
+    """ bottle adapter of gunicorn, to serve with several worker processes, each one with a pool
+    of 'threads'. gunicorn is an optional dependency, only needed for this mode
+    """
+
+    def run(self, app):
+        try:
+            from gunicorn.app.base import BaseApplication
+        except ImportError:
+            raise ConanException("The conan_server needs 'gunicorn' to run with more than one "
+                                 "worker process: 'pip install gunicorn'")
+
+        config = {"bind": "%s:%d" % (self.host, int(self.port)),
+                  "workers": self.options.get("workers", 1),
+                  "threads": self.options.get("threads", 1),
+                  # Uploads and downloads of big packages can take long
+                  "timeout": self.options.get("timeout", 1800)}
+        if self.quiet:
+            config["loglevel"] = "warning"
+
+        class Application(BaseApplication):
+            def load_config(self):
+                for key, value in config.items():
+                    self.cfg.set(key, value)
+
+            def load(self):
+                return app
+
+        Application().run()
@@ -4,34 +4,16 @@ import re
 from fnmatch import translate
 
 from conans.errors import ForbiddenException, RecipeNotFoundException
-from conans.model.package_ref import PkgReference
-from conans.model.recipe_ref import RecipeReference
-from conans.paths import CONANINFO
 from conans.search.search import _partial_match
-from conans.server.utils.files import list_folder_subdirs
-from conans.util.files import load
 
 
 def _get_local_infos_min(server_store, ref):
     result = {}
-    new_ref = ref
-    subdirs = list_folder_subdirs(server_store.packages(new_ref), level=1)
-    for package_id in subdirs:
-        if package_id in result:
-            continue
-        # Read conaninfo
-        pref = PkgReference(new_ref, package_id)
-        revision_entry = server_store.get_last_package_revision(pref)
-        if not revision_entry:
-            continue  # server can store empty package-revision list files
-        pref.revision = revision_entry.revision
-        info_path = os.path.join(server_store.package(pref), CONANINFO)
-        if not os.path.exists(info_path):
+    for package_id, (pref, content) in server_store.get_packages_infos(ref).items():
+        if content is None:
             raise Exception(f"No conaninfo.txt file for listed {pref}")
-        content = load(info_path)
         # From Conan 1.48 the conaninfo.txt is sent raw.
         result[package_id] = {"content": content}
-
     return result
 
 
@@ -70,33 +52,15 @@ class SearchService(object):
         return info
 
     def _search_recipes(self, pattern=None, ignorecase=True):
-        subdirs = list_folder_subdirs(basedir=self._server_store.store, level=5)
-
-        def underscore_to_none(field):
-            return field if field != "_" else None
-
+        refs = self._server_store.search_references()
         if not pattern:
-            ret = []
-            for folder in subdirs:
-                fields_dir = [underscore_to_none(d) for d in folder.split("/")]
-                r = RecipeReference(*fields_dir)
-                r.revision = None
-                ret.append(r)
-            return sorted(ret)
+            return sorted(refs)
         else:
             # Conan references in main storage
             pattern = str(pattern)
             b_pattern = translate(pattern)
             b_pattern = re.compile(b_pattern, re.IGNORECASE) if ignorecase else re.compile(b_pattern)
-            ret = set()
-            for subdir in subdirs:
-                fields_dir = [underscore_to_none(d) for d in subdir.split("/")]
-                new_ref = RecipeReference(*fields_dir)
-                new_ref.revision = None
-                if _partial_match(b_pattern, repr(new_ref)):
-                    ret.add(new_ref)
-
-            return sorted(ret)
+            return sorted(r for r in refs if _partial_match(b_pattern, repr(r)))
 
     def search(self, pattern=None, ignorecase=True):
         """ Get all the info about any package
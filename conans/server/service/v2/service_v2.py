@@ -1,14 +1,17 @@
 import copy
 import os
+import re
+import tempfile
 
-from bottle import FileUpload, static_file
+from bottle import FileUpload, HTTPResponse, static_file
 
-from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException
+from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException, \
+    RequestErrorException
 from conans.paths import CONAN_MANIFEST
 from conans.model.package_ref import PkgReference
 from conans.server.service.mime import get_mime_type
 from conans.server.store.server_store import ServerStore
-from conans.util.files import mkdir
+from conans.util.files import mkdir, sha1sum
 
 
 class ConanServiceV2:
@@ -34,14 +37,14 @@ class ConanServiceV2:
     def get_recipe_file(self, reference, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, reference)
         path = self._server_store.get_recipe_file_path(reference, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return self._get_file(path)
 
     def upload_recipe_file(self, body, headers, reference, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, reference)
         # FIXME: Check that reference contains revision (MANDATORY TO UPLOAD)
         path = self._server_store.get_recipe_file_path(reference, filename)
         self._upload_to_path(body, headers, path)
+        self._server_store.recipe_files_changed(reference)
 
         # If the upload was ok, of the manifest, update the pointer to the latest
         if filename == CONAN_MANIFEST:
@@ -93,8 +96,7 @@ class ConanServiceV2:
     def get_package_file(self, pref, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return self._get_file(path)
 
     def upload_package_file(self, body, headers, pref, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, pref.ref)
@@ -105,22 +107,93 @@ class ConanServiceV2:
             raise RecipeNotFoundException(pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
         self._upload_to_path(body, headers, path)
+        self._server_store.package_files_changed(pref)
 
         # If the upload was ok, of the manifest, update the pointer to the latest
         if filename == CONAN_MANIFEST:
             self._server_store.update_last_package_revision(pref)
 
     # Misc
+    def _get_file(self, path):
+        """ the whole files are sent with their "X-Checksum-Sha1", so the clients extracting them
+        while they are downloaded can check them
+        """
+        response = static_file(os.path.basename(path), root=os.path.dirname(path),
+                               mimetype=get_mime_type(path))
+        if response.status_code == 200:
+            response.set_header("X-Checksum-Sha1", self._server_store.get_file_sha1(path))
+        return response
+
+    def _upload_to_path(self, body, headers, path):
+        """ The file is received in a temporary file, and moved to 'path' when complete, so
+        a failed upload never leaves a truncated file in the revision
+        """
+        content_range = headers.get("Content-Range")
+        if content_range:
+            return self._upload_chunk(body, headers, path, content_range)
+        uploads_folder = os.path.dirname(self._server_store.get_partial_upload_path(path))
+        mkdir(uploads_folder)
+        fd, tmp_path = tempfile.mkstemp(dir=uploads_folder)
+        os.close(fd)
+        try:
+            file_saver = FileUpload(body, None, filename=os.path.basename(path), headers=headers)
+            file_saver.save(tmp_path, overwrite=True)
+            self._commit_upload(tmp_path, headers, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def _upload_chunk(self, body, headers, path, content_range):
+        """ Resumable uploads: the body is the 'bytes start-end/total' of the file, appended to
+        the ones already received (a repeated chunk overwrites them from 'start'). An empty
+        'bytes */total' asks what has been received. While incomplete, the answer is a 308 with
+        the received 'Range: bytes=0-last', and the last chunk moves the file to 'path'
+        """
+        match = re.match(r"bytes (?:(\d+)-(\d+)|\*)/(\d+)$", content_range.strip())
+        if not match:
+            raise RequestErrorException("Invalid Content-Range header '%s'" % content_range)
+        total = int(match.group(3))
+        partial_path = self._server_store.get_partial_upload_path(path)
+        received = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+        if match.group(1) is not None:
+            start, end = int(match.group(1)), int(match.group(2))
+            if start > received or end < start or end >= total:
+                raise RequestErrorException("Invalid Content-Range '%s', %s bytes received"
+                                            % (content_range, received))
+            if not received:  # A new upload, time to remove the abandoned ones
+                self._server_store.remove_stale_uploads()
+            mkdir(os.path.dirname(partial_path))
+            with open(partial_path, "r+b" if received else "wb") as f:
+                f.seek(start)
+                f.truncate()
+                remaining = end + 1 - start
+                while remaining:
+                    data = body.read(min(remaining, 1024 * 1024))
+                    if not data:  # Interrupted, the next chunk continues from here
+                        break
+                    f.write(data)
+                    remaining -= len(data)
+                if body.read(1):
+                    f.truncate(start)  # The whole chunk is rejected
+                    raise RequestErrorException("The chunk is bigger than its Content-Range '%s'"
+                                                % content_range)
+                received = f.tell()
+        if received < total:
+            response = HTTPResponse(status=308)
+            if received:
+                response.set_header("Range", "bytes=0-%s" % (received - 1))
+            raise response
+        self._commit_upload(partial_path, headers, path)
+
     @staticmethod
-    def _upload_to_path(body, headers, path):
-        file_saver = FileUpload(body, None,
-                                filename=os.path.basename(path),
-                                headers=headers)
-        if os.path.exists(path):
-            os.unlink(path)
-        if not os.path.exists(os.path.dirname(path)):
-            mkdir(os.path.dirname(path))
-        file_saver.save(os.path.dirname(path))
+    def _commit_upload(tmp_path, headers, path):
+        checksum = headers.get("X-Checksum-Sha1")
+        if checksum and sha1sum(tmp_path) != checksum:
+            os.unlink(tmp_path)
+            raise RequestErrorException("The uploaded file '%s' doesn't match its checksum"
+                                        % os.path.basename(path))
+        mkdir(os.path.dirname(path))
+        os.replace(tmp_path, path)
 
     # REMOVE
     def remove_recipe(self, ref, auth_user):
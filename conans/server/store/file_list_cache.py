@@ -0,0 +1,51 @@
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+
+
+class FileListCache:
+    """ LRU in-memory cache of the file lists of the revision folders, so the requests of the
+    files of a revision don't walk its folder every time. The entries are validated with the
+    modification time of the revision folder, that the store updates for every upload or removal
+    of its files, so the caches of the other server processes are not stale. It also caches the
+    checksums of the files, validated with the modification time of each file
+    """
+
+    def __init__(self, maxsize=10000):
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _stamp(folder):
+        try:
+            return os.stat(folder).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, folder, compute):
+        """ the cached file list of the folder, or the one computed by compute(folder) """
+        stamp = self._stamp(folder)
+        with self._lock:
+            entry = self._entries.get(folder)
+            if entry is not None and stamp is not None and entry[0] == stamp:
+                self._entries.move_to_end(folder)
+                return entry[1]
+        files = compute(folder)
+        if stamp is not None:
+            with self._lock:
+                self._entries[folder] = stamp, files
+                self._entries.move_to_end(folder)
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+        return files
+
+    def invalidate(self, folder):
+        """ the files of the folder changed """
+        stamp = self._stamp(folder)
+        if stamp is not None:  # Always a new time, even with coarse filesystem timestamps
+            stamp = max(time.time_ns(), stamp + 1)
+            os.utime(folder, ns=(stamp, stamp))
+        with self._lock:
+            self._entries.pop(folder, None)
@@ -0,0 +1,182 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from conans.errors import ConanException
+from conans.util.dates import revision_timestamp_now
+
+RECIPES_TABLE = "recipes"
+PACKAGES_TABLE = "packages"
+
+
+class ServerIndexDB:
+    """ Index of the contents of the server storage: the recipe revisions, the package revisions
+    and the conaninfo.txt of every package revision, so the search and revisions requests don't
+    need to walk the storage folders and read their files. The recipes are indexed by their
+    storage folder "name/version/user/channel", with "_" for the missing user and channel.
+    It is the store of the revisions: appending a new one is a single insert, and concurrent
+    uploads only wait for the short SQLite write transactions, not for any file lock
+    """
+
+    def __init__(self, dbfile):
+        self.dbfile = dbfile
+        self.created = not os.path.exists(dbfile)
+        if self.created:
+            self._create()
+
+    def _create(self):
+        os.makedirs(os.path.dirname(self.dbfile), exist_ok=True)
+        connection = sqlite3.connect(self.dbfile, isolation_level=None, timeout=20)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(f"CREATE TABLE IF NOT EXISTS {RECIPES_TABLE} "
+                               "(reference TEXT NOT NULL, rrev TEXT NOT NULL, "
+                               "timestamp REAL NOT NULL, UNIQUE(reference, rrev))")
+            connection.execute(f"CREATE TABLE IF NOT EXISTS {PACKAGES_TABLE} "
+                               "(reference TEXT NOT NULL, rrev TEXT NOT NULL, "
+                               "pkgid TEXT NOT NULL, prev TEXT NOT NULL, "
+                               "timestamp REAL NOT NULL, info TEXT, "
+                               "UNIQUE(reference, rrev, pkgid, prev))")
+            # The latest revision is the first entry of these indexes
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {RECIPES_TABLE}_latest "
+                               f"ON {RECIPES_TABLE} (reference, timestamp)")
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {PACKAGES_TABLE}_latest "
+                               f"ON {PACKAGES_TABLE} (reference, rrev, pkgid, timestamp)")
+        except Exception as e:
+            raise ConanException(f"Could not initialize server index database {self.dbfile}", e)
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _connect(self):
+        if not os.path.exists(self.dbfile):  # The whole storage was removed
+            self._create()
+        connection = sqlite3.connect(self.dbfile, isolation_level=None, timeout=20)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _fetch(self, query, params):
+        with self._connect() as connection:
+            return connection.execute(query, params).fetchall()
+
+    @staticmethod
+    def now():
+        return revision_timestamp_now()
+
+    # Writes
+    def add_recipe_revision(self, reference, rrev):
+        """ appends a new revision, an existing one keeps its time, as it is updated for every
+        upload of the revision, even forced ones
+        """
+        with self._connect() as connection:
+            connection.execute(f"INSERT OR IGNORE INTO {RECIPES_TABLE} VALUES (?, ?, ?)",
+                               (reference, rrev, self.now()))
+
+    def add_package_revision(self, reference, rrev, pkgid, prev, info):
+        with self._transaction() as connection:
+            r = connection.execute(f"INSERT OR IGNORE INTO {PACKAGES_TABLE} "
+                                   "VALUES (?, ?, ?, ?, ?, ?)",
+                                   (reference, rrev, pkgid, prev, self.now(), info))
+            if not r.rowcount:
+                connection.execute(f"UPDATE {PACKAGES_TABLE} SET info=? WHERE reference=? AND "
+                                   "rrev=? AND pkgid=? AND prev=?",
+                                   (info, reference, rrev, pkgid, prev))
+
+    def remove_recipe(self, reference, rrev=None):
+        """ removes a recipe revision, or all of them if no rrev, and all their packages """
+        where, params = "reference=?", (reference,)
+        if rrev is not None:
+            where, params = "reference=? AND rrev=?", (reference, rrev)
+        with self._transaction() as connection:
+            connection.execute(f"DELETE FROM {RECIPES_TABLE} WHERE {where}", params)
+            connection.execute(f"DELETE FROM {PACKAGES_TABLE} WHERE {where}", params)
+
+    def remove_packages(self, reference, rrev, pkgids=None):
+        """ removes all the revisions of the given package_ids, or of all the packages """
+        with self._transaction() as connection:
+            if pkgids is None:
+                connection.execute(f"DELETE FROM {PACKAGES_TABLE} WHERE reference=? AND rrev=?",
+                                   (reference, rrev))
+            for pkgid in pkgids or []:
+                connection.execute(f"DELETE FROM {PACKAGES_TABLE} "
+                                   "WHERE reference=? AND rrev=? AND pkgid=?",
+                                   (reference, rrev, pkgid))
+
+    def remove_package_revision(self, reference, rrev, pkgid, prev):
+        with self._connect() as connection:
+            connection.execute(f"DELETE FROM {PACKAGES_TABLE} "
+                               "WHERE reference=? AND rrev=? AND pkgid=? AND prev=?",
+                               (reference, rrev, pkgid, prev))
+
+    def replace(self, recipes, packages):
+        """ replaces the whole index contents, to rebuild it from the storage
+        :param recipes: iterable of (reference, rrev, timestamp)
+        :param packages: iterable of (reference, rrev, pkgid, prev, timestamp, info)
+        """
+        with self._transaction() as connection:
+            connection.execute(f"DELETE FROM {RECIPES_TABLE}")
+            connection.execute(f"DELETE FROM {PACKAGES_TABLE}")
+            connection.executemany(f"INSERT OR REPLACE INTO {RECIPES_TABLE} VALUES (?, ?, ?)",
+                                   recipes)
+            connection.executemany(f"INSERT OR REPLACE INTO {PACKAGES_TABLE} "
+                                   "VALUES (?, ?, ?, ?, ?, ?)", packages)
+
+    # Reads
+    def references(self):
+        rows = self._fetch(f"SELECT DISTINCT reference FROM {RECIPES_TABLE}", ())
+        return [r[0] for r in rows]
+
+    def recipe_revisions(self, reference):
+        """ [(rrev, timestamp)] of a recipe, the latest first """
+        return self._fetch(f"SELECT rrev, timestamp FROM {RECIPES_TABLE} WHERE reference=? "
+                           "ORDER BY timestamp DESC, rowid DESC", (reference,))
+
+    def latest_recipe_revision(self, reference):
+        """ (rrev, timestamp) of the latest revision of a recipe, or None """
+        rows = self._fetch(f"SELECT rrev, timestamp FROM {RECIPES_TABLE} WHERE reference=? "
+                           "ORDER BY timestamp DESC, rowid DESC LIMIT 1", (reference,))
+        return rows[0] if rows else None
+
+    def recipe_revision_time(self, reference, rrev):
+        rows = self._fetch(f"SELECT timestamp FROM {RECIPES_TABLE} WHERE reference=? AND rrev=?",
+                           (reference, rrev))
+        return rows[0][0] if rows else None
+
+    def package_revisions(self, reference, rrev, pkgid):
+        """ [(prev, timestamp)] of a package, the latest first """
+        return self._fetch(f"SELECT prev, timestamp FROM {PACKAGES_TABLE} "
+                           "WHERE reference=? AND rrev=? AND pkgid=? "
+                           "ORDER BY timestamp DESC, rowid DESC", (reference, rrev, pkgid))
+
+    def latest_package_revision(self, reference, rrev, pkgid):
+        """ (prev, timestamp) of the latest revision of a package, or None """
+        rows = self._fetch(f"SELECT prev, timestamp FROM {PACKAGES_TABLE} "
+                           "WHERE reference=? AND rrev=? AND pkgid=? "
+                           "ORDER BY timestamp DESC, rowid DESC LIMIT 1", (reference, rrev, pkgid))
+        return rows[0] if rows else None
+
+    def package_revision_time(self, reference, rrev, pkgid, prev):
+        rows = self._fetch(f"SELECT timestamp FROM {PACKAGES_TABLE} "
+                           "WHERE reference=? AND rrev=? AND pkgid=? AND prev=?",
+                           (reference, rrev, pkgid, prev))
+        return rows[0][0] if rows else None
+
+    def packages_infos(self, reference, rrev):
+        """ {pkgid: (prev, conaninfo.txt contents)} of the latest revision of every package """
+        rows = self._fetch(f"SELECT pkgid, prev, info FROM {PACKAGES_TABLE} "
+                           "WHERE reference=? AND rrev=? ORDER BY timestamp, rowid",
+                           (reference, rrev))
+        return {pkgid: (prev, info) for pkgid, prev, info in rows}
@@ -1,15 +1,24 @@
+import hashlib
 import os
+import time
 from os.path import join, normpath, relpath
 
 from conans.errors import ConanException, PackageNotFoundException, RecipeNotFoundException
-from conans.paths import CONAN_MANIFEST
+from conans.paths import CONAN_MANIFEST, CONANINFO
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
-from conans.server.revision_list import RevisionList
+from conans.server.revision_list import RevisionList, _RevisionEntry
+from conans.server.store.file_list_cache import FileListCache
+from conans.server.store.server_index import ServerIndexDB
+from conans.server.utils.files import list_folder_subdirs
+from conans.util.files import sha1sum
 
 REVISIONS_FILE = "revisions.txt"
+SERVER_INDEX_DB = ".index.sqlite3"
 SERVER_EXPORT_FOLDER = "export"
 SERVER_PACKAGES_FOLDER = "package"
+SERVER_UPLOADS_FOLDER = ".uploads"
+UPLOADS_MAX_AGE = 24 * 3600  # seconds without receiving chunks to consider an upload abandoned
 
 
 def ref_dir_repr(ref):
@@ -21,6 +30,55 @@ class ServerStore(object):
     def __init__(self, storage_adapter):
         self._storage_adapter = storage_adapter
         self._store_folder = storage_adapter._store_folder
+        self._index = ServerIndexDB(join(self._store_folder, SERVER_INDEX_DB))
+        self._file_lists = FileListCache()
+        self._checksums = FileListCache()
+        if self._index.created:  # Existing storages are indexed the first time
+            self.rebuild_index()
+
+    def rebuild_index(self):
+        """ Computes again the index of the storage from its folders: every revision folder with
+        a conanmanifest.txt is a revision, with the time stored in the revisions.txt files of the
+        previous storage layout, or the time of the manifest. Returns the number of indexed
+        (recipes revisions, package revisions)
+        """
+        recipes, packages = [], []
+        for ref_folder in list_folder_subdirs(self._store_folder, level=4):
+            ref_path = join(self._store_folder, ref_folder)
+            for rrev, rtime in self._revisions_in_folder(ref_path, SERVER_EXPORT_FOLDER):
+                recipes.append((ref_folder, rrev, rtime))
+                packages_path = join(ref_path, rrev, SERVER_PACKAGES_FOLDER)
+                if not os.path.isdir(packages_path):
+                    continue
+                for pkgid in os.listdir(packages_path):
+                    pkg_path = join(packages_path, pkgid)
+                    for prev, ptime in self._revisions_in_folder(pkg_path):
+                        info = self._read_conaninfo(join(pkg_path, prev))
+                        packages.append((ref_folder, rrev, pkgid, prev, ptime, info))
+        self._index.replace(recipes, packages)
+        return len(recipes), len(packages)
+
+    @staticmethod
+    def _revisions_in_folder(folder, subfolder=""):
+        times = {}
+        rev_file_path = join(folder, REVISIONS_FILE)
+        if os.path.isfile(rev_file_path):  # Migrating from the revisions.txt layout
+            with open(rev_file_path) as f:
+                times = {r.revision: r.time for r in RevisionList.loads(f.read()).as_list()}
+        result = []
+        for revision in os.listdir(folder):
+            manifest = join(folder, revision, subfolder, CONAN_MANIFEST)
+            if os.path.isfile(manifest):
+                result.append((revision, times.get(revision) or os.path.getmtime(manifest)))
+        return sorted(result, key=lambda r: r[1])
+
+    @staticmethod
+    def _read_conaninfo(package_folder):
+        try:
+            with open(join(package_folder, CONANINFO)) as f:
+                return f.read()
+        except (IOError, OSError):
+            return None
 
     @property
     def store(self):
@@ -64,9 +122,50 @@ class ServerStore(object):
         abspath = join(p_path, filename)
         return abspath
 
+    def get_file_sha1(self, path):
+        """ sha1 of a file of the store, computed only once for every modification """
+        return self._checksums.get(path, sha1sum)
+
+    def get_partial_upload_path(self, path):
+        """ file receiving the chunks of a resumable upload of the file 'path' of the store,
+        outside the revision folders so it is never listed or downloaded until it is complete
+        """
+        name = hashlib.sha1(relpath(path, self._store_folder).encode()).hexdigest()
+        return join(self._store_folder, SERVER_UPLOADS_FOLDER, name)
+
+    def remove_stale_uploads(self, max_age=UPLOADS_MAX_AGE):
+        """ removes the partial uploads that haven't received data for max_age seconds """
+        uploads_folder = join(self._store_folder, SERVER_UPLOADS_FOLDER)
+        if not os.path.isdir(uploads_folder):
+            return
+        limit = time.time() - max_age
+        for name in os.listdir(uploads_folder):
+            path = join(uploads_folder, name)
+            try:
+                if os.path.getmtime(path) < limit:
+                    os.remove(path)
+            except OSError:  # Completed or removed concurrently
+                pass
+
     def path_exists(self, path):
         return self._storage_adapter.path_exists(path)
 
+    def search_references(self):
+        """ all the recipe references (without revision) in the storage """
+        def underscore_to_none(field):
+            return field if field != "_" else None
+
+        return [RecipeReference(*[underscore_to_none(f) for f in r.split("/")])
+                for r in self._index.references()]
+
+    def get_packages_infos(self, ref):
+        """ {package_id: (PkgReference, conaninfo.txt contents)} of the latest package revisions
+        """
+        assert ref.revision is not None, "BUG: server store needs RREV to get_packages_infos"
+        infos = self._index.packages_infos(ref_dir_repr(ref), ref.revision)
+        return {pkgid: (PkgReference(ref, pkgid, prev), info)
+                for pkgid, (prev, info) in infos.items()}
+
     # ############ ONLY FILE LIST SNAPSHOTS (APIv2)
     def get_recipe_file_list(self, ref):
         """Returns a  [filepath] """
@@ -85,9 +184,16 @@ class ServerStore(object):
         return files
 
     def _get_file_list(self, relative_path):
-        file_list = self._storage_adapter.get_file_list(relative_path)
-        file_list = [relpath(old_key, relative_path) for old_key in file_list]
-        return file_list
+        def compute(folder):
+            file_list = self._storage_adapter.get_file_list(folder)
+            return [relpath(old_key, folder) for old_key in file_list]
+        return list(self._file_lists.get(relative_path, compute))
+
+    def recipe_files_changed(self, ref):
+        self._file_lists.invalidate(self.export(ref))
+
+    def package_files_changed(self, pref):
+        self._file_lists.invalidate(self.package(pref))
 
     def _delete_empty_dirs(self, ref):
         lock_files = {REVISIONS_FILE, "%s.lock" % REVISIONS_FILE}
@@ -97,8 +203,8 @@ class ServerStore(object):
             ref_path = join(ref_path, ref.revision)
         for _ in range(4 if not ref.revision else 5):
             if os.path.exists(ref_path):
-                if set(os.listdir(ref_path)) == lock_files:
-                    for lock_file in lock_files:
+                if set(os.listdir(ref_path)) <= lock_files:  # Previous revisions.txt layout
+                    for lock_file in os.listdir(ref_path):
                         os.unlink(os.path.join(ref_path, lock_file))
                 try:  # Take advantage that os.rmdir does not delete non-empty dirs
                     os.rmdir(ref_path)
@@ -113,7 +219,7 @@ class ServerStore(object):
             self._storage_adapter.delete_folder(self.conan_revisions_root(ref))
         else:
             self._storage_adapter.delete_folder(self.base_folder(ref))
-            self._remove_revision_from_index(ref)
+        self._index.remove_recipe(ref_dir_repr(ref), ref.revision)
         self._delete_empty_dirs(ref)
 
     def remove_packages(self, ref, package_ids_filter):
@@ -129,6 +235,7 @@ class ServerStore(object):
                 # Remove all package revisions
                 package_folder = self.package_revisions_root(pref)
                 self._storage_adapter.delete_folder(package_folder)
+        self._index.remove_packages(ref_dir_repr(ref), ref.revision, package_ids_filter or None)
         self._delete_empty_dirs(ref)
 
     def remove_package(self, pref):
@@ -137,19 +244,22 @@ class ServerStore(object):
         assert pref.ref.revision is not None, "BUG: server store needs RREV remove_package"
         package_folder = self.package(pref)
         self._storage_adapter.delete_folder(package_folder)
-        self._remove_package_revision_from_index(pref)
+        self._index.remove_package_revision(ref_dir_repr(pref.ref), pref.ref.revision,
+                                            pref.package_id, pref.revision)
 
     def remove_all_packages(self, ref):
         assert ref.revision is not None, "BUG: server store needs RREV remove_all_packages"
         assert isinstance(ref, RecipeReference)
         packages_folder = self.packages(ref)
         self._storage_adapter.delete_folder(packages_folder)
+        self._index.remove_packages(ref_dir_repr(ref), ref.revision)
 
     def remove_package_files(self, pref, files):
         subpath = self.package(pref)
         for filepath in files:
             path = join(subpath, filepath)
             self._storage_adapter.delete_file(path)
+        self.package_files_changed(pref)
 
     def get_upload_package_urls(self, pref, filesizes, user):
         """
@@ -187,135 +297,62 @@ class ServerStore(object):
             ret[new_key] = value
         return ret
 
-    # Methods to manage revisions
+    # Methods to manage revisions, stored in the index
     def get_last_revision(self, ref):
         assert(isinstance(ref, RecipeReference))
-        rev_file_path = self._recipe_revisions_file(ref)
-        return self._get_latest_revision(rev_file_path)
+        latest = self._index.latest_recipe_revision(ref_dir_repr(ref))
+        return _RevisionEntry(*latest) if latest else None
 
     def get_recipe_revisions_references(self, ref):
         """Returns a RevisionList"""
         if ref.revision:
-            tmp = RevisionList()
-            tmp.add_revision(ref.revision)
-            return tmp.as_list()
-        rev_file_path = self._recipe_revisions_file(ref)
-        revs = self._get_revisions_list(rev_file_path).as_list()
+            return [_RevisionEntry(ref.revision, self._index.now())]
+        revs = [_RevisionEntry(*r) for r in self._index.recipe_revisions(ref_dir_repr(ref))]
         if not revs:
             raise RecipeNotFoundException(ref)
         return revs
 
     def get_last_package_revision(self, pref):
         assert(isinstance(pref, PkgReference))
-        rev_file_path = self._package_revisions_file(pref)
-        rev = self._get_latest_revision(rev_file_path)
-        if rev:
-            return PkgReference(pref.ref, pref.package_id, rev.revision, rev.time)
+        latest = self._index.latest_package_revision(ref_dir_repr(pref.ref), pref.ref.revision,
+                                                     pref.package_id)
+        if latest:
+            return PkgReference(pref.ref, pref.package_id, *latest)
         return None
 
+    def _package_revisions(self, pref):
+        return self._index.package_revisions(ref_dir_repr(pref.ref), pref.ref.revision,
+                                             pref.package_id)
+
     def update_last_revision(self, ref):
         assert(isinstance(ref, RecipeReference))
-        rev_file_path = self._recipe_revisions_file(ref)
-        self._update_last_revision(rev_file_path, ref)
+        if ref.revision is None:
+            raise ConanException("Invalid revision for: %s" % repr(ref))
+        self._index.add_recipe_revision(ref_dir_repr(ref), ref.revision)
 
     def update_last_package_revision(self, pref):
         assert(isinstance(pref, PkgReference))
-        rev_file_path = self._package_revisions_file(pref)
-        self._update_last_revision(rev_file_path, pref)
-
-    def _update_last_revision(self, rev_file_path, ref):
-        if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
-        else:
-            rev_list = RevisionList()
-        if ref.revision is None:
-            raise ConanException("Invalid revision for: %s" % repr(ref))
-        rev_list.add_revision(ref.revision)
-        self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
-                                         lock_file=rev_file_path + ".lock")
+        if pref.revision is None:
+            raise ConanException("Invalid revision for: %s" % repr(pref))
+        info = self._read_conaninfo(self.package(pref))
+        self._index.add_package_revision(ref_dir_repr(pref.ref), pref.ref.revision,
+                                         pref.package_id, pref.revision, info)
 
     def get_package_revisions_references(self, pref):
         """Returns a RevisionList"""
         assert pref.ref.revision is not None, \
             "BUG: server store needs PREV get_package_revisions_references"
         if pref.revision:
-            tmp = RevisionList()
-            tmp.add_revision(pref.revision)
-            return [PkgReference(pref.ref, pref.package_id, rev.revision, rev.time)
-                    for rev in tmp.as_list()]
+            return [PkgReference(pref.ref, pref.package_id, pref.revision, self._index.now())]
 
-        tmp = self._package_revisions_file(pref)
-        ret = self._get_revisions_list(tmp).as_list()
+        ret = self._package_revisions(pref)
         if not ret:
             raise PackageNotFoundException(pref)
-        return [PkgReference(pref.ref, pref.package_id, rev.revision, rev.time) for rev in ret]
-
-    def _get_revisions_list(self, rev_file_path):
-        if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
-            return rev_list
-        else:
-            return RevisionList()
-
-    def _get_latest_revision(self, rev_file_path):
-        rev_list = self._get_revisions_list(rev_file_path)
-        if not rev_list:
-            return None
-        return rev_list.latest_revision()
-
-    def _recipe_revisions_file(self, ref):
-        recipe_folder = normpath(join(self._store_folder, ref_dir_repr(ref)))
-        return join(recipe_folder, REVISIONS_FILE)
-
-    def _package_revisions_file(self, pref):
-        tmp = normpath(join(self._store_folder, ref_dir_repr(pref.ref)))
-        revision = {None: ""}.get(pref.ref.revision, pref.ref.revision)
-        p_folder = join(tmp, revision, SERVER_PACKAGES_FOLDER, pref.package_id)
-        return join(p_folder, REVISIONS_FILE)
+        return [PkgReference(pref.ref, pref.package_id, prev, ptime) for prev, ptime in ret]
 
     def get_revision_time(self, ref):
-        try:
-            rev_list = self._load_revision_list(ref)
-        except IOError:
-            return None
-        return rev_list.get_time(ref.revision)
+        return self._index.recipe_revision_time(ref_dir_repr(ref), ref.revision)
 
     def get_package_revision_time(self, pref):
-        try:
-            rev_list = self._load_package_revision_list(pref)
-        except (IOError, OSError):
-            return None
-
-        return rev_list.get_time(pref.revision)
-
-    def _remove_revision_from_index(self, ref):
-        rev_list = self._load_revision_list(ref)
-        rev_list.remove_revision(ref.revision)
-        self._save_revision_list(rev_list, ref)
-
-    def _remove_package_revision_from_index(self, pref):
-        rev_list = self._load_package_revision_list(pref)
-        rev_list.remove_revision(pref.revision)
-        self._save_package_revision_list(rev_list, pref)
-
-    def _load_revision_list(self, ref):
-        path = self._recipe_revisions_file(ref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
-
-    def _save_revision_list(self, rev_list, ref):
-        path = self._recipe_revisions_file(ref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
-
-    def _save_package_revision_list(self, rev_list, pref):
-        path = self._package_revisions_file(pref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
-
-    def _load_package_revision_list(self, pref):
-        path = self._package_revisions_file(pref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
+        return self._index.package_revision_time(ref_dir_repr(pref.ref), pref.ref.revision,
+                                                 pref.package_id, pref.revision)
@@ -9,7 +9,7 @@ from mock import patch
 from conans.util.env import environment_update
 from conans.errors import RecipeNotFoundException
 from conans.model.recipe_ref import RecipeReference
-from conans.server.revision_list import RevisionList
+from conans.server.store.server_index import ServerIndexDB
 from conans.test.utils.tools import TestServer, TurboTestClient, GenConanfile, TestClient
 from conans.util.files import load
 
@@ -33,7 +33,7 @@ class InstallingPackagesWithRevisionsTest(unittest.TestCase):
         with environment_update({"MY_VAR": "1"}):
             pref = self.c_v2.create(self.ref, conanfile=conanfile)
         the_time = time.time()
-        with patch.object(RevisionList, '_now', return_value=the_time):
+        with patch.object(ServerIndexDB, 'now', return_value=the_time):
             self.c_v2.upload_all(self.ref, remote="default")
         self.c_v2.run("remove {}#*:{} -c -r default".format(self.ref, pref.package_id))
         # Same RREV, different PREV
@@ -41,7 +41,7 @@ class InstallingPackagesWithRevisionsTest(unittest.TestCase):
             pref2 = self.c_v2.create(self.ref, conanfile=conanfile)
 
         the_time = the_time + 10.0
-        with patch.object(RevisionList, '_now', return_value=the_time):
+        with patch.object(ServerIndexDB, 'now', return_value=the_time):
             self.c_v2.upload_all(self.ref, remote="remote2")
         self.c_v2.remove_all()
 
@@ -144,13 +144,13 @@ class InstallingPackagesWithRevisionsTest(unittest.TestCase):
 
         time.sleep(1)
 
-        with patch.object(RevisionList, '_now', return_value=time.time()):
+        with patch.object(ServerIndexDB, 'now', return_value=time.time()):
             client.upload_all(self.ref)
 
         with environment_update({"MY_VAR": "2"}):
             pref2 = client2.create(self.ref, conanfile=conanfile)
 
-        with patch.object(RevisionList, '_now', return_value=time.time() + 20.0):
+        with patch.object(ServerIndexDB, 'now', return_value=time.time() + 20.0):
             client2.upload_all(self.ref)
 
         prev1_time_remote = self.server.package_revision_time(pref)
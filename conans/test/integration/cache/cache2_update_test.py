@@ -5,7 +5,7 @@ import pytest
 from mock import patch
 
 from conans.model.recipe_ref import RecipeReference
-from conans.server.revision_list import RevisionList
+from conans.server.store.server_index import ServerIndexDB
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.tools import TestClient, TestServer, NO_SETTINGS_PACKAGE_ID
 
@@ -36,7 +36,7 @@ class TestUpdateFlows:
         # we are patching the time all these revisions uploaded to the servers
         # will be older than the ones we create in local
         self.server_times[remote] = self.the_time
-        with patch.object(RevisionList, '_now', return_value=self.the_time):
+        with patch.object(ServerIndexDB, 'now', return_value=self.the_time):
             client.run(f"upload {ref} -r {remote} -c")
 
     def test_revision_fixed_version(self):
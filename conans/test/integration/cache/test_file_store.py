@@ -0,0 +1,51 @@
+import os
+import platform
+
+import pytest
+
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient
+from conans.util.env import environment_update
+from conans.util.files import load
+
+
+def _stored_files(client):
+    store = os.path.join(client.cache.store, "f")
+    return [f for d in os.listdir(store) for f in os.listdir(os.path.join(store, d))]
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Hardlinks need privileges")
+def test_file_store_deduplicate():
+    c = TestClient(default_server_user=True)
+    conanfile = GenConanfile("pkg", "0.1").with_settings("build_type")\
+        .with_package_file("include/header.h", "header")\
+        .with_package_file("lib/mylib.lib", env_var="MYLIB")
+    c.save({"conanfile.py": conanfile})
+    package_ids = {}
+    for build_type in ("Release", "Debug"):
+        with environment_update({"MYLIB": build_type}):
+            c.run(f"create . -s build_type={build_type}")
+        package_ids[build_type] = c.created_package_id("pkg/0.1")
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+
+    c.save_home({"global.conf": "core.cache:deduplicate=True"})
+    headers = []
+    for build_type, package_id in package_ids.items():
+        c.run(f"install --requires=pkg/0.1 -s build_type={build_type}")
+        pref = c.get_latest_package_reference("pkg/0.1", package_id)
+        package_folder = c.get_latest_pkg_layout(pref).package()
+        headers.append(os.path.join(package_folder, "include", "header.h"))
+        assert load(os.path.join(package_folder, "lib", "mylib.lib")) == build_type
+    # The same file in both packages, plus the store
+    headers = [os.stat(h) for h in headers]
+    assert headers[0].st_ino == headers[1].st_ino
+    assert headers[0].st_nlink == 3
+    stored = _stored_files(c)
+
+    c.run("cache check-integrity *")
+    c.run("remove pkg/0.1:* -p build_type=Debug -c")
+    # The Debug conaninfo.txt, conanmanifest.txt and mylib.lib are no longer used
+    assert len(_stored_files(c)) == len(stored) - 3
+    c.run("remove * -c")
+    assert _stored_files(c) == []
@@ -123,3 +123,22 @@ def test_download_list_only_recipe():
     c.run("list *:* -r=default --format=json", redirect_stdout="pkgs.json")
     c.run("download --list=pkgs.json --only-recipe -r=default")
     assert "packages" not in c.out
+
+
+def test_download_stream_extract():
+    client = TestClient(default_server_user=True)
+    conanfile = GenConanfile("pkg", "0.1").with_package_file("include/header.h", "myheader")
+    client.save({"conanfile.py": conanfile})
+    client.run("create .")
+    client.run("upload * -r default -c")
+    client.run("remove * -c")
+
+    client.run("download pkg/0.1:* -r default -cc core.download:stream_extract=True")
+    pref = client.get_latest_package_reference("pkg/0.1", NO_SETTINGS_PACKAGE_ID)
+    layout = client.get_latest_pkg_layout(pref)
+    assert "myheader" == load(os.path.join(layout.package(), "include", "header.h"))
+    assert os.path.isfile(os.path.join(layout.package(), "conanmanifest.txt"))
+    # The compressed package was never stored in disk
+    assert not os.path.exists(os.path.join(layout.download_package(), "conan_package.tgz"))
+    client.run("cache check-integrity *")
+    assert f"pkg/0.1:{NO_SETTINGS_PACKAGE_ID}: Integrity checked: ok" in client.out
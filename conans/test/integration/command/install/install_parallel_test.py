@@ -1,6 +1,10 @@
+import os
+import textwrap
+import time
 import unittest
 
-from conans.test.utils.tools import GenConanfile, TestClient
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import GenConanfile, TestClient, TestRequester
 
 
 class InstallParallelTest(unittest.TestCase):
@@ -30,3 +34,56 @@ class InstallParallelTest(unittest.TestCase):
         self.assertIn("Downloading binary packages in %s parallel threads" % threads, client.out)
         for i in range(counter):
             self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+
+
+class BlockingDownloadRequester(TestRequester):
+    """ the download of the 'other' package waits until the build of 'pkg' starts
+    """
+    sync_folder = None
+    build_started = None
+
+    def get(self, url, **kwargs):
+        if "/other/" in url and url.endswith("conan_package.tgz"):
+            sync_file = os.path.join(BlockingDownloadRequester.sync_folder, "pkg_build")
+            t = time.time()
+            while not os.path.exists(sync_file) and time.time() - t < 30:
+                time.sleep(0.1)
+            BlockingDownloadRequester.build_started = os.path.exists(sync_file)
+        return super(BlockingDownloadRequester, self).get(url, **kwargs)
+
+
+def test_download_pipeline():
+    """ the downloads happen in background while the packages are built from source, the build
+    of pkg starts before the download of the unrelated other package finishes
+    """
+    sync_folder = temp_folder()
+    BlockingDownloadRequester.sync_folder = sync_folder
+    BlockingDownloadRequester.build_started = None
+    pkg = textwrap.dedent(f"""
+        import os
+        from conan import ConanFile
+
+        class Pkg(ConanFile):
+            requires = "dep/0.1"
+
+            def build(self):
+                open(os.path.join(r"{sync_folder}", "pkg_build"), "w").close()
+        """)
+    client = TestClient(requester_class=BlockingDownloadRequester, default_server_user=True)
+    client.save({"dep/conanfile.py": GenConanfile(),
+                 "pkg/conanfile.py": pkg,
+                 "app/conanfile.py": GenConanfile().with_requires("pkg/0.1", "other/0.1")})
+    client.run("create dep --name=dep --version=0.1")
+    client.run("create dep --name=other --version=0.1")
+    client.run("create pkg --name=pkg --version=0.1")
+    client.run("upload * --confirm -r default")
+    client.run("remove * -c")
+    os.remove(os.path.join(sync_folder, "pkg_build"))
+    client.save_home({"global.conf": "core.download:pipeline=True\ncore.download:parallel=2"})
+
+    client.run("install app --build=pkg/*")
+    assert "Downloading 2 packages in background" in client.out
+    assert BlockingDownloadRequester.build_started is True
+    assert "pkg/0.1: Package '59205ba5b14b8f4ebc216a6c51a89553021e82c1' built" in client.out
+    assert "dep/0.1: Package installed" in client.out
+    assert "other/0.1: Package installed" in client.out
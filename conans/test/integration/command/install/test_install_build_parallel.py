@@ -0,0 +1,77 @@
+import sys
+import textwrap
+
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestClient
+
+
+def _client(keep_going=False):
+    c = TestClient()
+    sync_folder = temp_folder().replace("\\", "/")
+    python = sys.executable.replace("\\", "/")
+    # Each build waits for the other one to start, they only finish if built concurrently
+    conanfile = textwrap.dedent(f"""
+        import os
+        from conan import ConanFile
+        from conan.tools.build import build_jobs
+        from conan.tools.files import save, load
+
+        class Pkg(ConanFile):
+            version = "1.0"
+            options = {{"fail": [True, False]}}
+            default_options = {{"fail": False}}
+
+            def build(self):
+                save(self, "myfile.txt", self.name)
+                other = "pkgb" if self.name == "pkga" else "pkga"
+                cmd = ("import os, sys, time\\n"
+                       "open(os.path.join('{sync_folder}', '{{}}'), 'w').close()\\n"
+                       "t = time.time()\\n"
+                       "while not os.path.exists(os.path.join('{sync_folder}', '{{}}')):\\n"
+                       "    assert time.time() - t < 30, 'not parallel'\\n"
+                       "    time.sleep(0.1)\\n"
+                       "print('building with {{}} jobs')\\n"
+                       "sys.exit({{}})")
+                cmd = cmd.format(self.name, other, build_jobs(self),
+                                 1 if self.options.fail else 0)
+                save(self, "build.py", cmd)
+                self.run('"{python}" build.py')
+                assert load(self, "myfile.txt") == self.name
+                assert os.getcwd() == self.build_folder
+        """)
+    c.save({"pkg/conanfile.py": conanfile,
+            "app/conanfile.py": GenConanfile("app", "1.0").with_requires("pkga/1.0", "pkgb/1.0")})
+    c.run("export pkg --name=pkga")
+    c.run("export pkg --name=pkgb")
+    c.save_home({"global.conf": "core.build:parallel_packages=2\n"
+                                "tools.build:jobs=8\n"
+                                f"core.build:parallel_keep_going={keep_going}"})
+    return c
+
+
+def test_install_build_parallel():
+    c = _client()
+    c.run("install app --build=missing")
+    assert "Building 2 packages in 2 parallel threads" in c.out
+    assert "pkga/1.0: building with 4 jobs" in c.out
+    assert "pkgb/1.0: building with 4 jobs" in c.out
+    assert "pkga/1.0: Package folder" in c.out
+    assert "pkgb/1.0: Package folder" in c.out
+    c.run("list pkg*:*")
+    assert "fail: False" in c.out
+
+
+def test_install_build_parallel_failure():
+    c = _client()
+    c.run("install app --build=missing -o pkga/*:fail=True", assert_error=True)
+    assert "pkga/1.0: Error in build() method" in c.out
+    assert "pkgb/1.0: Package folder" in c.out  # The already running build is completed
+
+
+def test_install_build_parallel_keep_going():
+    c = _client(keep_going=True)
+    c.run("install app --build=missing -o *:fail=True", assert_error=True)
+    assert "There were errors building 2 packages" in c.out
+    assert "pkga/1.0: Error in build() method" in c.out
+    assert "pkgb/1.0: Error in build() method" in c.out
@@ -1,3 +1,6 @@
+import threading
+import time
+
 from requests import ConnectionError
 
 from conans.test.assets.genconanfile import GenConanfile
@@ -59,3 +62,36 @@ def test_upload_parallel_fail_on_interaction():
     client.run('remote logout default')
     client.run('upload lib* -c -r default', assert_error=True)
     assert "ERROR: Conan interactive mode disabled. [Remote: default]" in client.out
+
+
+def test_upload_parallel_packages_files():
+    """ The packages of the same recipe and their files are uploaded concurrently, but never
+    more simultaneous file uploads than the core.upload:parallel budget"""
+
+    class ConcurrencyRequester(TestRequester):
+        lock = threading.Lock()
+        current = 0
+        max_concurrent = 0
+
+        def put(self, *args, **kwargs):
+            cls = ConcurrencyRequester
+            with cls.lock:
+                cls.current += 1
+                cls.max_concurrent = max(cls.max_concurrent, cls.current)
+            try:
+                time.sleep(0.05)
+                return super(ConcurrencyRequester, self).put(*args, **kwargs)
+            finally:
+                with cls.lock:
+                    cls.current -= 1
+
+    client = TestClient(requester_class=ConcurrencyRequester, default_server_user=True)
+    client.save_home({"global.conf": "core.upload:parallel=3"})
+    client.save({"conanfile.py": GenConanfile("lib", "1.0").with_option("opt", [1, 2, 3, 4])})
+    for opt in range(1, 5):
+        client.run(f"create . -o opt={opt}")
+    client.run("upload lib* -c -r default")
+    assert 1 < ConcurrencyRequester.max_concurrent <= 3
+    client.run("list lib/1.0:* -r default")
+    for opt in range(1, 5):
+        assert f"opt: {opt}" in client.out
@@ -0,0 +1,68 @@
+import os
+
+from requests import ConnectionError
+
+from conans import RESUMABLE_UPLOADS
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, TestRequester, TestServer
+from conans.util.sha import sha1
+
+
+class FailOnceChunkUploader(TestRequester):
+    """ drops the connection in the middle of the upload of the package, once """
+    ranges = []
+    failed = False
+
+    def put(self, url, **kwargs):
+        content_range = kwargs.get("headers", {}).get("Content-Range")
+        if content_range:
+            FailOnceChunkUploader.ranges.append(content_range)
+            if not FailOnceChunkUploader.failed and content_range.startswith("bytes 2000-"):
+                FailOnceChunkUploader.failed = True
+                raise ConnectionError("Connection dropped in the middle of the upload")
+        return super(FailOnceChunkUploader, self).put(url, **kwargs)
+
+
+def test_upload_resumable():
+    server = TestServer([("*/*@*/*", "*")], [("*/*@*/*", "*")], users={"admin": "password"},
+                        server_capabilities=[RESUMABLE_UPLOADS])
+    c = TestClient(requester_class=FailOnceChunkUploader, servers={"default": server},
+                   inputs=["admin", "password"])
+    c.save_home({"global.conf": "core.upload:chunk_size=1000\ncore.upload:retry_wait=0"})
+    contents = os.urandom(3000).hex()  # The compressed package has more than 3 chunks
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0").with_package_file("data.txt", contents)})
+    c.run("create .")
+    pref = c.created_package_reference("pkg/1.0")
+    c.run("upload * -r=default -c")
+    assert "Connection dropped in the middle of the upload" in c.out
+    ranges = FailOnceChunkUploader.ranges
+    failed = ranges.index("bytes 2000-2999/" + ranges[0].split("/")[1])
+    # The retry asks for what was received, and continues from there
+    assert ranges[failed + 1].startswith("bytes */")
+    assert ranges[failed + 2].startswith("bytes 2000-")
+    assert ranges.count(ranges[1]) == 1  # The first chunk was sent only once
+
+    assert os.listdir(os.path.join(server.server_store.store, ".uploads")) == []
+    c2 = TestClient(servers=c.servers)
+    c2.run("install --requires=pkg/1.0")
+    package_folder = c2.get_latest_pkg_layout(pref).package()
+    assert open(os.path.join(package_folder, "data.txt")).read() == contents
+
+
+def test_download_range():
+    c = TestClient(default_server_user=True)
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0").with_package_file("data.txt", "data")})
+    c.run("create .")
+    pref = c.created_package_reference("pkg/1.0")
+    c.run("upload * -r=default -c")
+    url = (f"/v2/conans/pkg/1.0/_/_/revisions/{pref.ref.revision}/packages/{pref.package_id}"
+           f"/revisions/{pref.revision}/files/conan_package.tgz")
+    server = c.servers["default"]
+    response = server.app.get(url)
+    full = response.body
+    assert response.headers["X-Checksum-Sha1"] == sha1(full)  # To check the streamed extraction
+    response = server.app.get(url, headers={"Range": "bytes=10-"})
+    assert response.status_int == 206
+    assert response.headers["Content-Range"] == f"bytes 10-{len(full) - 1}/{len(full)}"
+    assert response.body == full[10:]
+    assert "X-Checksum-Sha1" not in response.headers
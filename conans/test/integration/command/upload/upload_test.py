@@ -547,3 +547,25 @@ def test_upload_json_output():
     revs = list_pkgs["default"]["liba/0.1"]["revisions"]["a565bd5defd3a99e157698fcc6e23b25"]
     pkg = revs["packages"]["9e0f8140f0fe6b967392f8d5da9881e232e05ff8"]
     assert pkg["info"] == {"settings": {"os": "Linux"}, "options": {"shared": "False"}}
+
+
+def test_upload_zstd_compression():
+    pytest.importorskip("zstandard")
+    c = TestClient(default_server_user=True)
+    c.save({"conanfile.py": conanfile,
+            "hello.cpp": "int i=0",
+            "hello.h": "int i;"})
+    c.run("create .")
+    c.run("upload * -r=default -c -cc core.upload:compression_format=zstd")
+    assert "Compressing conan_package.tzst" in c.out
+    pref = c.get_latest_package_reference("hello0/1.2.1")
+    download_folder = c.get_latest_pkg_layout(pref).download_package()
+    package_tzst = os.path.join(download_folder, "conan_package.tzst")
+    assert os.path.isfile(package_tzst)
+    assert not os.path.exists(os.path.join(download_folder, PACKAGE_TGZ_NAME))
+
+    c.run("remove * -c")
+    c.run("install --requires=hello0/1.2.1")
+    c.assert_listed_binary({"hello0/1.2.1": (NO_SETTINGS_PACKAGE_ID, "Download (default)")})
+    package_folder = c.get_latest_pkg_layout(pref).package()
+    assert open(os.path.join(package_folder, "hello.h")).read() == "int i;"
@@ -1,6 +1,7 @@
 import json
 import os
 import re
+import sqlite3
 import textwrap
 import time
 from collections import OrderedDict
@@ -681,6 +682,51 @@ def test_list_empty_settings():
     assert pkgs == {NO_SETTINGS_PACKAGE_ID: {"info": {}}}
 
 
+def test_list_query_cache_database():
+    """
+    The settings and options of the packages are stored in the cache database when created or
+    downloaded, and queried there without reading the conaninfo.txt files. The packages of
+    caches from previous versions are added to the database the first time they are listed
+    """
+    c = TestClient(default_server_user=True)
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0").with_settings("os")
+                                                      .with_shared_option(False)})
+    c.run("create . -s os=Linux")
+    c.run("create . -s os=Linux -o *:shared=True")
+    c.run("create . -s os=Windows")
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+    c.run("install --requires=pkg/1.0 -s os=Windows")  # downloaded
+    c.run("install --requires=pkg/1.0 -s os=Linux")
+    c.run("install --requires=pkg/1.0 -s os=Linux -o *:shared=True")
+    db_filename = os.path.join(c.cache.store, "cache.sqlite3")
+    with sqlite3.connect(db_filename) as connection:
+        connection.execute("DELETE FROM packages_info")  # Created by a previous version
+        connection.execute("DELETE FROM packages_fields")
+
+    def _query(query):
+        c.run(f'list pkg/1.0:* -p "{query}" -f=json')
+        revisions = json.loads(c.stdout)["Local Cache"]["pkg/1.0"]["revisions"]
+        pkgs = list(revisions.values())[0]["packages"]
+        return sorted((p["info"]["settings"]["os"], p["info"]["options"]["shared"])
+                      for p in pkgs.values())
+
+    assert _query("os=Linux") == [("Linux", "False"), ("Linux", "True")]
+    # The conaninfo.txt files are no longer needed to query the packages
+    for root, _, files in os.walk(c.cache.store):
+        if "conaninfo.txt" in files:
+            os.remove(os.path.join(root, "conaninfo.txt"))
+    assert _query("os=Linux AND options.shared=True") == [("Linux", "True")]
+    assert _query("os=Windows OR options.shared=True") == [("Linux", "True"),
+                                                           ("Windows", "False")]
+    assert _query("(os=Linux AND options.shared=False) OR os=Windows") == [("Linux", "False"),
+                                                                           ("Windows", "False")]
+    assert _query("arch=None") == [("Linux", "False"), ("Linux", "True"), ("Windows", "False")]
+    assert _query("os=Macos") == []
+    c.run("remove pkg/1.0:* -p os=Windows -c")
+    assert _query("os=Windows OR os=Linux") == [("Linux", "False"), ("Linux", "True")]
+
+
 class TestListNoUserChannel:
     def test_no_user_channel(self):
         c = TestClient(default_server_user=True)
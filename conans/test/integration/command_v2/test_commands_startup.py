@@ -0,0 +1,50 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import conans
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestClient
+
+
+def test_commands_imported_lazily():
+    """ Running a command only imports that command module, the rest of commands are registered
+    from the registry stored in the home, to not pay the import time of all of them
+    """
+    home = temp_folder()
+    script = textwrap.dedent("""\
+        import json, sys
+        from conan.api.conan_api import ConanAPI
+        from conan.cli.cli import Cli
+        cli = Cli(ConanAPI(sys.argv[1]))
+        cli.run(["version"])
+        commands = sorted(m for m in sys.modules if m.startswith("conan.cli.commands."))
+        print(json.dumps({"commands": commands}))
+        """)
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(os.path.abspath(conans.__file__)))
+
+    def _run():
+        out = subprocess.check_output([sys.executable, "-c", script, home], env=env)
+        return json.loads(out.decode().splitlines()[-1])
+
+    first = _run()  # Computes and stores the registry
+    assert "conan.cli.commands.install" in first["commands"]
+    assert os.path.isfile(os.path.join(home, ".commands_registry.json"))
+    second = _run()
+    # Only version and the list command module, whose formatters it uses, the rest of command
+    # modules are not imported
+    assert second["commands"] == ["conan.cli.commands.list", "conan.cli.commands.version"]
+
+
+def test_commands_registry_help():
+    c = TestClient()
+    c.run("-h")
+    assert "Consumer commands" in c.out
+    assert "install" in c.out
+    c.run("config -h")
+    assert "Manage the Conan configuration in the Conan home" in c.out
+    c.run("config home")
+    assert c.cache_folder in c.out
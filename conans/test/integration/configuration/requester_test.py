@@ -1,5 +1,7 @@
 import os
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import mock
 from mock import Mock, MagicMock
@@ -57,3 +59,61 @@ class ConanRequesterHeadersTests(unittest.TestCase):
             requester.get(url="aaa", headers={"User-Agent": "MyUserAgent"})
             headers = requester._http_requester.get.call_args[1]["headers"]
             self.assertEqual("MyUserAgent", headers["User-Agent"])
+
+
+class ConanRequesterPoolTests(unittest.TestCase):
+    def test_pool_maxsize(self):
+        requester = ConanRequester(ConfDefinition())
+        self.assertEqual(requester._http_requester.get_adapter("https://")._pool_maxsize, 10)
+
+        config = ConfDefinition()
+        config.update("core.download:parallel", 16)
+        config.update("core.upload:parallel", 12)
+        requester = ConanRequester(config)
+        self.assertEqual(requester._http_requester.get_adapter("https://")._pool_maxsize, 16)
+
+        config.update("core.net.http:pool_maxsize", 4)
+        requester = ConanRequester(config)
+        self.assertEqual(requester._http_requester.get_adapter("https://")._pool_maxsize, 4)
+
+    def test_keep_alive(self):
+        mock_http_requester = MagicMock()
+        with mock.patch("conans.client.rest.conan_requester.requests", mock_http_requester):
+            requester = ConanRequester(ConfDefinition())
+            requester.get(url="aaa")
+            headers = requester._http_requester.get.call_args[1]["headers"]
+            self.assertNotIn("Connection", headers)
+
+            config = ConfDefinition()
+            config.update("core.net.http:keep_alive", False)
+            requester = ConanRequester(config)
+            requester.get(url="aaa")
+            headers = requester._http_requester.get.call_args[1]["headers"]
+            self.assertEqual("close", headers["Connection"])
+
+    def test_connection_stats(self):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = "http://127.0.0.1:%s/file" % server.server_address[1]
+            requester = ConanRequester(ConfDefinition())
+            for _ in range(3):
+                self.assertEqual(requester.get(url).content, b"ok")
+            self.assertEqual({"connections": 1, "requests": 3, "reused": 2},
+                             requester.connection_stats())
+        finally:
+            server.shutdown()
+            server.server_close()
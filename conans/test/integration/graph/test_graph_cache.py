@@ -0,0 +1,87 @@
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient
+
+
+def test_graph_cache():
+    c = TestClient(default_server_user=True)
+    c.save_home({"global.conf": "core.graph:cache=True"})
+    c.save({"dep/conanfile.py": GenConanfile("dep"),
+            "tool/conanfile.py": GenConanfile("tool", "1.0"),
+            "conanfile.py": GenConanfile("app", "1.0").with_settings("build_type")
+                                                      .with_requires("dep/[>=1.0 <2]")
+                                                      .with_tool_requires("tool/[*]")})
+    c.run("create dep --version=1.0")
+    c.run("create tool")
+    c.run("install .")
+    assert "Using the cached resolution of the dependency graph" not in c.out
+    c.run("install .")
+    assert "Using the cached resolution of the dependency graph" in c.out
+    assert "dep/[>=1.0 <2]: dep/1.0" in c.out
+    assert "tool/[*]: tool/1.0" in c.out
+    c.run("install . -s build_type=Debug")  # Different profile
+    assert "Using the cached resolution of the dependency graph" not in c.out
+    c.run("install . -s build_type=Debug")
+    assert "Using the cached resolution of the dependency graph" in c.out
+    c.run("install . --update")
+    assert "Using the cached resolution of the dependency graph" not in c.out
+
+    # A new recipe in the cache invalidates the stored resolutions
+    c.run("create dep --version=1.1")
+    c.run("install .")
+    assert "Using the cached resolution of the dependency graph" not in c.out
+    assert "dep/[>=1.0 <2]: dep/1.1" in c.out
+    c.run("install .")
+    assert "Using the cached resolution of the dependency graph" in c.out
+    assert "dep/1.1" in c.out
+
+    # A change in the consumer conanfile too
+    c.save({"conanfile.py": GenConanfile("app", "1.0").with_settings("build_type")
+                                                      .with_requires("dep/[>=1.0 <1.1]")})
+    c.run("install .")
+    assert "Using the cached resolution of the dependency graph" not in c.out
+    assert "dep/[>=1.0 <1.1]: dep/1.0" in c.out
+    assert "tool/1.0" not in c.out
+
+
+def test_graph_cache_requires():
+    c = TestClient()
+    c.save_home({"global.conf": "core.graph:cache=True"})
+    c.save({"conanfile.py": GenConanfile("dep")})
+    c.run("create . --version=1.0")
+    c.run("install --requires=dep/[*]")
+    assert "Using the cached resolution of the dependency graph" not in c.out
+    c.run("install --requires=dep/[*]")
+    assert "Using the cached resolution of the dependency graph" in c.out
+    assert "dep/[*]: dep/1.0" in c.out
+    c.run("install --requires=dep/1.0")
+    assert "Using the cached resolution of the dependency graph" not in c.out
+    c.run("remove dep/1.0 -c")
+    c.run("install --requires=dep/[*]", assert_error=True)
+    assert "Using the cached resolution of the dependency graph" not in c.out
+    assert "Package 'dep/[*]' not resolved" in c.out
+
+
+def test_graph_cache_editable():
+    c = TestClient()
+    c.save_home({"global.conf": "core.graph:cache=True"})
+    c.save({"dep/conanfile.py": GenConanfile("dep"),
+            "app/conanfile.py": GenConanfile("app", "1.0").with_requires("dep/[>=1.0 <2]")})
+    c.run("create dep --version=1.0")
+    c.run("install app")
+    c.run("install app")
+    assert "Using the cached resolution of the dependency graph" in c.out
+    assert "dep/[>=1.0 <2]: dep/1.0" in c.out
+
+    # A new editable invalidates the stored resolutions
+    c.run("editable add dep --version=1.5")
+    c.run("install app")
+    assert "Using the cached resolution of the dependency graph" not in c.out
+    assert "dep/1.5 - Editable" in c.out
+    c.run("install app")
+    assert "Using the cached resolution of the dependency graph" in c.out
+    assert "dep/1.5 - Editable" in c.out
+
+    c.run("editable remove dep")
+    c.run("install app")
+    assert "Using the cached resolution of the dependency graph" in c.out  # The first one
+    assert "dep/[>=1.0 <2]: dep/1.0" in c.out
@@ -0,0 +1,175 @@
+import json
+import textwrap
+import threading
+import time
+
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, TestRequester
+
+
+def _graph_binaries(client, cmd):
+    client.run(cmd)
+    graph = json.loads(client.stdout)
+    return {n["ref"]: (n["package_id"], n["prev"], n["binary"], n["binary_remote"])
+            for n in graph["graph"]["nodes"].values()}
+
+
+def test_parallel_evaluation_same_as_serial():
+    # app -> pkg0..pkg5 -> dep, some binaries in the cache, others in the server or missing
+    c = TestClient(default_server_user=True)
+    c.save({"dep/conanfile.py": GenConanfile("dep", "1.0"),
+            "pkg/conanfile.py": GenConanfile(version="1.0").with_requires("dep/1.0")})
+    c.run("create dep")
+    requires = []
+    for i in range(6):
+        c.run(f"create pkg --name=pkg{i}")
+        requires.append(f"pkg{i}/1.0")
+    c.run("upload * -r=default -c")
+    c.run("remove pkg1/*:* -c")
+    c.run("remove pkg2/* -c")
+    c.run("remove pkg3/*:* -c")
+    c.run("remove pkg3/*:* -r=default -c")
+    c.save({"app/conanfile.py": GenConanfile("app", "1.0").with_requires(*requires)})
+
+    cmd = "graph info app -f=json"
+    serial = _graph_binaries(c, cmd)
+    parallel = _graph_binaries(c, cmd + " -cc core.graph:parallel=4")
+    assert serial == parallel
+    binaries = {ref.split("#")[0]: v[2] for ref, v in parallel.items() if ref}
+    assert binaries["pkg0/1.0"] == "Cache"
+    assert binaries["pkg1/1.0"] == "Download"
+    assert binaries["pkg2/1.0"] == "Download"
+    assert binaries["pkg3/1.0"] == "Missing"
+
+
+def test_parallel_evaluation_compatible():
+    # The Debug binary of the build context is compatible with the Release one of the host
+    # context, both in the same level, so they cannot be evaluated concurrently
+    c = TestClient(default_server_user=True)
+    conanfile = textwrap.dedent("""
+        from conan import ConanFile
+        class Pkg(ConanFile):
+            name = "tool"
+            version = "1.0"
+            settings = "build_type"
+            def compatibility(self):
+                if self.settings.build_type == "Debug":
+                    return [{"settings": [("build_type", "Release")]}]
+        """)
+    c.save({"tool/conanfile.py": conanfile,
+            "app/conanfile.py": GenConanfile("app", "1.0").with_requires("tool/1.0")
+                                                         .with_tool_requires("tool/1.0")})
+    c.run("create tool -s build_type=Release")
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+
+    cmd = "graph info app -s build_type=Release -s:b build_type=Debug -f=json"
+    serial = _graph_binaries(c, cmd)
+    c.run("remove tool/*:* -c")
+    parallel = _graph_binaries(c, cmd + " -cc core.graph:parallel=4")
+    assert serial == parallel
+    assert "Main binary package" in c.stderr
+
+
+def test_parallel_evaluation_output_order():
+    # Every package checks several compatible binaries in the cache and in the server, their
+    # messages are written in the same order as the serial evaluation
+    c = TestClient(default_server_user=True)
+    conanfile = textwrap.dedent("""
+        from conan import ConanFile
+        class Pkg(ConanFile):
+            version = "1.0"
+            settings = "build_type"
+            def compatibility(self):
+                return [{"settings": [("build_type", v)]} for v in ("A", "B", "C", "D")]
+        """)
+    c.save({"pkg/conanfile.py": conanfile,
+            "app/conanfile.py": GenConanfile("app", "1.0").with_requires(*[f"pkg{i}/1.0"
+                                                                          for i in range(8)])})
+    for i in range(8):
+        c.run(f"export pkg --name=pkg{i}")
+    c.save_home({"settings_user.yml": "build_type: [A, B, C, D]"})
+
+    cmd = "graph info app -s build_type=Release"
+    c.run(cmd)
+    serial = c.stderr
+    assert "Compatible configurations not found in cache, checking servers" in serial
+    for _ in range(3):
+        c.run(cmd + " -cc core.graph:parallel=8")
+        assert c.stderr == serial
+
+
+class ConcurrencyRequester(TestRequester):
+    """ records the maximum number of concurrent requests of the latest package revisions """
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def get(self, url, **kwargs):
+        if "/packages/" not in url or not url.endswith("/latest"):
+            return super(ConcurrencyRequester, self).get(url, **kwargs)
+        cls = ConcurrencyRequester
+        with cls.lock:
+            cls.running += 1
+            cls.max_running = max(cls.max_running, cls.running)
+        try:
+            time.sleep(0.2)
+            return super(ConcurrencyRequester, self).get(url, **kwargs)
+        finally:
+            with cls.lock:
+                cls.running -= 1
+
+
+def test_parallel_evaluation_remote_limit():
+    c = TestClient(requester_class=ConcurrencyRequester, default_server_user=True)
+    c.save({"pkg/conanfile.py": GenConanfile(version="1.0"),
+            "app/conanfile.py": GenConanfile("app", "1.0").with_requires(*[f"pkg{i}/1.0"
+                                                                          for i in range(8)])})
+    for i in range(8):
+        c.run(f"create pkg --name=pkg{i}")
+    c.run("upload * -r=default -c")
+    c.run("remove *:* -c")
+
+    ConcurrencyRequester.max_running = 0
+    c.run("graph info app -cc core.graph:parallel=8 -cc core.graph:parallel_remote=2")
+    assert ConcurrencyRequester.max_running == 2
+    assert c.out.count("binary: Download") == 8
+
+
+def _graph_recipes(client, cmd):
+    client.run(cmd)
+    graph = json.loads(client.stdout)
+    return [(n["ref"], n["recipe"], n["remote"]) for n in graph["graph"]["nodes"].values()]
+
+
+def test_parallel_recipes_prefetch():
+    # app -> pkg0..pkg4 -> dep, also a version range and a pinned revision, all from the server
+    c = TestClient(default_server_user=True)
+    c.save({"dep/conanfile.py": GenConanfile("dep"),
+            "pkg/conanfile.py": GenConanfile(version="1.0").with_requires("dep/[>=1.0 <2]")})
+    c.run("create dep --version=1.0")
+    c.run("create dep --version=1.1")
+    requires = ["dep/[>=1.0 <2]"]
+    for i in range(5):
+        c.run(f"create pkg --name=pkg{i}")
+        requires.append(f"pkg{i}/1.0")
+    rrev = c.exported_recipe_revision()
+    requires[-1] = f"pkg4/1.0#{rrev}"
+    c.run("upload * -r=default -c")
+    c.save({"app/conanfile.py": GenConanfile("app", "1.0").with_requires(*requires)})
+
+    c.run("remove * -c")
+    cmd = "graph info app -f=json"
+    serial = _graph_recipes(c, cmd)
+    c.run("remove * -c")
+    parallel = _graph_recipes(c, cmd + " -cc core.graph:parallel=4")
+    assert serial == parallel
+    assert all(recipe == "Downloaded" for _, recipe, remote in parallel if remote)
+    assert len([remote for _, _, remote in parallel if remote]) == 6
+    assert "dep/1.1" in c.stderr
+
+    # Also with a lockfile, that pins the revisions of the prefetched recipes
+    c.run("lock create app")
+    c.run("remove * -c")
+    locked = _graph_recipes(c, cmd + " -cc core.graph:parallel=4 --lockfile=app/conan.lock")
+    assert locked == serial
@@ -15,7 +15,7 @@ class TestVersionRangesCache:
     def _setup(self):
         self.counters = {"server0": 0, "server1": 0}
 
-    def _mocked_search_recipes(self, remote, pattern, ignorecase=True):
+    def _mocked_search_recipes(self, remote, pattern, cached=False):
         packages = {
             "server0": [RecipeReference.loads("liba/1.0.0"),
                         RecipeReference.loads("liba/1.1.0")],
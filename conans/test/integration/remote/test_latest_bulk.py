@@ -0,0 +1,74 @@
+from collections import OrderedDict
+
+from conans import BULK_LATEST
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, TestRequester, TestServer, NO_SETTINGS_PACKAGE_ID
+
+
+class RequesterClass(TestRequester):
+
+    def get(self, url, **kwargs):
+        print(f"GET: {url}")
+        return super(RequesterClass, self).get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        print(f"POST: {url}")
+        return super(RequesterClass, self).post(url, **kwargs)
+
+
+def _client(server_capabilities):
+    servers = OrderedDict([("default", TestServer(users={"admin": "password"},
+                                                  server_capabilities=server_capabilities))])
+    c = TestClient(servers=servers, inputs=["admin", "password"], requester_class=RequesterClass)
+    c.save({"liba/conanfile.py": GenConanfile("liba", "0.1"),
+            "libb/conanfile.py": GenConanfile("libb", "0.1"),
+            "app/conanfile.py": GenConanfile("app", "0.1").with_requires("liba/0.1", "libb/0.1")})
+    c.run("create liba")
+    c.run("create libb")
+    c.run("export libb --user=other")  # Only the recipe, without binaries
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+    c.save_home({"global.conf": "core.graph:bulk_latest=True"})
+    return c
+
+
+def test_latest_bulk():
+    c = _client(server_capabilities=[BULK_LATEST])
+    c.run("install app")
+    c.assert_listed_binary({"liba/0.1": (NO_SETTINGS_PACKAGE_ID, "Download (default)"),
+                            "libb/0.1": (NO_SETTINGS_PACKAGE_ID, "Download (default)")})
+    # 1 request for both recipes, 1 for both binaries, none of them one by one
+    assert c.out.count("POST: http://fake") == 2
+    assert "/latest" not in c.out.replace("/conans/latest", "")
+
+    # The ones not found in the remote are not requested again one by one
+    c.save({"app/conanfile.py": GenConanfile("app", "0.1").with_requires("libc/0.1")})
+    c.run("install app", assert_error=True)
+    assert "Unable to find 'libc/0.1' in remotes" in c.out
+    c.save({"app/conanfile.py": GenConanfile("app", "0.1").with_requires("libb/0.1@other")})
+    c.run("install app", assert_error=True)
+    assert "ERROR: Missing prebuilt package for 'libb/0.1@other'" in c.out
+    assert "/latest" not in c.out.replace("/conans/latest", "")
+
+
+def test_latest_bulk_not_supported():
+    c = _client(server_capabilities=[])
+    c.run("install app")
+    c.assert_listed_binary({"liba/0.1": (NO_SETTINGS_PACKAGE_ID, "Download (default)"),
+                            "libb/0.1": (NO_SETTINGS_PACKAGE_ID, "Download (default)")})
+    assert "POST: http://fake" not in c.out
+    # The latest revision of every recipe and binary, one by one
+    requests = [line for line in c.out.splitlines() if line.startswith("GET: http://fake")
+                and line.endswith("/latest")]
+    assert len(requests) == 4
+    assert len([r for r in requests if "/packages/" in r]) == 2
+
+
+def test_latest_bulk_opt_in():
+    # Without core.graph:bulk_latest, the latest revisions are requested one by one
+    c = _client(server_capabilities=[BULK_LATEST])
+    c.save_home({"global.conf": ""})
+    c.run("install app")
+    c.assert_listed_binary({"liba/0.1": (NO_SETTINGS_PACKAGE_ID, "Download (default)"),
+                            "libb/0.1": (NO_SETTINGS_PACKAGE_ID, "Download (default)")})
+    assert "POST: http://fake" not in c.out
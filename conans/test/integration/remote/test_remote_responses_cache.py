@@ -0,0 +1,64 @@
+import os
+
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, TestRequester
+
+
+class RecordingRequester(TestRequester):
+    """ records the status of the GET requests of files lists and latest revisions """
+    responses = []
+
+    def get(self, url, **kwargs):
+        response = super(RecordingRequester, self).get(url, **kwargs)
+        if url.endswith("/files") or url.endswith("/latest"):
+            RecordingRequester.responses.append((url, response.status_code))
+        return response
+
+
+def test_remote_responses_etag():
+    c = TestClient(requester_class=RecordingRequester, default_server_user=True)
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0")})
+    c.run("create .")
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+    RecordingRequester.responses = []
+    c.run("install --requires=pkg/1.0")
+    first = RecordingRequester.responses
+    assert first and all(status == 200 for _, status in first)
+    assert os.listdir(os.path.join(c.cache_folder, ".remote_responses"))
+
+    # The same requests are answered with 304 Not Modified, and the cached responses are used
+    c.run("remove * -c")
+    RecordingRequester.responses = []
+    c.run("install --requires=pkg/1.0")
+    assert RecordingRequester.responses == [(url, 304) for url, _ in first]
+    c.run("list pkg/1.0:*")
+    assert "da39a3ee5e6b4b0d3255bfef95601890afd80709" in c.out
+
+    # A new revision changes the latest one
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0").with_class_attribute("x = 1")})
+    c.run("create .")
+    rrev = c.exported_recipe_revision()
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+    c.run("install --requires=pkg/1.0")
+    assert rrev in c.out
+
+
+def test_remote_responses_removed():
+    c = TestClient(default_server_user=True)
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0")})
+    c.run("create .")
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+    c.run("install --requires=pkg/1.0")
+    responses_folder = os.path.join(c.cache_folder, ".remote_responses")
+    assert os.listdir(responses_folder)
+    c.run("cache clean --temp")
+    assert not os.path.exists(responses_folder)
+
+    c.run("remove * -c")
+    c.run("install --requires=pkg/1.0")
+    assert os.listdir(responses_folder)
+    c.run("remote remove default")
+    assert os.listdir(responses_folder) == []
@@ -0,0 +1,42 @@
+import os
+
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, NO_SETTINGS_PACKAGE_ID
+
+
+def test_remotes_cache_ttl():
+    c = TestClient(default_server_user=True)
+    c.save({"dep/conanfile.py": GenConanfile("dep"),
+            "app/conanfile.py": GenConanfile("app", "1.0").with_requires("dep/[>=1.0 <2]")})
+    c.run("create dep --version=1.0")
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+    c.save_home({"global.conf": "core.cache:remotes_ttl=3600"})
+    c.run("install app")
+    assert "dep/[>=1.0 <2]: dep/1.0" in c.out
+    assert os.path.isfile(os.path.join(c.cache.store, "remotes_cache.sqlite3"))
+
+    # A new version in the server is not used, the previous search answer is still valid
+    c2 = TestClient(servers=c.servers, inputs=["admin", "password"])
+    c2.save({"conanfile.py": GenConanfile("dep")})
+    c2.run("create . --version=1.1")
+    c2.run("upload * -r=default -c")
+    c.run("remove * -c")
+    c.run("install app")
+    assert "dep/[>=1.0 <2]: dep/1.0" in c.out
+    c.assert_listed_binary({"dep/1.0": (NO_SETTINGS_PACKAGE_ID, "Download (default)")})
+
+    # --update always queries the server and refreshes the stored answers
+    c.run("install app --update")
+    assert "dep/[>=1.0 <2]: dep/1.1" in c.out
+    c.run("remove * -c")
+    c.run("install app")
+    assert "dep/[>=1.0 <2]: dep/1.1" in c.out
+
+    # Disabled by default, the server is always queried
+    c2.run("create . --version=1.2")
+    c2.run("upload * -r=default -c")
+    c.save_home({"global.conf": ""})
+    c.run("remove * -c")
+    c.run("install app")
+    assert "dep/[>=1.0 <2]: dep/1.2" in c.out
@@ -0,0 +1,93 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.server_launcher import TestServerLauncher
+from conans.test.utils.tools import TestClient, get_free_port
+from conans.util.env import environment_update
+
+
+def _server_with_package(threads, package_size):
+    """ a real (sockets) conan_server with a package of 'package_size' random bytes """
+    with environment_update({"CONAN_SERVER_PORT": str(get_free_port())}):
+        server = TestServerLauncher(write_permissions=[("*/*@*/*", "*")])
+    server.start(threads=threads)
+    url = "http://127.0.0.1:%s" % server.port
+
+    c = TestClient()
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0").with_exports_sources("*.bin")
+                                                      .with_import("from conan.tools.files "
+                                                                   "import copy")
+                                                      .with_package("copy(self, '*.bin', "
+                                                                    "self.source_folder, "
+                                                                    "self.package_folder)")})
+    with open(os.path.join(c.current_folder, "data.bin"), "wb") as f:
+        f.write(os.urandom(package_size))
+    c.run("create .")
+    rrev = c.exported_recipe_revision()
+    pref = c.created_package_reference("pkg/1.0")
+    c.run(f"remote add default {url}")
+    c.run("remote login default private_user -p private_pass")
+    c.run("upload * -r=default -c")
+    package_url = (f"{url}/v2/conans/pkg/1.0/_/_/revisions/{rrev}/packages/{pref.package_id}"
+                   f"/revisions/{pref.revision}/files/conan_package.tgz")
+    return server, url, package_url
+
+
+def _slow_download(package_url, done):
+    """ a client with a slow connection downloading the big package """
+    with requests.get(package_url, stream=True) as r:
+        for _ in r.iter_content(chunk_size=1024 * 1024):
+            time.sleep(0.2)
+    done.set()
+
+
+def _swarm(urls, clients, requests_per_client):
+    """ 'clients' concurrent clients, each one doing 'requests_per_client' requests of the urls,
+    returns the latency of every request and the total time
+    """
+    def client():
+        latencies = []
+        with requests.Session() as session:
+            for i in range(requests_per_client):
+                t = time.time()
+                r = session.get(urls[i % len(urls)])
+                assert r.status_code == 200, r.text
+                latencies.append(time.time() - t)
+        return latencies
+
+    t = time.time()
+    with ThreadPoolExecutor(clients) as executor:
+        results = [executor.submit(client) for _ in range(clients)]
+        latencies = [latency for result in results for latency in result.result()]
+    return latencies, time.time() - t
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("threads", [1, 8])
+def test_server_load_benchmark(threads):
+    package_size = 10 * 1024 * 1024
+    server, url, package_url = _server_with_package(threads, package_size)
+    try:
+        done = threading.Event()
+        slow = threading.Thread(target=_slow_download, args=(package_url, done), daemon=True)
+        slow.start()
+        time.sleep(0.5)
+        urls = [f"{url}/v1/ping",
+                f"{url}/v2/conans/search?q=pkg*",
+                f"{url}/v2/conans/pkg/1.0/_/_/latest"]
+        latencies, elapsed = _swarm(urls, clients=8, requests_per_client=25)
+        latencies.sort()
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        print(f"threads={threads}: {len(latencies) / elapsed:.1f} requests/s, "
+              f"p99 {p99 * 1000:.1f} ms, slow download finished before: {done.is_set()}")
+        if threads > 1:  # The slow download doesn't block the other clients
+            assert not done.is_set()
+        slow.join()
+    finally:
+        server.stop()
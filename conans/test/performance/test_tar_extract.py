@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import tar_extract, gzopen_without_timestamps, save
+
+
+def _archive(folder, num_files, file_size):
+    src = os.path.join(folder, "src")
+    for i in range(num_files):
+        save(os.path.join(src, f"folder{i % 50}", f"file{i}"), "x" * file_size)
+    tgz_file = os.path.join(folder, "file.tgz")
+    with open(tgz_file, "wb") as tgz_handle:
+        tgz = gzopen_without_timestamps("name", mode="w", fileobj=tgz_handle)
+        tgz.add(src, ".")
+        tgz.close()
+    return tgz_file
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("num_files, file_size", [(10000, 2000),  # header-heavy
+                                                  (20, 10 * 1024 * 1024)])  # binary-heavy
+def test_tar_extract_parallel_benchmark(num_files, file_size):
+    folder = temp_folder()
+    tgz_file = _archive(folder, num_files, file_size)
+
+    for parallel in (1, 4, 8):
+        destination_dir = os.path.join(folder, f"dest{parallel}")
+        with open(tgz_file, "rb") as file_handler:
+            tar_extract(file_handler, destination_dir, parallel=parallel)
+        extracted = [os.path.join(root, f) for root, _, files in os.walk(destination_dir)
+                     for f in files]
+        assert len(extracted) == num_files
+        assert all(os.path.getsize(f) == file_size for f in extracted)
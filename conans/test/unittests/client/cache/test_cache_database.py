@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import threading
+from unittest import mock
+
+from conan.internal.cache.db.cache_database import CacheDatabase
+from conan.internal.cache.db.table import close_db_connections
+from conans.model.recipe_ref import RecipeReference
+from conans.test.utils.test_files import temp_folder
+
+
+def _database():
+    filename = os.path.join(temp_folder(), "cache.sqlite3")
+    db = CacheDatabase(filename)
+    ref = RecipeReference.loads("pkg/0.1#rrev%1")
+    db.create_recipe("path", ref)
+    return filename, db, ref
+
+
+def test_connection_reuse():
+    filename, db, ref = _database()
+    with db._recipes.db_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    with db._packages.db_connection() as conn2:
+        assert conn2 is conn
+
+    connections = []
+
+    def other_thread():
+        with db._recipes.db_connection() as c:
+            connections.append(c)
+            assert db.get_recipe(ref)["path"] == "path"
+    t = threading.Thread(target=other_thread)
+    t.start()
+    t.join()
+    assert connections[0] is not conn
+
+    close_db_connections()
+    with db._recipes.db_connection() as conn3:
+        assert conn3 is not conn
+    # The database file is removed, a new connection is needed
+    close_db_connections()
+    os.remove(filename)
+    db = CacheDatabase(filename)
+    with db._recipes.db_connection() as conn4:
+        assert conn4 is not conn3
+    assert db.list_references() == []
+
+
+def test_deferred_lru():
+    filename, db, ref = _database()
+    lru = db.get_recipe_lru(ref)
+
+    def stored_lru():
+        with sqlite3.connect(filename) as connection:
+            return connection.execute("SELECT lru FROM recipes").fetchone()[0]
+
+    with mock.patch("conan.internal.cache.db.recipes_table.timestamp_now", return_value=lru + 1):
+        db.update_recipe_lru(ref)
+    with mock.patch("conan.internal.cache.db.recipes_table.timestamp_now", return_value=lru + 2):
+        db.update_recipe_lru(ref)
+    assert stored_lru() == lru
+    # Reading the LRU writes the pending ones
+    assert db.get_recipe_lru(ref) == lru + 2
+    assert stored_lru() == lru + 2
+
+    with mock.patch("conan.internal.cache.db.recipes_table.timestamp_now", return_value=lru + 3):
+        db.update_recipe_lru(ref)
+    close_db_connections()
+    assert stored_lru() == lru + 3
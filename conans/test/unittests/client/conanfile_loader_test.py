@@ -2,12 +2,16 @@ import os
 import sys
 import textwrap
 import unittest
+from unittest import mock
 
 import pytest
 from parameterized import parameterized
 
-from conans.client.loader import ConanFileLoader, ConanFileTextLoader, load_python_file
+from conan.internal.cache.bytecode_cache import BytecodeCache
+from conans.client.loader import ConanFileLoader, ConanFileTextLoader, load_python_file, \
+    _compiled_code
 from conans.errors import ConanException
+from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import save, chdir
 
@@ -35,6 +39,50 @@ class BasePackage(ConanFile):
         result = loader.load_consumer(conanfile_path)
         self.assertEqual(result.short_paths, True)
 
+    def test_bytecode_cache(self):
+        tmp_dir = temp_folder()
+        store_folder = os.path.join(tmp_dir, "p")
+        bytecode_cache = BytecodeCache(os.path.join(tmp_dir, "c"), store_folder)
+        conanfile_path = os.path.join(store_folder, "pkg", "e", "conanfile.py")
+        save(conanfile_path, str(GenConanfile("pkg", "0.1").with_class_attribute("myattr = 42")))
+        consumer_path = os.path.join(tmp_dir, "conanfile.py")
+        save(consumer_path, str(GenConanfile("consumer")))
+
+        ConanFileLoader(None, bytecode_cache=bytecode_cache).load_basic(conanfile_path)
+        ConanFileLoader(None, bytecode_cache=bytecode_cache).load_basic(consumer_path)
+        # Only the files in the cache are stored
+        stored = [f for _, _, files in os.walk(os.path.join(tmp_dir, "c")) for f in files]
+        self.assertEqual(len(stored), 1)
+
+        # Other processes don't need to compile the recipe again
+        _compiled_code.clear()
+        with mock.patch("conans.client.loader.compile", create=True) as compile_mock:
+            conanfile = ConanFileLoader(None, bytecode_cache=bytecode_cache).load_basic(
+                conanfile_path)
+        self.assertFalse(compile_mock.called)
+        self.assertEqual(conanfile.myattr, 42)
+
+        # A different content is not taken from the stored bytecode
+        _compiled_code.clear()
+        save(conanfile_path, str(GenConanfile("pkg", "0.1").with_class_attribute("myattr = 43")))
+        conanfile = ConanFileLoader(None, bytecode_cache=bytecode_cache).load_basic(conanfile_path)
+        self.assertEqual(conanfile.myattr, 43)
+
+    def test_compiled_code_bounded(self):
+        tmp_dir = temp_folder()
+        paths = []
+        for i in range(3):
+            path = os.path.join(tmp_dir, f"conanfile{i}.py")
+            save(path, str(GenConanfile(f"pkg{i}")))
+            paths.append(path)
+        _compiled_code.clear()
+        with mock.patch("conans.client.loader._COMPILED_CODE_MAXSIZE", 2):
+            for path in paths:
+                ConanFileLoader(None).load_basic(path)
+            ConanFileLoader(None).load_basic(paths[1])  # The least recently used is the first
+            ConanFileLoader(None).load_basic(paths[0])
+        self.assertEqual([path for path, _ in _compiled_code], [paths[1], paths[0]])
+
 
 class ConanLoaderTxtTest(unittest.TestCase):
     def test_conanfile_txt_errors(self):
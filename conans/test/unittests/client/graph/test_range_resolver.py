@@ -0,0 +1,39 @@
+import pytest
+
+from conans.client.graph.range_resolver import _VersionIndex
+from conans.model.recipe_ref import RecipeReference
+from conans.model.version_range import VersionRange
+from conans.test.unittests.model.version.test_version_range import values
+
+
+def _refs():
+    versions = set()
+    for _, _, versions_in, versions_out in values:
+        versions.update(versions_in)
+        versions.update(versions_out)
+    versions.update(["1.0", "1", "1.0.0", "1.0.0-pre.1", "2.0.0+1", "3.2", "3.9.9", "a.b"])
+    refs = [RecipeReference.loads(f"pkg/{v}") for v in versions]
+    # repeated versions with different revisions, the latest one must be used
+    for i, v in enumerate(("1.0.0", "2.1.3", "1.5.1")):
+        ref = RecipeReference.loads(f"pkg/{v}#rev{i}")
+        ref.timestamp = 10 + i
+        refs.append(ref)
+    return refs
+
+
+@pytest.mark.parametrize("version_range", sorted(set(v[0] for v in values)))
+@pytest.mark.parametrize("resolve_prereleases", [None, True, False])
+def test_version_index_same_as_sorted_scan(version_range, resolve_prereleases):
+    refs = _refs()
+    version_range = VersionRange(version_range)
+    expected = None
+    for ref in reversed(sorted(refs)):
+        if version_range.contains(ref.version, resolve_prereleases):
+            expected = ref
+            break
+    result = _VersionIndex(refs).resolve(version_range, resolve_prereleases)
+    assert repr(result) == repr(expected)
+
+
+def test_version_index_empty():
+    assert _VersionIndex([]).resolve(VersionRange(">1"), None) is None
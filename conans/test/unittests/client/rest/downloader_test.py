@@ -1,12 +1,17 @@
+import io
 import os
 import re
+import tarfile
 import tempfile
 import unittest
+from unittest import mock
 
 import pytest
 
 from conans.client.downloaders.file_downloader import FileDownloader
 from conans.errors import ConanException
+from conans.util.files import load
+from conans.util.sha import sha1
 
 
 class MockResponse(object):
@@ -113,3 +118,41 @@ class DownloaderUnitTest(unittest.TestCase):
         downloader.download("fake_url", file_path=self.target)
         actual_content = open(self.target, "rb").read()
         self.assertEqual(expected_content, actual_content)
+
+
+class TestDownloadExtract:
+
+    @staticmethod
+    def _tgz():
+        data = b"some data"
+        tgz = io.BytesIO()
+        with tarfile.open(fileobj=tgz, mode="w:gz") as tar:
+            info = tarfile.TarInfo("folder/file.txt")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        return tgz.getvalue()
+
+    def test_download_extract(self):
+        tgz = self._tgz()
+        dest = os.path.join(tempfile.mkdtemp(), "pkg")
+        requester = MockRequester(tgz, echo_header={"X-Checksum-Sha1": sha1(tgz)})
+        FileDownloader(requester=requester).download_extract("fake_url", dest)
+        assert load(os.path.join(dest, "folder", "file.txt")) == "some data"
+
+    def test_download_extract_wrong_checksum(self):
+        tgz = self._tgz()
+        dest = os.path.join(tempfile.mkdtemp(), "pkg")
+        requester = MockRequester(tgz, echo_header={"X-Checksum-Sha1": sha1(b"other")})
+        requester.get = mock.Mock(wraps=requester.get)
+        with pytest.raises(ConanException, match="sha1 signature failed"):
+            FileDownloader(requester=requester).download_extract("fake_url", dest, retry=1)
+        assert not os.path.exists(dest)
+        assert requester.get.call_count == 1  # A corrupted file is not retried
+
+    def test_download_extract_interrupted(self):
+        tgz = self._tgz()
+        dest = os.path.join(tempfile.mkdtemp(), "pkg")
+        requester = MockRequester(tgz, chunk_size=len(tgz) // 2)
+        with pytest.raises(ConanException, match="Download failed"):
+            FileDownloader(requester=requester).download_extract("fake_url", dest, retry=0)
+        assert not os.path.exists(dest)
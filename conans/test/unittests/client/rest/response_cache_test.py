@@ -0,0 +1,41 @@
+import os
+import time
+
+from conans.client.rest.response_cache import ResponseCache
+from conans.test.utils.test_files import temp_folder
+
+
+def test_response_cache():
+    folder = temp_folder()
+    cache = ResponseCache(folder, max_age=3600, maxsize=2)
+    cache.set("http://remote1", "http://remote1/v2/latest", "etag1", {"revision": "1"})
+    assert cache.get("http://remote1", "http://remote1/v2/latest") == ("etag1", {"revision": "1"})
+    assert cache.get("http://remote2", "http://remote1/v2/latest") is None
+
+    cache.set("http://remote2", "http://remote2/v2/latest", "etag2", {"revision": "2"})
+    cache.clear("http://remote1")
+    assert cache.get("http://remote1", "http://remote1/v2/latest") is None
+    assert cache.get("http://remote2", "http://remote2/v2/latest") == ("etag2", {"revision": "2"})
+
+    # The ones not validated in max_age are not used
+    path = os.path.join(folder, os.listdir(folder)[0])
+    old = time.time() - 7200
+    for f in os.listdir(path):
+        os.utime(os.path.join(path, f), (old, old))
+    assert cache.get("http://remote2", "http://remote2/v2/latest") is None
+
+
+def test_response_cache_maxsize():
+    folder = temp_folder()
+    cache = ResponseCache(folder, maxsize=2)
+    urls = [f"http://remote/v2/{i}/latest" for i in range(3)]
+    for i, url in enumerate(urls):
+        cache.set("http://remote", url, "etag", {})
+        mtime = time.time() - 100 + i
+        os.utime(cache._path("http://remote", url), (mtime, mtime))
+    cache.touch("http://remote", urls[0])
+    # The least recently validated are removed the next time
+    ResponseCache(folder, maxsize=2).set("http://remote", urls[2], "etag", {})
+    assert cache.get("http://remote", urls[0]) is not None
+    assert cache.get("http://remote", urls[1]) is None
+    assert cache.get("http://remote", urls[2]) is not None
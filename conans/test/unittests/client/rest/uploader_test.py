@@ -1,4 +1,5 @@
 import tempfile
+import time
 import unittest
 from collections import namedtuple
 
@@ -59,3 +60,27 @@ class UploaderUnitTest(unittest.TestCase):
         save(f, "some contents")
         with self.assertRaisesRegex(InternalErrorException, "tururu"):
             uploader.upload("fake_url", self.f, dedup=True)
+
+
+def test_upload_bandwidth():
+    class _BandwidthConfigMock(_ConfigMock):
+        def get(self, name, default=None, check_type=None):
+            return 1000 if name == "core.upload:max_bandwidth" else default
+
+    class ReadingRequester:
+        @staticmethod
+        def put(*args, **kwargs):
+            data = kwargs["data"]
+            assert len(data) == 500
+            while data.read(100):
+                pass
+            return namedtuple("response", "status_code raise_for_status")(200, lambda: None)
+
+    _, f = tempfile.mkstemp()
+    save(f, "x" * 500)
+    uploader = FileUploader(ReadingRequester(), verify=False, config=_BandwidthConfigMock())
+    start = time.time()
+    uploader.upload("fake_url", f)
+    uploader.upload("fake_url", f)
+    # The second 500 bytes are only sent half a second after the first ones, at 1000 bytes/s
+    assert time.time() - start > 0.4
@@ -1,5 +1,8 @@
+import json
 import os
 import platform
+import time
+from unittest import mock
 
 import pytest
 
@@ -82,3 +85,39 @@ def test_pycache_included():
     manifest = repr(manifest)
     assert "pythonfile.pyc" in manifest
     assert "__pycache__/damn.py" in manifest
+
+
+def test_tree_manifest_stat_cache():
+    tmp_dir = temp_folder()
+    folder = os.path.join(tmp_dir, "p")
+    stat_cache = os.path.join(tmp_dir, "stat_cache.json")
+    save(os.path.join(folder, "file1.txt"), "content1")
+    save(os.path.join(folder, "sub", "file2.txt"), "content2")
+
+    # Files modified so recently are not cached, they could change without a visible stat change
+    manifest = FileTreeManifest.create(folder, stat_cache=stat_cache)
+    assert manifest.file_sums == {"file1.txt": md5("content1"), "sub/file2.txt": md5("content2")}
+    assert not os.path.exists(stat_cache)
+
+    # The change time cannot be modified, the clock is moved forward instead
+    with mock.patch("conans.model.manifest.time") as clock:
+        clock.time.return_value = time.time() + 10
+        manifest = FileTreeManifest.create(folder, stat_cache=stat_cache)
+        assert manifest.file_sums == {"file1.txt": md5("content1"),
+                                      "sub/file2.txt": md5("content2")}
+        assert sorted(json.loads(load(stat_cache))) == ["file1.txt", "sub/file2.txt"]
+
+        # The cached md5 are used, not hashing again
+        with mock.patch("conans.model.manifest.md5sum") as md5sum:
+            manifest = FileTreeManifest.create(folder, stat_cache=stat_cache)
+            assert not md5sum.called
+        assert manifest.file_sums == {"file1.txt": md5("content1"),
+                                      "sub/file2.txt": md5("content2")}
+
+        # A modified file is hashed again, even if it keeps its size and modification time
+        st = os.stat(os.path.join(folder, "file1.txt"))
+        save(os.path.join(folder, "file1.txt"), "CONTENT1")
+        os.utime(os.path.join(folder, "file1.txt"), ns=(st.st_atime_ns, st.st_mtime_ns))
+        manifest = FileTreeManifest.create(folder, stat_cache=stat_cache)
+        assert manifest.file_sums == {"file1.txt": md5("CONTENT1"),
+                                      "sub/file2.txt": md5("content2")}
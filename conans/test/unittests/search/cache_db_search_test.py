@@ -1,3 +1,44 @@
-class CacheDbSearchTest:
-    # TODO: cache2.0 add some unittests for serach in cache db
-    pass
+import os
+
+import pytest
+
+from conan.internal.cache.db.cache_database import CacheDatabase
+from conans.model.recipe_ref import RecipeReference
+from conans.search.search import search_recipes
+from conans.test.utils.test_files import temp_folder
+
+
+class _Cache:
+    def __init__(self, refs):
+        self._db = CacheDatabase(os.path.join(temp_folder(), "cache.sqlite3"))
+        for i, ref in enumerate(refs):
+            self._db.create_recipe(f"path{i}", RecipeReference.loads(ref))
+
+    def all_refs(self, prefix=None, ignorecase=True):
+        return self._db.list_references(prefix, ignorecase)
+
+
+@pytest.fixture(scope="module")
+def cache():
+    return _Cache(["zlib/1.2.11#rev1%1", "zlib/1.2.13#rev2%2", "zlib_ng/2.0#rev3%3",
+                   "Zlib/1.0@user/channel#rev4%4", "openssl/3.0#rev5%5", "zlibx/1.0#rev6%6"])
+
+
+@pytest.mark.parametrize("pattern, ignorecase, expected", [
+    (None, True, ["zlibx/1.0", "openssl/3.0", "Zlib/1.0@user/channel", "zlib_ng/2.0",
+                  "zlib/1.2.13", "zlib/1.2.11"]),
+    ("zlib/*", True, ["Zlib/1.0@user/channel", "zlib/1.2.13", "zlib/1.2.11"]),
+    ("zlib/*", False, ["zlib/1.2.13", "zlib/1.2.11"]),
+    ("zlib", True, ["Zlib/1.0@user/channel", "zlib/1.2.13", "zlib/1.2.11"]),
+    ("zlib_*", True, ["zlib_ng/2.0"]),
+    ("zlib/1.2.1?", True, ["zlib/1.2.13", "zlib/1.2.11"]),
+    ("zlib/1.2.11", True, ["zlib/1.2.11"]),
+    ("zlib/1.2.11#rev1*", True, ["zlib/1.2.11"]),
+    ("zlib/1.2.11#rev2*", True, []),
+    ("*@user/channel", True, ["Zlib/1.0@user/channel"]),
+    ("*ssl*", True, ["openssl/3.0"]),
+    ("zl", True, []),
+])
+def test_search_recipes(cache, pattern, ignorecase, expected):
+    refs = search_recipes(cache, pattern, ignorecase)
+    assert [str(r) for r in refs] == expected
@@ -83,6 +83,9 @@ text=value
         self.assertEqual(config.host_name, "localhost")
         self.assertEqual(config.public_port, 12345)
         self.assertEqual(config.public_url, "https://localhost:12345/v2")
+        # Not defined in old server.conf files
+        self.assertEqual(config.workers, 1)
+        self.assertEqual(config.threads, 1)
 
         # Now check with environments
         tmp_storage = temp_folder()
@@ -94,6 +97,8 @@ text=value
         self.environ["CONAN_SERVER_USERS"] = "lasote:lasotepass,pepe2:pepepass2"
         self.environ["CONAN_HOST_NAME"] = "remotehost"
         self.environ["CONAN_SERVER_PUBLIC_PORT"] = "33333"
+        self.environ["CONAN_SERVER_WORKERS"] = "4"
+        self.environ["CONAN_SERVER_THREADS"] = "16"
 
         config = ConanServerConfigParser(self.file_path, environment=self.environ)
         self.assertEqual(config.jwt_secret,  "newkey")
@@ -108,3 +113,10 @@ text=value
         self.assertEqual(config.host_name, "remotehost")
         self.assertEqual(config.public_port, 33333)
         self.assertEqual(config.public_url, "http://remotehost:33333/v2")
+        self.assertEqual(config.workers, 4)
+        self.assertEqual(config.threads, 16)
+
+        self.environ["CONAN_SERVER_THREADS"] = "many"
+        config = ConanServerConfigParser(self.file_path, environment=self.environ)
+        with self.assertRaisesRegex(ConanException, "'server.threads' must be a positive integer"):
+            config.threads
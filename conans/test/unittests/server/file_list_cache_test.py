@@ -0,0 +1,40 @@
+import os
+
+from conans.server.store.file_list_cache import FileListCache
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+def test_file_list_cache():
+    folder = temp_folder()
+    save(os.path.join(folder, "conanmanifest.txt"), "")
+    computed = []
+
+    def compute(f):
+        computed.append(f)
+        return sorted(os.listdir(f))
+
+    cache = FileListCache(maxsize=1)
+    assert cache.get(folder, compute) == ["conanmanifest.txt"]
+    assert cache.get(folder, compute) == ["conanmanifest.txt"]
+    assert len(computed) == 1
+
+    save(os.path.join(folder, "metadata", "logs.txt"), "")
+    cache.invalidate(folder)
+    assert cache.get(folder, compute) == ["conanmanifest.txt", "metadata"]
+    assert len(computed) == 2
+
+    # Another server process changing the files updates the folder time
+    other = FileListCache()
+    other.invalidate(folder)
+    cache.get(folder, compute)
+    assert len(computed) == 3
+
+    # The least recently used is evicted
+    other_folder = temp_folder()
+    cache.get(other_folder, compute)
+    cache.get(folder, compute)
+    assert len(computed) == 5
+
+    # Removed folders are not cached
+    assert cache.get(os.path.join(folder, "missing"), lambda f: []) == []
@@ -1,8 +1,15 @@
 import copy
+import io
+import json
 import os
+import threading
+import time
 import unittest
+from unittest import mock
 
-from conans.errors import NotFoundException
+from bottle import HTTPResponse
+
+from conans.errors import NotFoundException, RequestErrorException
 from conans.model.manifest import FileTreeManifest
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
@@ -11,6 +18,7 @@ from conans.server.service.authorize import BasicAuthorizer
 from conans.server.service.v2.search import SearchService
 from conans.server.service.v2.service_v2 import ConanServiceV2
 from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.server_index import ServerIndexDB
 from conans.server.store.server_store import ServerStore
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.test_files import temp_folder
@@ -85,6 +93,9 @@ class ConanServiceTest(unittest.TestCase):
         self.server_store.update_last_package_revision(pref3)
 
         save_files(self.server_store.export(ref4), {"dummy.txt": "//"})
+        # The search is served from the index of the uploaded revisions
+        for ref in (ref2, ref3, ref4):
+            self.server_store.update_last_revision(ref)
 
         info = self.search_service.search()
         expected = [RecipeReference(r.name, r.version, r.user, r.channel, revision=None)
@@ -127,3 +138,112 @@ class ConanServiceTest(unittest.TestCase):
         self.assertRaises(NotFoundException,
                           self.service.remove_recipe,
                           RecipeReference("Fake", "1.0", "lasote", "stable"), "lasote")
+
+    def test_rebuild_index(self):
+        """ the index of an existing storage is computed from its files the first time, and the
+        removals are applied to it
+        """
+        pref2 = PkgReference(self.ref, "2222222", "5678")
+        for pref, content in ((self.pref, "[options]\n    shared=True"),
+                              (pref2, "[options]\n    shared=False")):
+            save_files(self.server_store.package(pref), {CONANINFO: content, CONAN_MANIFEST: ""})
+            self.server_store.update_last_package_revision(pref)
+        os.remove(os.path.join(self.tmp_dir, ".index.sqlite3"))
+
+        server_store = ServerStore(ServerDiskAdapter(self.fake_url, self.tmp_dir))
+        search_service = SearchService(BasicAuthorizer([("*/*@*/*", "*")], []), server_store,
+                                       "lasote")
+        self.assertEqual(search_service.search(), [RecipeReference.loads("openssl/2.0.3@lasote/"
+                                                                         "testing")])
+        self.assertEqual(server_store.get_last_revision(self.ref).revision, DEFAULT_REVISION)
+        self.assertEqual(server_store.get_last_package_revision(PkgReference(self.ref, "2222222")),
+                         pref2)
+        info = search_service.search_packages(self.ref)
+        self.assertEqual(info, {"123123123": {"content": "[options]\n    shared=True"},
+                                "2222222": {"content": "[options]\n    shared=False"}})
+        self.assertEqual(server_store.rebuild_index(), (1, 2))
+
+        server_store.remove_package(pref2)
+        self.assertEqual(list(search_service.search_packages(self.ref)), ["123123123"])
+        server_store.remove_recipe(self.ref)
+        self.assertEqual(search_service.search(), [])
+
+    def test_migrate_revisions_files(self):
+        """ the times of the revisions.txt files of the previous storage layout are kept """
+        ref_norev = RecipeReference(self.ref.name, self.ref.version, self.ref.user,
+                                    self.ref.channel)
+        save(os.path.join(self.server_store.conan_revisions_root(ref_norev), "revisions.txt"),
+             json.dumps({"revisions": [{"revision": DEFAULT_REVISION, "time": 1234.5}]}))
+        os.remove(os.path.join(self.tmp_dir, ".index.sqlite3"))
+        server_store = ServerStore(ServerDiskAdapter(self.fake_url, self.tmp_dir))
+        self.assertEqual(server_store.get_last_revision(self.ref).time, 1234.5)
+
+    def test_reupload_older_revision(self):
+        """ uploading again an existing revision keeps its time, so an older one doesn't become
+        the latest, the latest is read directly from the index
+        """
+        now = ServerIndexDB.now() + 100
+        ref2 = copy.copy(self.ref)
+        ref2.revision = "5678"
+        initial_time = self.server_store.get_revision_time(self.ref)
+        with mock.patch.object(ServerIndexDB, "now", return_value=now + 10):
+            self.server_store.update_last_revision(ref2)
+        self.assertEqual(self.server_store.get_last_revision(self.ref).revision, "5678")
+        with mock.patch.object(ServerIndexDB, "now", return_value=now + 20):
+            self.server_store.update_last_revision(self.ref)
+        self.assertEqual(self.server_store.get_last_revision(self.ref).revision, "5678")
+        self.assertEqual(self.server_store.get_revision_time(self.ref), initial_time)
+        self.assertEqual(self.server_store.get_revision_time(ref2), now + 10)
+
+        pref2 = PkgReference(self.ref, self.pref.package_id, "prev2")
+        with mock.patch.object(ServerIndexDB, "now", return_value=now + 30):
+            self.server_store.update_last_package_revision(self.pref)
+        with mock.patch.object(ServerIndexDB, "now", return_value=now + 40):
+            self.server_store.update_last_package_revision(pref2)
+        with mock.patch.object(ServerIndexDB, "now", return_value=now + 50):
+            self.server_store.update_last_package_revision(self.pref)
+        last = self.server_store.get_last_package_revision(pref2)
+        self.assertEqual((last.revision, last.timestamp), ("prev2", now + 40))
+        self.assertEqual(self.server_store.get_package_revision_time(self.pref), now + 30)
+
+    def test_concurrent_package_revisions(self):
+        prefs = [PkgReference(self.ref, f"pkg{i}", f"prev{i}") for i in range(16)]
+
+        def _upload(pref):
+            save_files(self.server_store.package(pref), {CONANINFO: pref.package_id})
+            self.server_store.update_last_package_revision(pref)
+
+        threads = [threading.Thread(target=_upload, args=(pref,)) for pref in prefs]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        infos = self.search_service.search_packages(self.ref)
+        self.assertEqual(sorted(infos), sorted(p.package_id for p in prefs))
+
+    def test_upload_chunk_bigger_than_range(self):
+        path = os.path.join(self.server_store.export(self.ref), "conan_sources.tgz")
+        with self.assertRaises(HTTPResponse):  # 308, incomplete
+            self.service._upload_chunk(io.BytesIO(b"0123"), {}, path, "bytes 0-3/10")
+        with self.assertRaisesRegex(RequestErrorException, "bigger than its Content-Range"):
+            self.service._upload_chunk(io.BytesIO(b"45678"), {}, path, "bytes 4-7/10")
+        # The rejected chunk is not kept, the client continues from the received ones
+        with self.assertRaises(HTTPResponse) as exc:
+            self.service._upload_chunk(io.BytesIO(), {}, path, "bytes */10")
+        self.assertEqual(exc.exception.get_header("Range"), "bytes=0-3")
+        self.service._upload_chunk(io.BytesIO(b"456789"), {}, path, "bytes 4-9/10")
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"0123456789")
+
+    def test_remove_stale_uploads(self):
+        path = os.path.join(self.server_store.export(self.ref), "conan_sources.tgz")
+        with self.assertRaises(HTTPResponse):
+            self.service._upload_chunk(io.BytesIO(b"0123"), {}, path, "bytes 0-3/10")
+        partial_path = self.server_store.get_partial_upload_path(path)
+        abandoned_path = self.server_store.get_partial_upload_path(path + ".old")
+        save(abandoned_path, "abandoned")
+        old = time.time() - 2 * 24 * 3600
+        os.utime(abandoned_path, (old, old))
+        self.server_store.remove_stale_uploads()
+        self.assertFalse(os.path.exists(abandoned_path))
+        self.assertTrue(os.path.exists(partial_path))
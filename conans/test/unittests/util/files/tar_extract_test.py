@@ -1,5 +1,6 @@
 # coding=utf-8
 
+import io
 import os
 import platform
 import tarfile
@@ -7,8 +8,10 @@ import unittest
 
 import pytest
 
+from conans.errors import ConanException
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import tar_extract, gzopen_without_timestamps, save, gather_files, chdir
+from conans.util.files import tar_extract, gzopen_without_timestamps, save, gather_files, chdir, \
+    zstdopen_without_timestamps, load
 
 
 class TarExtractTest(unittest.TestCase):
@@ -61,3 +64,108 @@ class TarExtractTest(unittest.TestCase):
             with open(self.tgz_file, 'rb') as file_handler:
                 tar_extract(file_handler, destination_dir)
             check_files(destination_dir)
+
+
+def test_zstd_extract_reproducible():
+    pytest.importorskip("zstandard")
+    tmp_folder = temp_folder()
+    ori_files_dir = os.path.join(tmp_folder, "ori")
+    save(os.path.join(ori_files_dir, "file1"), "content1")
+    save(os.path.join(ori_files_dir, "folder", "file2"), "content2" * 1000)
+    files, _ = gather_files(ori_files_dir)
+
+    def compress(tzst_file):
+        with open(tzst_file, "wb") as tzst_handle:
+            with zstdopen_without_timestamps("name", fileobj=tzst_handle) as tzst:
+                for filename, abs_path in sorted(files.items()):
+                    tzst.add(abs_path, filename, recursive=False)
+        with open(tzst_file, "rb") as f:
+            return f.read()
+
+    first = compress(os.path.join(tmp_folder, "file1.tzst"))
+    assert first == compress(os.path.join(tmp_folder, "file2.tzst"))
+
+    destination_dir = os.path.join(tmp_folder, "dest")
+    with open(os.path.join(tmp_folder, "file1.tzst"), "rb") as file_handler:
+        tar_extract(file_handler, destination_dir)  # The format is auto-detected
+    assert load(os.path.join(destination_dir, "file1")) == "content1"
+    assert load(os.path.join(destination_dir, "folder", "file2")) == "content2" * 1000
+
+
+def _tree(folder):
+    result = {}
+    for root, dirs, files in os.walk(folder):
+        for name in dirs + files:
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, folder)
+            if os.path.islink(path):
+                result[rel] = "link->" + os.readlink(path)
+            elif os.path.isfile(path):
+                result[rel] = (load(path), os.stat(path).st_mode, int(os.stat(path).st_mtime))
+            else:
+                result[rel] = (os.stat(path).st_mode, int(os.stat(path).st_mtime))
+    return result
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Requires Linux or Mac")
+@pytest.mark.parametrize("seekable", [True, False])
+def test_tar_extract_parallel(seekable):
+    tmp_folder = temp_folder()
+    ori_files_dir = os.path.join(tmp_folder, "ori")
+    for i in range(30):
+        save(os.path.join(ori_files_dir, "include", f"sub{i % 3}", f"header{i}.h"), f"header{i}")
+    save(os.path.join(ori_files_dir, "lib", "libbig.a"), "big" * 1024 * 1024)
+    save(os.path.join(ori_files_dir, "bin", "exe"), "exe")
+    os.chmod(os.path.join(ori_files_dir, "bin", "exe"), 0o755)
+    os.symlink("libbig.a", os.path.join(ori_files_dir, "lib", "liblink.a"))
+    os.symlink("include", os.path.join(ori_files_dir, "include_link"))
+
+    tgz_file = os.path.join(tmp_folder, "file.tgz")
+    with open(tgz_file, "wb") as tgz_handle:
+        tgz = gzopen_without_timestamps("name", mode="w", fileobj=tgz_handle)
+        tgz.add(ori_files_dir, ".")
+        tgz.close()
+
+    def extract(parallel):
+        destination_dir = os.path.join(tmp_folder, f"dest{parallel}")
+        with open(tgz_file, "rb") as file_handler:
+            if not seekable:
+                file_handler = io.BufferedReader(_NonSeekable(file_handler))
+            tar_extract(file_handler, destination_dir, parallel=parallel)
+        return _tree(destination_dir)
+
+    serial = extract(1)
+    assert serial == extract(4)
+    assert serial == _tree(ori_files_dir)
+
+
+class _NonSeekable(io.RawIOBase):
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._fileobj.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+@pytest.mark.parametrize("parallel", [1, 4])
+@pytest.mark.parametrize("name", ["../outside.txt", "/tmp/outside.txt", "folder/../../outside.txt"])
+def test_tar_extract_outside_destination(parallel, name):
+    tmp_folder = temp_folder()
+    tgz_file = os.path.join(tmp_folder, "file.tgz")
+    with open(tgz_file, "wb") as tgz_handle:
+        tgz = gzopen_without_timestamps("name", mode="w", fileobj=tgz_handle)
+        info = tarfile.TarInfo(name=name)
+        info.size = 4
+        tgz.addfile(tarinfo=info, fileobj=io.BytesIO(b"data"))
+        tgz.close()
+
+    destination_dir = os.path.join(tmp_folder, "dest")
+    with open(tgz_file, "rb") as file_handler:
+        with pytest.raises(ConanException, match="Refusing to extract"):
+            tar_extract(file_handler, destination_dir, parallel=parallel)
+    assert not os.path.exists(os.path.join(tmp_folder, "outside.txt"))
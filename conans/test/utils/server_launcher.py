@@ -66,7 +66,7 @@ class TestServerLauncher(object):
         for plugin in plugins:
             self.ra.api_v2.install(plugin)
 
-    def start(self, daemon=True):
+    def start(self, daemon=True, threads=1):
         """from multiprocessing import Process
         self.p1 = Process(target=ra.run, kwargs={"host": "0.0.0.0"})
         self.p1.start()
@@ -87,7 +87,8 @@ class TestServerLauncher(object):
             def stopped(self):
                 return self._stop.isSet()
 
-        self.t1 = StoppableThread(target=self.ra.run, kwargs={"host": "0.0.0.0", "quiet": True})
+        self.t1 = StoppableThread(target=self.ra.run, kwargs={"host": "0.0.0.0", "quiet": True,
+                                                                   "threads": threads})
         self.t1.daemon = daemon
         self.t1.start()
         time.sleep(1)
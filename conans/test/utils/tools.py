@@ -221,7 +221,8 @@ class TestRequester:
             kwargs.pop("cert", None)
             kwargs.pop("timeout", None)
             if "data" in kwargs:
-                total_data = kwargs["data"].read()
+                data = kwargs["data"]
+                total_data = data.read() if hasattr(data, "read") else data
                 kwargs["params"] = total_data
                 del kwargs["data"]  # Parameter in test app is called "params"
             if kwargs.get("json"):
@@ -9,6 +9,7 @@ import sys
 import tarfile
 import time
 
+from collections import deque
 from contextlib import contextmanager
 
 
@@ -281,13 +282,123 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
     return t
 
 
-def tar_extract(fileobj, destination_dir):
-    the_tar = tarfile.open(fileobj=fileobj)
-    # NOTE: The errorlevel=2 has been removed because it was failing in Win10, it didn't allow to
-    # "could not change modification time", with time=0
-    # the_tar.errorlevel = 2  # raise exception if any error
-    the_tar.extractall(path=destination_dir)
-    the_tar.close()
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ConanException("The 'zstandard' Python package is required for zstd compressed "
+                             "artifacts, install it with 'pip install zstandard'")
+    return zstandard
+
+
+@contextmanager
+def zstdopen_without_timestamps(name, fileobj, compresslevel=None):
+    """ The zstd frames do not contain timestamps, and the multi-threaded compression produces
+    the same output irrespective of the number of threads, so archives are reproducible
+    """
+    zstandard = _import_zstandard()
+    compresslevel = compresslevel if compresslevel is not None else 3  # default zstd = 3
+    compressor = zstandard.ZstdCompressor(level=compresslevel, threads=-1)
+    with compressor.stream_writer(fileobj, closefd=False) as zstd_stream:
+        # Format is forced, same as gzopen_without_timestamps(), for reproducible checksums
+        with tarfile.open(name, "w|", fileobj=zstd_stream, format=tarfile.PAX_FORMAT) as t:
+            yield t
+
+
+def tar_extract(fileobj, destination_dir, parallel=1):
+    """ fileobj can be a non-seekable stream, like a download, if it implements peek()
+    With parallel > 1, the archive is still decompressed sequentially, but the files are written
+    by a pool of threads
+    """
+    seekable = fileobj.seekable()
+    if seekable:
+        magic = fileobj.read(len(_ZSTD_MAGIC))
+        fileobj.seek(0)
+    else:
+        magic = fileobj.peek(len(_ZSTD_MAGIC))[:len(_ZSTD_MAGIC)]
+    if magic == _ZSTD_MAGIC:
+        zstandard = _import_zstandard()
+        with zstandard.ZstdDecompressor().stream_reader(fileobj, closefd=False) as zstd_stream:
+            with tarfile.open(fileobj=zstd_stream, mode="r|") as the_tar:
+                _tar_extract_all(the_tar, destination_dir, parallel)
+        return
+    with tarfile.open(fileobj=fileobj, mode="r" if seekable else "r|*") as the_tar:
+        # NOTE: The errorlevel=2 has been removed because it was failing in Win10, it didn't
+        # allow to "could not change modification time", with time=0
+        # the_tar.errorlevel = 2  # raise exception if any error
+        _tar_extract_all(the_tar, destination_dir, parallel)
+
+
+def _tar_safe_members(the_tar, destination_dir):
+    destination_dir = os.path.abspath(destination_dir)
+    for member in the_tar:
+        path = os.path.abspath(os.path.join(destination_dir, member.name))
+        if path != destination_dir and not path.startswith(os.path.join(destination_dir, "")):
+            raise ConanException(f"Refusing to extract '{member.name}' outside of "
+                                 f"'{destination_dir}'")
+        yield member
+
+
+# Bigger files are written directly while decompressing, not to keep them in memory
+_TAR_PARALLEL_MAX_FILE_SIZE = 1024 * 1024
+
+
+def _tar_extract_all(the_tar, destination_dir, parallel):
+    if parallel <= 1:
+        the_tar.extractall(path=destination_dir, members=_tar_safe_members(the_tar,
+                                                                           destination_dir))
+        return
+
+    from multiprocessing.pool import ThreadPool
+
+    def _write_file(member, data, path):
+        with open(path, "wb") as f:
+            f.write(data)
+        the_tar.chown(member, path, numeric_owner=False)
+        the_tar.chmod(member, path)
+        the_tar.utime(member, path)
+
+    directories = []
+    links = []
+    folders = set()  # Folders are always created by this thread, never concurrently
+    pending = deque()
+    thread_pool = ThreadPool(parallel)
+    try:
+        for member in _tar_safe_members(the_tar, destination_dir):
+            if member.isfile() and member.size <= _TAR_PARALLEL_MAX_FILE_SIZE:
+                path = os.path.join(destination_dir, member.name)
+                folder = os.path.dirname(path)
+                if folder not in folders:
+                    os.makedirs(folder, exist_ok=True)
+                    folders.add(folder)
+                data = the_tar.extractfile(member).read()
+                pending.append(thread_pool.apply_async(_write_file, (member, data, path)))
+                if len(pending) > 8 * parallel:  # Limit the decompressed data kept in memory
+                    pending.popleft().get()
+            elif member.issym() or member.islnk():
+                links.append(member)  # Created at the end, when their targets exist
+            else:
+                if member.isdir():
+                    directories.append(member)
+                the_tar.extract(member, destination_dir, set_attrs=not member.isdir())
+        for result in pending:
+            result.get()
+    finally:
+        thread_pool.close()
+        thread_pool.join()
+
+    for member in links:
+        the_tar.extract(member, destination_dir)
+    # Same as extractall(), the attributes of the directories are set at the end, deepest first
+    directories.sort(key=lambda d: d.name, reverse=True)
+    for member in directories:
+        path = os.path.join(destination_dir, member.name)
+        the_tar.chown(member, path, numeric_owner=False)
+        the_tar.utime(member, path)
+        the_tar.chmod(member, path)
 
 
 def exception_message_safe(exc):
@@ -2,6 +2,7 @@ import os
 import subprocess
 import sys
 import tempfile
+import threading
 from contextlib import contextmanager
 from io import StringIO
 
@@ -32,6 +33,48 @@ else:
         yield
 
 
+class ParallelBuildLock:
+    """ The packages built concurrently in threads share the process current directory, so the
+    Python code of their recipes is serialized by this lock. It is only released while waiting
+    for the commands they run with conan_run(), which are launched in the right directory and
+    are the ones taking most of the build time
+    """
+    _current = threading.local()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def hold(self):
+        with self._lock:
+            ParallelBuildLock._current.lock = self
+            old_path = os.getcwd()
+            try:
+                yield
+            finally:
+                os.chdir(old_path)
+                ParallelBuildLock._current.lock = None
+
+    @staticmethod
+    def active():
+        return getattr(ParallelBuildLock._current, "lock", None) is not None
+
+    @staticmethod
+    @contextmanager
+    def released():
+        lock = getattr(ParallelBuildLock._current, "lock", None)
+        if lock is None:
+            yield
+            return
+        cwd = os.getcwd()
+        lock._lock.release()
+        try:
+            yield
+        finally:
+            lock._lock.acquire()
+            os.chdir(cwd)  # Other builds might have changed it meanwhile
+
+
 def conan_run(command, stdout=None, stderr=None, cwd=None, shell=True):
     """
     @param shell:
@@ -52,7 +95,8 @@ def conan_run(command, stdout=None, stderr=None, cwd=None, shell=True):
         except Exception as e:
             raise ConanException("Error while running cmd\nError: %s" % (str(e)))
 
-        proc_stdout, proc_stderr = proc.communicate()
+        with ParallelBuildLock.released():
+            proc_stdout, proc_stderr = proc.communicate()
         # If the output is piped, like user provided a StringIO or testing, the communicate
         # will capture and return something when thing finished
         if proc_stdout: